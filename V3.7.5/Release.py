@@ -9,6 +9,7 @@ import re
 import time
 import random
 import ast
+from functools import lru_cache
 from datetime import datetime
 
 APP_NAME = "DLDSPT"
@@ -68,6 +69,72 @@ def log_run(mod_name, error=None):
             f.write(f"ERROR:\n{error}\n")
         f.write("\n")
 
+# ----------------- QuackLang expression compiler -----------------
+# Expressions are parsed and turned into a tree of small closures once per
+# distinct expression string, instead of running ast.parse and a NodeVisitor
+# on every evaluation (every iteration, inside loops). Each closure takes the
+# interpreter so it reads the current variables when it runs.
+EXPRESSION_CACHE_SIZE = 1024
+
+def compile_node(node):
+    """Turn one expression node into a function of the interpreter, with the
+    same results, error prints and exceptions as walking the tree each time."""
+    if isinstance(node, ast.BinOp):
+        left = compile_node(node.left)
+        right = compile_node(node.right)
+        op = node.op
+        if isinstance(op, ast.Add):
+            def evaluate(outer):
+                l = left(outer)
+                r = right(outer)
+                if isinstance(l, (int, float)) and isinstance(r, (int, float)):
+                    return l + r
+                return str(l) + str(r)
+        elif isinstance(op, ast.Sub):
+            def evaluate(outer):
+                return left(outer) - right(outer)
+        elif isinstance(op, ast.Mult):
+            def evaluate(outer):
+                return left(outer) * right(outer)
+        elif isinstance(op, ast.Div):
+            def evaluate(outer):
+                return left(outer) / right(outer)
+        else:
+            message = f"Unsupported operator {op}"
+            def evaluate(outer):
+                left(outer)
+                right(outer)
+                raise ValueError(message)
+        return evaluate
+    if isinstance(node, ast.Constant):
+        value = node.value
+        return lambda outer: value
+    if isinstance(node, ast.Name):
+        name = node.id
+        def evaluate(outer):
+            if name in outer.vars:
+                return outer.vars[name]
+            print(f"Error: Variable '{name}' not found")
+            return ""
+        return evaluate
+    if isinstance(node, ast.UnaryOp):
+        operand = compile_node(node.operand)
+        if isinstance(node.op, ast.USub):
+            return lambda outer: -operand(outer)
+        return operand
+    message = f"Unsupported expression: {ast.dump(node)}"
+    def evaluate(outer):
+        raise ValueError(message)
+    return evaluate
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_expression(expr):
+    """Compiled form of an expression string, or None if it isn't valid syntax."""
+    try:
+        return compile_node(ast.parse(expr, mode='eval').body)
+    except Exception:
+        return None
+
 class QuackLang:
     """
     QuackLang: A simple, beginner-friendly scripting language.
@@ -370,53 +437,12 @@ help or ?         # show this help
         return val
 
     def eval_expression(self, expr):
-        class EvalExpr(ast.NodeVisitor):
-            def __init__(self, outer):
-                self.outer = outer
-
-            def visit_BinOp(self, node):
-                left = self.visit(node.left)
-                right = self.visit(node.right)
-                if isinstance(node.op, ast.Add):
-                    if isinstance(left, (int, float)) and isinstance(right, (int, float)):
-                        return left + right
-                    return str(left) + str(right)
-                elif isinstance(node.op, ast.Sub):
-                    return left - right
-                elif isinstance(node.op, ast.Mult):
-                    return left * right
-                elif isinstance(node.op, ast.Div):
-                    return left / right
-                else:
-                    raise ValueError(f"Unsupported operator {node.op}")
-
-            def visit_Num(self, node):
-                return node.n
-
-            def visit_Str(self, node):
-                return node.s
-
-            def visit_Constant(self, node):
-                return node.value
-
-            def visit_Name(self, node):
-                if node.id in self.outer.vars:
-                    return self.outer.vars[node.id]
-                else:
-                    print(f"Error: Variable '{node.id}' not found")
-                    return ""
-            def visit_UnaryOp(self, node):
-                operand = self.visit(node.operand)
-                if isinstance(node.op, ast.USub):
-                    return -operand
-                return operand
-
-            def generic_visit(self, node):
-                raise ValueError(f"Unsupported expression: {ast.dump(node)}")
-
+        evaluate = compile_expression(expr)
         try:
-            tree = ast.parse(expr, mode='eval')
-            return EvalExpr(self).visit(tree.body)
+            if evaluate is None:
+                # Not an expression (e.g. bare text): treat it as a plain value
+                return self.get_value(expr)
+            return evaluate(self)
         except Exception as e:
             try:
                 return self.get_value(expr)
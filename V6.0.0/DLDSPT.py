@@ -1,31 +1,80 @@
 # DLDSPT V6
+import time
+STARTUP_BEGIN = time.perf_counter()
 import os
 import sys
-import runpy
+import importlib
+import importlib.util
 import traceback
-import webbrowser
-import time
 import json
-import requests
 import subprocess
+import re
 from datetime import datetime
 import threading
+import queue
 import hashlib
+import stat
+import fnmatch
+import atexit
+import gc
+import io
+import sqlite3
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+try:
+    import resource  # POSIX only; without it runs are logged without CPU/memory stats
+except ImportError:
+    resource = None
 
 # --- Ensure Resources folder is in sys.path ---
 resources_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Resources")
 if resources_path not in sys.path:
     sys.path.insert(0, resources_path)
 
+# ----------------- Lazy imports -----------------
+# Heavy/optional modules are only imported the first time they're actually used,
+# so e.g. running a mod from the CLI never pays for Qt, requests or networking.
+class LazyModule:
+    """Stands in for a module and imports it on first attribute access."""
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+def has_module(name):
+    """Check whether a module can be imported, without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+runpy = LazyModule("runpy")
+webbrowser = LazyModule("webbrowser")
+requests = LazyModule("requests")
+networking = LazyModule("networking")
+
+# Startup budget: time from process start to the menu (or run_script in CLI mode)
+STARTUP_BUDGET = 0.25  # seconds
+
+def report_startup_time(stage):
+    # Set DLDSPT_STARTUP_DEBUG=1 to see how long startup took
+    elapsed = time.perf_counter() - STARTUP_BEGIN
+    if os.environ.get("DLDSPT_STARTUP_DEBUG"):
+        status = "OK" if elapsed <= STARTUP_BUDGET else "OVER BUDGET"
+        print(f"[startup] reached {stage} in {elapsed * 1000:.1f}ms (budget {STARTUP_BUDGET * 1000:.0f}ms, {status})")
+    return elapsed
+
 # ----------------- Networking -----------------
-try:
-    import networking # pyright: ignore[reportMissingImports]
-    HAVE_NETWORKING = True
-except ImportError:
-    HAVE_NETWORKING = False
+HAVE_NETWORKING = has_module("networking")
 
 MOD_LOGS_DIR = "mod_logs"
 MOD_LAST_RUN_FILE = "mod_last_run.json"
+MOD_STATS_FILE = "mod_stats.json"
+MOD_LOG_MAX_SIZE = 1024 * 1024
 
 def ensure_mod_logs_dir():
     if not os.path.isdir(MOD_LOGS_DIR):
@@ -136,21 +185,11 @@ def networking_menu():
             print("Invalid option.")
             input("Press Enter to continue...")
 
-# GUI imports used only when opening guest HTML/JS
-try:
-    from PyQt6.QtWidgets import QApplication, QMainWindow
-    from PyQt6.QtWebEngineWidgets import QWebEngineView
-    from PyQt6.QtCore import QUrl
-    HAVE_QT = True
-except Exception:
-    HAVE_QT = False
-
-# Try to import requests (used for version check)
-try:
-    import requests
-    HAVE_REQUESTS = True
-except Exception:
-    HAVE_REQUESTS = False
+# GUI modules used only when opening guest HTML/JS (imported on demand)
+HAVE_QT = has_module("PyQt6") and has_module("PyQt6.QtWebEngineWidgets")
+
+# requests is used for the version check and server list
+HAVE_REQUESTS = has_module("requests")
 
 # --- App metadata (place near top to avoid ordering issues) ---
 DLDSPT_VERSION = "6 Series"
@@ -159,30 +198,33 @@ APP_FULL_NAME = "Dat Littla Ducky's Python Tooling"
 DISCORD_LINK = "https://discord.gg/JhwNVrb7Kf"
 APP_GITHUB = "https://github.com/DatLittlaDucky/DLDSPT/"
 CONFIG_FILE = "config.json"
-LOG_FILE = "dldsptrun.log"
 RECENT_MODS_FILE = "recent_mods.json"
+MOD_COMMENTS_FILE = "mod_comments.json"
+MOD_TAGS_FILE = "mod_tags.json"
+STATE_DB_FILE = "dldspt_state.db"
+# Written after the first-run checks when the state database can't be opened
+FIRST_RUN_MARKER_FILE = "dldspt_first_run"
+MOD_INDEX_FILE = "mod_index.json"
+VERSION_CACHE_FILE = "version_cache.json"
 
 # --- Rich optional UI ---
+# Loaded by load_rich() when the menu starts; CLI runs don't need it.
 USE_RICH = False
-try:
-    from rich.console import Console
-    from rich.table import Table
-    from rich.panel import Panel
-    from rich.text import Text
-    console = Console()
-    USE_RICH = True
-except Exception:
-    # Try to install rich if missing (best-effort; silent fallback)
+console = None
+
+def load_rich():
+    global USE_RICH, console
+    if console is not None:
+        return USE_RICH
+    # No synchronous pip install here: start_dependency_check() installs a missing
+    # Rich in the background and the plain text menu is used until then.
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "rich"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         from rich.console import Console
-        from rich.table import Table
-        from rich.panel import Panel
-        from rich.text import Text
         console = Console()
         USE_RICH = True
     except Exception:
         USE_RICH = False
+    return USE_RICH
 
 last_ran_mod = None
 last_ran_path = None
@@ -197,6 +239,11 @@ SUPPORTED_EXTENSIONS = [
 RUNNABLE_EXTENSIONS = {".py", ".dkl", ".html", ".js"}
 # View-only (open with system)
 VIEW_ONLY_EXTENSIONS = set(SUPPORTED_EXTENSIONS) - RUNNABLE_EXTENSIONS
+SUPPORTED_EXTENSIONS_TUPLE = tuple(SUPPORTED_EXTENSIONS)
+
+# Recursive (category folder) scanning defaults; enabled with config["recursive_scan"]
+DEFAULT_SCAN_DEPTH = 3
+DEFAULT_SCAN_IGNORE = ["__pycache__", ".*"]
 
 # --- Theme definitions for Rich UI ---
 THEMES = {
@@ -258,9 +305,8 @@ def find_mods_folder():
     return mods_path if os.path.isdir(mods_path) else None
 
 def safe_open(filepath, mode="r", encoding=None):
-    # Only allow access to files in Mods folder or config/log files
-    allowed = os.path.abspath(filepath).startswith(os.path.abspath(find_mods_folder() or "")) \
-        or os.path.basename(filepath) in [LOG_FILE, CONFIG_FILE]
+    # Only allow access to files in the Mods folder
+    allowed = os.path.abspath(filepath).startswith(os.path.abspath(find_mods_folder() or ""))
     if not allowed:
         resp = input(f"Warning: Attempt to access '{filepath}'. Allow? (y/n): ").strip().lower()
         if resp != "y":
@@ -286,11 +332,9 @@ def clear_console():
 def get_total_mods_size(py_files):
     total = 0
     for f in py_files:
-        real_path = f if os.path.isfile(f) else os.path.join(f, "__main__.py")
-        try:
-            total += os.path.getsize(real_path)
-        except Exception:
-            pass
+        rec = get_mod_record(f)
+        if rec is not None and rec.size:
+            total += rec.size
     return total // 1024  # KB
 
 def spinner(msg, stop_event):
@@ -302,14 +346,254 @@ def spinner(msg, stop_event):
         time.sleep(0.1)
     sys.stdout.write('\r' + ' ' * (len(msg) + 2) + '\r')
 
+# ----------------- State store -----------------
+# Launcher state (config, recent mods, last-run times, comments, tags and run
+# stats) lives in one SQLite database, so a change is a single row write and
+# several launchers (or job processes) can share it. WAL mode lets readers
+# carry on while another process writes. The old JSON files are imported once
+# and then renamed to *.migrated.
+STATE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS config (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS recent_mods (path TEXT PRIMARY KEY, used REAL NOT NULL);
+CREATE TABLE IF NOT EXISTS mod_last_run (path TEXT PRIMARY KEY, time TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS mod_comments (id INTEGER PRIMARY KEY, path TEXT NOT NULL, comment TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS mod_tags (id INTEGER PRIMARY KEY, path TEXT NOT NULL, tag TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS mod_stats (path TEXT PRIMARY KEY, data TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS run_segments (segment INTEGER PRIMARY KEY);
+CREATE TABLE IF NOT EXISTS run_index (id INTEGER PRIMARY KEY, path TEXT NOT NULL, ts REAL NOT NULL, duration REAL,
+                                      failed INTEGER NOT NULL, segment INTEGER NOT NULL, pos INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS run_totals (path TEXT PRIMARY KEY, runs INTEGER NOT NULL, errors INTEGER NOT NULL, total REAL NOT NULL);
+CREATE INDEX IF NOT EXISTS run_index_path_ts ON run_index (path, ts);
+CREATE INDEX IF NOT EXISTS run_index_duration ON run_index (duration);
+CREATE INDEX IF NOT EXISTS run_index_segment ON run_index (segment);
+CREATE INDEX IF NOT EXISTS mod_comments_path ON mod_comments (path);
+CREATE INDEX IF NOT EXISTS mod_tags_path ON mod_tags (path);
+"""
+RECENT_MODS_MAX = 10
+# Config lists used as sets: concurrent launchers' additions and removals are merged
+CONFIG_MERGED_LISTS = ("favourites", "pinned", "scan_ignore")
+
+class StateStore:
+    """
+    SQLite-backed launcher state.
+    Usage:
+        state = StateStore(STATE_DB_FILE)
+        state.save_config({"theme": "dark"})
+        state.set_last_run("Mods/example.py", "2025-01-01 12:00:00")
+        state.add_tag("Mods/example.py", "favourite")
+    """
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        # Config as this process last loaded or saved it (key -> JSON), so a save
+        # only writes what changed here and leaves other launchers' changes alone
+        self.config_base = {}
+        # Shared by the menu, job and pool threads; the lock serialises use
+        self.db = sqlite3.connect(path, timeout=10, check_same_thread=False, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(STATE_SCHEMA)
+        self.migrate()
+
+    def write(self, sql, params=()):
+        with self.lock:
+            self.db.execute(sql, params)
+
+    def query(self, sql, params=()):
+        with self.lock:
+            return self.db.execute(sql, params).fetchall()
+
+    def migrate(self):
+        """Import the old JSON sidecar files the first time the database is used."""
+        with self.lock:
+            # IMMEDIATE takes the write lock up front, so two processes starting
+            # together can't both import the files
+            self.db.execute("BEGIN IMMEDIATE")
+            try:
+                if self.db.execute("SELECT 1 FROM meta WHERE key = 'migrated'").fetchone():
+                    self.db.execute("COMMIT")
+                    return
+                imported = []
+                for filename, importer in ((CONFIG_FILE, self.import_config), (RECENT_MODS_FILE, self.import_recent),
+                                           (MOD_LAST_RUN_FILE, self.import_last_run), (MOD_COMMENTS_FILE, self.import_comments),
+                                           (MOD_TAGS_FILE, self.import_tags), (MOD_STATS_FILE, self.import_stats)):
+                    if not os.path.isfile(filename):
+                        continue
+                    try:
+                        with open(filename, "r", encoding="utf-8") as f:
+                            importer(json.load(f))
+                        imported.append(filename)
+                    except Exception:
+                        pass
+                self.db.execute("INSERT INTO meta (key, value) VALUES ('migrated', ?)", (datetime.now().isoformat(),))
+                self.db.execute("COMMIT")
+            except Exception:
+                self.db.execute("ROLLBACK")
+                raise
+        for filename in imported:
+            try:
+                os.replace(filename, filename + ".migrated")
+            except OSError:
+                pass
+
+    def import_config(self, data):
+        self.db.executemany("INSERT OR REPLACE INTO config (key, value) VALUES (?, ?)",
+                            [(k, json.dumps(v)) for k, v in data.items()])
+
+    def import_recent(self, data):
+        # The file is newest first; give older entries older timestamps
+        now = time.time()
+        self.db.executemany("INSERT OR REPLACE INTO recent_mods (path, used) VALUES (?, ?)",
+                            [(p, now - i) for i, p in enumerate(data[:RECENT_MODS_MAX])])
+
+    def import_last_run(self, data):
+        self.db.executemany("INSERT OR REPLACE INTO mod_last_run (path, time) VALUES (?, ?)", list(data.items()))
+
+    def import_comments(self, data):
+        self.db.executemany("INSERT INTO mod_comments (path, comment) VALUES (?, ?)",
+                            [(p, c) for p, comments in data.items() for c in comments])
+
+    def import_tags(self, data):
+        self.db.executemany("INSERT INTO mod_tags (path, tag) VALUES (?, ?)",
+                            [(p, t) for p, tags in data.items() for t in tags])
+
+    def import_stats(self, data):
+        self.db.executemany("INSERT OR REPLACE INTO mod_stats (path, data) VALUES (?, ?)",
+                            [(p, json.dumps(entry)) for p, entry in data.items()])
+
+    def load_config(self):
+        """The saved config, or None if nothing has been saved yet."""
+        rows = self.query("SELECT key, value FROM config")
+        self.config_base.update(rows)
+        return {k: json.loads(v) for k, v in rows} if rows else None
+
+    def save_config(self, cfg):
+        """Store the keys of cfg that changed since this process last loaded or saved
+        them. Lists in CONFIG_MERGED_LISTS get this process's additions and removals
+        applied to what is stored now, and cfg is updated with the merged list."""
+        with self.lock:
+            # IMMEDIATE: a deferred transaction that reads first can't upgrade to a
+            # write once another connection has committed, and fails at once
+            self.db.execute("BEGIN IMMEDIATE")
+            try:
+                stored = {k: v for k, v in self.db.execute("SELECT key, value FROM config")}
+                merged = {}
+                for key, value in cfg.items():
+                    encoded = json.dumps(value)
+                    base = self.config_base.get(key)
+                    if encoded == base:
+                        continue
+                    current = stored.get(key)
+                    if key in CONFIG_MERGED_LISTS and base is not None and current not in (None, base):
+                        # Another launcher changed it too: apply our edits on top of theirs
+                        value = merge_config_list(json.loads(base), value, json.loads(current))
+                        merged[key] = value
+                        encoded = json.dumps(value)
+                    if encoded != current:
+                        self.db.execute("INSERT OR REPLACE INTO config (key, value) VALUES (?, ?)", (key, encoded))
+                for key in self.config_base.keys() - cfg.keys():
+                    # Removed here; leave it if another launcher has changed it since
+                    if stored.get(key) == self.config_base[key]:
+                        self.db.execute("DELETE FROM config WHERE key = ?", (key,))
+                self.db.execute("COMMIT")
+            except Exception:
+                self.db.execute("ROLLBACK")
+                raise
+            for key, value in merged.items():
+                cfg[key] = value
+            self.config_base = {k: json.dumps(v) for k, v in cfg.items()}
+
+    def add_recent(self, mod_path):
+        with self.lock:
+            self.db.execute("BEGIN IMMEDIATE")
+            try:
+                self.db.execute("INSERT OR REPLACE INTO recent_mods (path, used) VALUES (?, ?)", (mod_path, time.time()))
+                self.db.execute("DELETE FROM recent_mods WHERE path NOT IN "
+                                "(SELECT path FROM recent_mods ORDER BY used DESC LIMIT ?)", (RECENT_MODS_MAX,))
+                self.db.execute("COMMIT")
+            except Exception:
+                self.db.execute("ROLLBACK")
+                raise
+
+    def recent_mods(self):
+        return [p for (p,) in self.query("SELECT path FROM recent_mods ORDER BY used DESC")]
+
+    def set_last_run(self, mod_path, when):
+        self.write("INSERT OR REPLACE INTO mod_last_run (path, time) VALUES (?, ?)", (mod_path, when))
+
+    def last_runs(self):
+        return dict(self.query("SELECT path, time FROM mod_last_run"))
+
+    def add_comment(self, mod_path, comment):
+        self.write("INSERT INTO mod_comments (path, comment) VALUES (?, ?)", (mod_path, comment))
+
+    def add_tag(self, mod_path, tag):
+        self.write("INSERT INTO mod_tags (path, tag) VALUES (?, ?)", (mod_path, tag))
+
+    def update_mod_stats(self, mod_path, update):
+        """Apply update(entry or None) -> entry as one transaction, so launchers and
+        job processes recording runs of the same mod don't overwrite each other."""
+        with self.lock:
+            self.db.execute("BEGIN IMMEDIATE")
+            try:
+                row = self.db.execute("SELECT data FROM mod_stats WHERE path = ?", (mod_path,)).fetchone()
+                entry = update(json.loads(row[0]) if row else None)
+                self.db.execute("INSERT OR REPLACE INTO mod_stats (path, data) VALUES (?, ?)", (mod_path, json.dumps(entry)))
+                self.db.execute("COMMIT")
+            except Exception:
+                self.db.execute("ROLLBACK")
+                raise
+
+    def all_mod_stats(self):
+        return {p: json.loads(d) for p, d in self.query("SELECT path, data FROM mod_stats")}
+
+def merge_config_list(base, ours, theirs):
+    """theirs with the items added to and removed from base in ours applied."""
+    if not all(isinstance(v, list) for v in (base, ours, theirs)):
+        return ours
+    removed = [item for item in base if item not in ours]
+    added = [item for item in ours if item not in base]
+    return [item for item in theirs if item not in removed] + [item for item in added if item not in theirs]
+
+def open_state_store():
+    try:
+        return StateStore(STATE_DB_FILE)
+    except Exception as e:
+        # A broken or locked database shouldn't stop the launcher; state just isn't kept.
+        # stderr, because `run` keeps stdout for JSON lines
+        print(f"Could not open {STATE_DB_FILE}: {e}", file=sys.stderr)
+        return None
+
+state = open_state_store()
+
 def load_config():
-    if os.path.isfile(CONFIG_FILE):
+    if state is not None:
         try:
-            with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
+            saved = state.load_config()
+            if saved is not None:
+                return saved
         except Exception:
             pass
-    # First run: run Package_Checker.py
+    # Default config; the menu runs the first-run checks and saves it
+    return {
+        "window_size": [800, 600],
+        "pinned": [],
+        "favourites": [],
+        "theme": "light"
+    }
+
+config = load_config()
+
+def run_first_run_checks():
+    """Run Package_Checker.py the first time the menu starts, then save the config so
+    it doesn't run again. Only the menu calls this: warm workers, jobs and `run`
+    import this file too and must never stop at a prompt."""
+    try:
+        if os.path.exists(FIRST_RUN_MARKER_FILE) or (state is not None and state.query("SELECT 1 FROM config LIMIT 1")):
+            return
+    except Exception:
+        return
     try:
         mods_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Mods")
         pkg_checker = os.path.join(mods_path, "Package_Checker.py")
@@ -318,15 +602,140 @@ def load_config():
             runpy.run_path(pkg_checker, run_name="__main__")
     except Exception as e:
         print(f"Could not run Package_Checker: {e}")
-    # Default config
-    return {
-        "window_size": [800, 600],
-        "pinned": [],
-        "favourites": [],
-        "theme": "light"
-    }
+    save_config(config)
+    if state is None:
+        # Nothing was saved without the state database, so remember the first run here
+        try:
+            with open(FIRST_RUN_MARKER_FILE, "w", encoding="utf-8") as f:
+                f.write(datetime.now().isoformat() + "\n")
+        except OSError:
+            pass
 
-config = load_config()
+# Compact per-mod record filled by a single scandir pass and reused for sorting/display.
+# size/mtime_ns/ino describe the mod file, or __main__.py for directory mods (None if absent).
+ModRecord = namedtuple("ModRecord", "path is_dir size mtime_ns ino")
+mod_records = {}
+# Folders walked by the last scan (Mods itself plus any category folders)
+mod_scan_dirs = set()
+# Non-mod folders the last scan did not descend into
+mod_leaf_dirs = set()
+# Guards the three above: the mods watcher updates them from its own thread
+mod_records_lock = threading.Lock()
+
+def make_mod_record(path, is_dir, file_stat=None):
+    """Return a ModRecord if path is a mod, otherwise None. Costs one stat per entry."""
+    if is_dir:
+        # Directory is considered a mod if it contains __main__.py or manifest.json
+        try:
+            st = os.stat(os.path.join(path, "__main__.py"))
+            if stat.S_ISREG(st.st_mode):
+                return ModRecord(path, True, st.st_size, st.st_mtime_ns, st.st_ino)
+        except OSError:
+            pass
+        if os.path.isfile(os.path.join(path, "manifest.json")):
+            return ModRecord(path, True, None, None, None)
+        return None
+    if not path.lower().endswith(SUPPORTED_EXTENSIONS_TUPLE):
+        return None
+    try:
+        st = file_stat or os.stat(path)
+        return ModRecord(path, False, st.st_size, st.st_mtime_ns, st.st_ino)
+    except OSError:
+        return ModRecord(path, False, None, None, None)
+
+def is_scan_ignored(name, ignore_patterns):
+    return any(fnmatch.fnmatch(name, pattern) for pattern in ignore_patterns)
+
+def scan_mods_dir(path, depth, max_depth, ignore_patterns):
+    """
+    Scan one directory level.
+    Returns (records, category subfolders to descend into, folders left unscanned).
+    """
+    records = {}
+    subdirs = []
+    leaf_dirs = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if ignore_patterns and is_scan_ignored(entry.name, ignore_patterns):
+                continue
+            try:
+                is_dir = entry.is_dir()
+                file_stat = None if is_dir else entry.stat()
+            except OSError:
+                is_dir, file_stat = False, None
+            rec = make_mod_record(entry.path, is_dir, file_stat)
+            if rec is not None:
+                records[entry.path] = rec
+            elif is_dir and depth < max_depth:
+                # Not a mod itself, so treat it as a category folder
+                subdirs.append(entry.path)
+            elif is_dir:
+                # Could still become a mod later (e.g. __main__.py gets added)
+                leaf_dirs.append(entry.path)
+    return records, subdirs, leaf_dirs
+
+def get_scan_settings():
+    """(max_depth, ignore_patterns) from config; depth 0 means top level only."""
+    if not config.get("recursive_scan", False):
+        return 0, []
+    try:
+        max_depth = max(0, int(config.get("scan_depth", DEFAULT_SCAN_DEPTH)))
+    except (TypeError, ValueError):
+        max_depth = DEFAULT_SCAN_DEPTH
+    return max_depth, list(config.get("scan_ignore", DEFAULT_SCAN_IGNORE))
+
+def scan_mods_folder(mods_path):
+    max_depth, ignore_patterns = get_scan_settings()
+    records, pending, leaf_dirs = scan_mods_dir(mods_path, 0, max_depth, ignore_patterns)
+    scan_dirs = {mods_path}
+    if pending:
+        # Category subtrees are scanned concurrently; each finished folder queues its
+        # own subfolders right away, so total time tracks the slowest branch.
+        with ThreadPoolExecutor(max_workers=config.get("scan_workers")) as pool:
+            futures = {pool.submit(scan_mods_dir, sub, 1, max_depth, ignore_patterns): (sub, 1) for sub in pending}
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    sub, depth = futures.pop(fut)
+                    try:
+                        sub_records, subdirs, sub_leaf_dirs = fut.result()
+                    except OSError:
+                        continue
+                    scan_dirs.add(sub)
+                    records.update(sub_records)
+                    leaf_dirs.extend(sub_leaf_dirs)
+                    for child in subdirs:
+                        futures[pool.submit(scan_mods_dir, child, depth + 1, max_depth, ignore_patterns)] = (child, depth + 1)
+    with mod_records_lock:
+        mod_records.clear()
+        mod_records.update(records)
+        mod_scan_dirs.clear()
+        mod_scan_dirs.update(scan_dirs)
+        mod_leaf_dirs.clear()
+        mod_leaf_dirs.update(leaf_dirs)
+    return list(records)
+
+def get_mod_record(path):
+    with mod_records_lock:
+        rec = mod_records.get(path)
+    if rec is None:
+        rec = make_mod_record(path, os.path.isdir(path))
+        if rec is not None:
+            with mod_records_lock:
+                rec = mod_records.setdefault(path, rec)
+    return rec
+
+def sort_mods(files, sort_by="name"):
+    if sort_by == "name":
+        return sorted(files, key=lambda f: os.path.basename(f).lower())
+    elif sort_by == "date":
+        return sorted(files, key=lambda f: (get_mod_record(f) or ModRecord(f, False, 0, 0, 0)).mtime_ns or 0, reverse=True)
+    elif sort_by == "size":
+        return sorted(files, key=lambda f: (get_mod_record(f) or ModRecord(f, False, 0, 0, 0)).size or 0, reverse=True)
+    elif sort_by == "favourites":
+        favourites = set(config.get("favourites", []))
+        return sorted(files, key=lambda f: (f not in favourites, os.path.basename(f).lower()))
+    return files
 
 def list_mods(mods_path, sort_by="name"):
     # Animated spinner while scanning Mods folder
@@ -334,108 +743,502 @@ def list_mods(mods_path, sort_by="name"):
     spinner_thread = threading.Thread(target=spinner, args=("Scanning Mods folder...", stop_event))
     spinner_thread.start()
     try:
-        files = []
-        for entry in os.listdir(mods_path):
-            full_path = os.path.join(mods_path, entry)
-            if os.path.isdir(full_path):
-                # Directory is considered a mod if it contains __main__.py or manifest.json
-                if (
-                    os.path.isfile(os.path.join(full_path, "__main__.py"))
-                    or os.path.isfile(os.path.join(full_path, "manifest.json"))
-                ):
-                    files.append(full_path)
-                else:
-                    continue
-            else:
-                for ext in SUPPORTED_EXTENSIONS:
-                    if entry.lower().endswith(ext):
-                        files.append(full_path)
-                        break
-        # Sorting
-        return sorted(files, key=lambda f: os.path.basename(f).lower()) if sort_by == "name" else \
-            sorted(files, key=lambda f: os.path.getmtime(f) if os.path.exists(f) else 0, reverse=True) if sort_by == "date" else \
-            sorted(files, key=lambda f: os.path.getsize(f) if os.path.exists(f) else 0, reverse=True) if sort_by == "size" else \
-            sorted(files, key=lambda f: (f not in set(config.get("favourites", [])), os.path.basename(f).lower())) if sort_by == "favourites" else files
+        return sort_mods(scan_mods_folder(mods_path), sort_by)
     finally:
         stop_event.set()
         spinner_thread.join()
 
-def format_name(path):
+# ----------------- Mods folder watcher -----------------
+# inotify constants (linux/inotify.h)
+IN_MODIFY = 0x002
+IN_ATTRIB = 0x004
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_DELETE_SELF = 0x400
+IN_MOVE_SELF = 0x800
+IN_Q_OVERFLOW = 0x4000
+IN_IGNORED = 0x8000
+IN_ISDIR = 0x40000000
+INOTIFY_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+                | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+
+def load_inotify():
+    """Return libc if it exposes inotify (Linux), otherwise None."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1
+        libc.inotify_add_watch
+        return libc
+    except Exception:
+        return None
+
+class ModsWatcher:
+    """
+    Keeps the list of mods in the Mods folder up to date in the background.
+    Uses inotify where available and falls back to polling directory mtimes.
+    Category folders from a recursive scan are watched as well.
+    Usage:
+        watcher = ModsWatcher(mods_path)
+        watcher.start()
+        py_files = sort_mods(watcher.snapshot(), sort_by)
+        if watcher.version != seen_version: ...  # mod set changed
+    """
+    def __init__(self, mods_path, poll_interval=1.0):
+        self.mods_path = mods_path
+        self.poll_interval = poll_interval
+        self.mods = set()
+        self.version = 0
+        self.backend = None
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.dir_mtimes = {}
+        self.inotify_fd = None
+        self.watch_dirs = {}
+
+    def start(self, initial=None):
+        # Reuse an existing scan (e.g. from list_mods) instead of walking the folder twice
+        if initial is None:
+            self.rescan()
+        else:
+            with self.lock:
+                self.mods = set(initial)
+                self.dir_mtimes = self.read_dir_mtimes()
+        libc = load_inotify()
+        if libc is not None and self.start_inotify(libc):
+            self.backend = "inotify"
+            target = self.inotify_loop
+        else:
+            self.backend = "poll"
+            target = self.poll_loop
+        self.thread = threading.Thread(target=target, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join(timeout=2)
+        if self.inotify_fd is not None:
+            try:
+                os.close(self.inotify_fd)
+            except OSError:
+                pass
+            self.inotify_fd = None
+
+    def snapshot(self):
+        with self.lock:
+            return list(self.mods)
+
+    def sync(self):
+        """Cheap catch-up check; call before relying on the list right after a known change."""
+        self.check_for_changes()
+        return self.snapshot()
+
+    # --- scanning ---
+    def watched_dirs(self):
+        """Every folder the last scan saw; their mtimes change when entries come and go."""
+        with mod_records_lock:
+            dirs = set(mod_scan_dirs) or {self.mods_path}
+            dirs.update(mod_leaf_dirs)
+            dirs.update(rec.path for rec in mod_records.values() if rec.is_dir)
+        return dirs
+
+    def read_dir_mtimes(self):
+        mtimes = {}
+        for path in self.watched_dirs():
+            try:
+                mtimes[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                mtimes[path] = None
+        return mtimes
+
+    def rescan(self):
+        try:
+            found = set(scan_mods_folder(self.mods_path))
+        except OSError:
+            found = set()
+        mtimes = self.read_dir_mtimes()
+        with self.lock:
+            self.dir_mtimes = mtimes
+            if found != self.mods:
+                self.mods = found
+                self.version += 1
+        if self.inotify_fd is not None:
+            self.sync_watches()
+
+    def refresh_entry(self, full_path, modified=False):
+        _, ignore_patterns = get_scan_settings()
+        if ignore_patterns and is_scan_ignored(os.path.basename(full_path), ignore_patterns):
+            # Same rule as the full scan: ignored names never show up as mods
+            rec = None
+        elif os.path.lexists(full_path):
+            rec = make_mod_record(full_path, os.path.isdir(full_path))
+        else:
+            rec = None
+        is_mod = rec is not None
+        with mod_records_lock:
+            if is_mod:
+                mod_records[full_path] = rec
+            else:
+                mod_records.pop(full_path, None)
+        with self.lock:
+            if is_mod and full_path not in self.mods:
+                self.mods.add(full_path)
+                self.version += 1
+            elif not is_mod and full_path in self.mods:
+                self.mods.discard(full_path)
+                self.version += 1
+            elif is_mod and modified:
+                # Content change: membership is the same but date/size sorting may differ
+                self.version += 1
+
+    def drop_subtree(self, path):
+        """Forget a folder that was deleted or moved away: every mod record under it,
+        the scanned folders it contained, and their inotify watches."""
+        prefix = path + os.sep
+        def inside(p):
+            return p == path or p.startswith(prefix)
+        with mod_records_lock:
+            for p in [p for p in mod_records if inside(p)]:
+                del mod_records[p]
+            mod_scan_dirs.difference_update([d for d in mod_scan_dirs if inside(d)])
+            mod_leaf_dirs.difference_update([d for d in mod_leaf_dirs if inside(d)])
+        for wd in [wd for wd, d in self.watch_dirs.items() if inside(d)]:
+            # A moved folder keeps its watch and would report under the old path
+            if self.inotify_fd is not None:
+                self.libc.inotify_rm_watch(self.inotify_fd, wd)
+            del self.watch_dirs[wd]
+        with self.lock:
+            gone = {m for m in self.mods if inside(m)}
+            if gone:
+                self.mods -= gone
+                self.version += 1
+        self.dir_mtimes = {d: m for d, m in self.dir_mtimes.items() if not inside(d)}
+
+    def check_for_changes(self):
+        # A directory's mtime changes whenever entries are added, removed or renamed in it
+        if self.read_dir_mtimes() != self.dir_mtimes:
+            self.rescan()
+
+    def poll_loop(self):
+        while not self.stop_event.wait(self.poll_interval):
+            self.check_for_changes()
+
+    # --- inotify backend ---
+    def start_inotify(self, libc):
+        fd = libc.inotify_init1(os.O_NONBLOCK | getattr(os, "O_CLOEXEC", 0))
+        if fd < 0:
+            return False
+        self.inotify_fd = fd
+        self.libc = libc
+        if not self.add_watch(self.mods_path):
+            os.close(fd)
+            self.inotify_fd = None
+            return False
+        self.sync_watches()
+        return True
+
+    def add_watch(self, path):
+        wd = self.libc.inotify_add_watch(self.inotify_fd, os.fsencode(path), INOTIFY_MASK)
+        if wd < 0:
+            return False
+        # Re-adding an existing path returns the same wd, so this just refreshes the mapping
+        self.watch_dirs[wd] = path
+        return True
+
+    def sync_watches(self):
+        watched = set(self.watch_dirs.values())
+        for path in self.watched_dirs() - watched:
+            self.add_watch(path)
+
+    def inotify_loop(self):
+        import select
+        import struct
+        header = struct.Struct("iIII")
+        while not self.stop_event.is_set():
+            try:
+                ready, _, _ = select.select([self.inotify_fd], [], [], 0.5)
+                if not ready:
+                    continue
+                data = os.read(self.inotify_fd, 64 * 1024)
+            except (OSError, ValueError, TypeError):
+                break
+            offset = 0
+            failed = False
+            while offset + header.size <= len(data):
+                wd, mask, _cookie, length = header.unpack_from(data, offset)
+                offset += header.size
+                name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+                offset += length
+                try:
+                    self.handle_event(wd, mask, name)
+                except Exception as e:
+                    # One bad event must not end the thread and leave the mod list stale
+                    print(f"Mods watcher: could not handle a change in the Mods folder: {e}", file=sys.stderr)
+                    failed = True
+            if failed:
+                # Start over from a full scan so nothing the failed events touched is missed
+                try:
+                    self.rescan()
+                except Exception:
+                    pass
+
+    def handle_event(self, wd, mask, name):
+        if mask & IN_Q_OVERFLOW:
+            self.rescan()
+            return
+        if mask & IN_IGNORED:
+            self.watch_dirs.pop(wd, None)
+            return
+        if wd not in self.watch_dirs:
+            return
+        parent = self.watch_dirs[wd]
+        with mod_records_lock:
+            scanned = parent in mod_scan_dirs
+        if scanned or parent == self.mods_path:
+            if not name:
+                return
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                # A new folder may be a whole category subtree; rescan to pick it up
+                self.rescan()
+                return
+            if mask & IN_ISDIR and mask & (IN_DELETE | IN_MOVED_FROM):
+                # A folder went away: a directory mod, or a category with mods inside
+                self.drop_subtree(os.path.join(parent, name))
+                return
+            if parent != self.mods_path and name in ("__main__.py", "manifest.json"):
+                # A category folder just turned into (or stopped being) a directory mod
+                self.rescan()
+                return
+            self.refresh_entry(os.path.join(parent, name), modified=bool(mask & (IN_MODIFY | IN_CLOSE_WRITE | IN_ATTRIB)))
+        else:
+            # Something changed inside a directory mod or unscanned folder (e.g. __main__.py added)
+            self.refresh_entry(parent, modified=True)
+
+# Extension -> type label shown next to mod names
+MOD_TYPE_LABELS = {
+    ".py": "Python",
+    ".dkl": "Ducky",
+    ".html": "Webpage",
+    ".js": "JavaScript",
+    ".json": "JSON",
+    ".txt": "Text",
+    ".csv": "CSV",
+    ".yaml": "YAML",
+    ".yml": "YAML",
+    ".ini": "Config",
+    ".xml": "XML",
+    ".toml": "TOML",
+    ".md": "Markdown",
+    ".css": "CSS",
+    ".pdf": "PDF",
+    ".zip": "ZIP",
+    ".mod": "Mod",
+    ".asset": "Asset"
+}
+
+def get_mod_type_label(path):
+    with mod_records_lock:
+        rec = mod_records.get(path)
+    if rec.is_dir if rec is not None else os.path.isdir(path):
+        return "DIR"
+    return MOD_TYPE_LABELS.get(os.path.splitext(path)[1].lower(), "")
+
+def format_name(path, type_label=None):
     name = os.path.basename(path)
-    if os.path.isdir(path):
-        name = os.path.basename(path) + " [DIR]"
-    else:
-        lower = name.lower()
-        if lower.endswith(".py"):
-            name = name[:-3] + " [Python]"
-        elif lower.endswith(".dkl"):
-            name = name[:-4] + " [Ducky]"
-        elif lower.endswith(".html"):
-            name = name[:-5] + " [Webpage]"
-        elif lower.endswith(".js"):
-            name = name[:-3] + " [JavaScript]"
-        elif lower.endswith(".json"):
-            name = name[:-5] + " [JSON]"
-        elif lower.endswith(".txt"):
-            name = name[:-4] + " [Text]"
-        elif lower.endswith(".csv"):
-            name = name[:-4] + " [CSV]"
-        elif lower.endswith((".yaml", ".yml")):
-            name = os.path.splitext(name)[0] + " [YAML]"
-        elif lower.endswith(".ini"):
-            name = name[:-4] + " [Config]"
-        elif lower.endswith(".xml"):
-            name = name[:-4] + " [XML]"
-        elif lower.endswith(".toml"):
-            name = name[:-5] + " [TOML]"
-        elif lower.endswith(".md"):
-            name = name[:-3] + " [Markdown]"
-        elif lower.endswith(".css"):
-            name = name[:-4] + " [CSS]"
-        elif lower.endswith(".pdf"):
-            name = name[:-4] + " [PDF]"
-        elif lower.endswith(".zip"):
-            name = name[:-4] + " [ZIP]"
-        elif lower.endswith(".mod"):
-            name = name[:-4] + " [Mod]"
-        elif lower.endswith(".asset"):
-            name = name[:-6] + " [Asset]"
+    if type_label is None:
+        type_label = get_mod_type_label(path)
+    if type_label == "DIR":
+        name = name + " [DIR]"
+    elif type_label:
+        name = os.path.splitext(name)[0] + f" [{type_label}]"
     return name.replace("-", " ").replace("_", " ")
 
 def get_file_info(path):
-    real_path = path if os.path.isfile(path) else os.path.join(path, "__main__.py")
-    try:
-        size = os.path.getsize(real_path)
-        mtime = os.path.getmtime(real_path)
-        return f"{size // 1024}KB, {datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M:%S')}"
-    except Exception:
+    rec = get_mod_record(path)
+    if rec is None or rec.size is None:
         return "-"
+    return f"{rec.size // 1024}KB, {datetime.fromtimestamp(rec.mtime_ns / 1e9).strftime('%Y-%m-%d %H:%M:%S')}"
+
+# ----------------- Run history -----------------
+# Every run/open/edit/job is one JSON line in run_history/runs-NNNNNN.jsonl.
+# A segment is closed once it reaches RUN_HISTORY_SEGMENT_SIZE and the oldest
+# are deleted past RUN_HISTORY_MAX_SEGMENTS. The index lives in the state
+# store: one row per record pointing at its (segment, offset), plus all-time
+# per-mod totals, so the 'history' view reads a handful of records instead of
+# the whole log. Appends run inside a write transaction, which also keeps
+# launchers, `run` and job processes from interleaving segment writes.
+RUN_HISTORY_DIR = "run_history"
+RUN_HISTORY_SEGMENT_SIZE = 4 * 1024 * 1024
+RUN_HISTORY_MAX_SEGMENTS = 8
+
+class RunHistory:
+    """
+    Append-only run history with rotation, indexed by mod path and time.
+    Usage:
+        history = RunHistory(RUN_HISTORY_DIR, state)
+        history.append({"path": "Mods/example.py", "mod": "example [Python]", "action": "run", "duration": 1.2})
+        history.recent("Mods/example.py", 10)   # newest first
+        history.slowest(10)
+        history.error_rates()                   # {path: (runs, errors)}
+    """
+    def __init__(self, directory, store):
+        self.directory = directory
+        self.store = store
+        self.checked = False
+
+    def segment_path(self, segment):
+        return os.path.join(self.directory, f"runs-{segment:06d}.jsonl")
+
+    def transaction(self, work):
+        with self.store.lock:
+            db = self.store.db
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                if not self.checked:
+                    self.import_segments(db)
+                    self.checked = True
+                result = work(db)
+                db.execute("COMMIT")
+                return result
+            except Exception:
+                db.execute("ROLLBACK")
+                raise
+
+    def query(self, work):
+        """Run read-only work without taking the write lock, so listing history
+        never holds up launchers and jobs that are logging runs."""
+        with self.store.lock:
+            db = self.store.db
+            if not self.checked and db.execute("SELECT 1 FROM run_segments LIMIT 1").fetchone():
+                self.checked = True
+            if self.checked:
+                return work(db)
+        # Segments from before the index still need importing, which writes
+        return self.transaction(work)
+
+    def import_segments(self, db):
+        """Index segments written before the index lived in the state store."""
+        if db.execute("SELECT 1 FROM run_segments LIMIT 1").fetchone():
+            return
+        try:
+            names = sorted(n for n in os.listdir(self.directory) if n.startswith("runs-") and n.endswith(".jsonl"))
+        except OSError:
+            return
+        for name in names:
+            try:
+                segment = int(name[5:-6])
+            except ValueError:
+                continue
+            db.execute("INSERT OR IGNORE INTO run_segments (segment) VALUES (?)", (segment,))
+            offset = 0
+            with open(os.path.join(self.directory, name), "rb") as f:
+                for line in f:
+                    try:
+                        self.index_record(db, json.loads(line), segment, offset)
+                    except (ValueError, KeyError):
+                        pass
+                    offset += len(line)
+        try:
+            # The old JSON index is superseded
+            os.remove(os.path.join(self.directory, "index.json"))
+        except OSError:
+            pass
+
+    def index_record(self, db, record, segment, offset):
+        path = record.get("path") or record["mod"]
+        failed = 1 if record.get("error") else 0
+        duration = record.get("duration")
+        db.execute("INSERT INTO run_index (path, ts, duration, failed, segment, pos) VALUES (?, ?, ?, ?, ?, ?)",
+                   (path, record["ts"], duration, failed, segment, offset))
+        db.execute("INSERT INTO run_totals (path, runs, errors, total) VALUES (?, 1, ?, ?) "
+                   "ON CONFLICT (path) DO UPDATE SET runs = runs + 1, errors = errors + excluded.errors, "
+                   "total = total + excluded.total", (path, failed, duration or 0.0))
+
+    def rotate(self, db, current):
+        segment = (current or 0) + 1
+        db.execute("INSERT INTO run_segments (segment) VALUES (?)", (segment,))
+        dropped = [row[0] for row in db.execute(
+            "SELECT segment FROM run_segments ORDER BY segment DESC LIMIT -1 OFFSET ?", (RUN_HISTORY_MAX_SEGMENTS,))]
+        for old in dropped:
+            try:
+                os.remove(self.segment_path(old))
+            except OSError:
+                pass
+            db.execute("DELETE FROM run_index WHERE segment = ?", (old,))
+            db.execute("DELETE FROM run_segments WHERE segment = ?", (old,))
+        return segment
+
+    def append(self, record):
+        record = dict(record, ts=round(time.time(), 3))
+        record.setdefault("time", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        line = (json.dumps(record) + "\n").encode("utf-8")
+
+        def work(db):
+            os.makedirs(self.directory, exist_ok=True)
+            segment = db.execute("SELECT MAX(segment) FROM run_segments").fetchone()[0]
+            size = 0
+            if segment is not None:
+                try:
+                    size = os.path.getsize(self.segment_path(segment))
+                except OSError:
+                    size = 0
+            if segment is None or (size and size + len(line) > RUN_HISTORY_SEGMENT_SIZE):
+                segment = self.rotate(db, segment)
+                size = 0
+            with open(self.segment_path(segment), "ab") as f:
+                f.write(line)
+            self.index_record(db, record, segment, size)
+        self.transaction(work)
+
+    def read(self, pointers):
+        records = []
+        for segment, offset in pointers:
+            try:
+                with open(self.segment_path(segment), "rb") as f:
+                    f.seek(offset)
+                    records.append(json.loads(f.readline()))
+            except (OSError, ValueError):
+                pass
+        return records
+
+    def mods(self):
+        return self.query(lambda db: [row[0] for row in db.execute("SELECT path FROM run_totals")])
+
+    def recent(self, mod_path, count=10):
+        return self.read(self.query(lambda db: db.execute(
+            "SELECT segment, pos FROM run_index WHERE path = ? ORDER BY ts DESC, id DESC LIMIT ?", (mod_path, count)).fetchall()))
+
+    def slowest(self, count=10):
+        return self.read(self.query(lambda db: db.execute(
+            "SELECT segment, pos FROM run_index WHERE duration IS NOT NULL ORDER BY duration DESC LIMIT ?", (count,)).fetchall()))
 
-def log_run(mod_name, error=None, duration=None, action="run"):
+    def error_rates(self):
+        return self.query(lambda db: {path: (runs, errors) for path, runs, errors in
+                                      db.execute("SELECT path, runs, errors FROM run_totals")})
+
+run_history = RunHistory(RUN_HISTORY_DIR, state) if state is not None else None
+
+def log_run(mod_path, error=None, duration=None, action="run", usage=None):
     try:
-        with safe_open(LOG_FILE, "a", encoding="utf-8") as f:
-            f.write(f"{datetime.now()} - {action.capitalize()}: {mod_name}\n")
-            if duration is not None:
-                f.write(f"Duration: {duration:.2f} seconds\n")
-            if error:
-                f.write(f"ERROR:\n{error}\n")
-            f.write("\n")
+        run_history.append({
+            "path": mod_path, "mod": format_name(mod_path), "action": action,
+            "duration": None if duration is None else round(duration, 3),
+            "error": error or None, "usage": usage
+        })
     except Exception:
         pass
 
 def add_recent_mod(mod_path):
     try:
-        if os.path.isfile(RECENT_MODS_FILE):
-            with open(RECENT_MODS_FILE, "r", encoding="utf-8") as f:
-                recent = json.load(f)
-        else:
-            recent = []
-        if mod_path in recent:
-            recent.remove(mod_path)
-        recent.insert(0, mod_path)
-        recent = recent[:10]
-        with open(RECENT_MODS_FILE, "w", encoding="utf-8") as f:
-            json.dump(recent, f, indent=2)
+        state.add_recent(mod_path)
     except Exception:
         pass
 
@@ -491,6 +1294,80 @@ def get_mod_description(path):
         pass
     return ""
 
+# ----------------- Mod metadata index -----------------
+# Persistent cache of per-mod description/hash/type, validated by a cheap stat
+# signature so menu redraws don't re-read or re-hash unchanged mods.
+def get_stat_signature(path):
+    with mod_records_lock:
+        rec = mod_records.get(path)
+    is_dir = rec.is_dir if rec is not None else os.path.isdir(path)
+    real_path = os.path.join(path, "__main__.py") if is_dir else path
+    try:
+        st = os.stat(real_path)
+    except OSError:
+        return None
+    # Refresh the cached scan record too, so the Info column and sorting stay current
+    if rec is not None and (rec.size, rec.mtime_ns, rec.ino) != (st.st_size, st.st_mtime_ns, st.st_ino):
+        with mod_records_lock:
+            # Unless the watcher replaced or dropped it in the meantime
+            if mod_records.get(path) is rec:
+                mod_records[path] = rec._replace(size=st.st_size, mtime_ns=st.st_mtime_ns, ino=st.st_ino)
+    return [st.st_size, st.st_mtime_ns, st.st_ino]
+
+def load_mod_index():
+    try:
+        if os.path.isfile(MOD_INDEX_FILE):
+            with open(MOD_INDEX_FILE, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            if isinstance(index, dict):
+                return index
+    except Exception:
+        pass
+    return {}
+
+def save_mod_index(index):
+    # Write to a temp file first so a crash mid-write can't corrupt the index
+    tmp_file = MOD_INDEX_FILE + ".tmp"
+    try:
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(index, f)
+        os.replace(tmp_file, MOD_INDEX_FILE)
+    except Exception:
+        pass
+
+mod_index = load_mod_index()
+mod_index_dirty = False
+
+def get_mod_metadata(path):
+    """Return {"description", "hash", "type"} for a mod, recomputing only if it changed on disk."""
+    global mod_index_dirty
+    sig = get_stat_signature(path)
+    entry = mod_index.get(path)
+    if sig is not None and entry and entry.get("sig") == sig:
+        return entry
+    entry = {
+        "sig": sig,
+        "description": get_mod_description(path),
+        "hash": get_file_hash(path),
+        "type": get_mod_type_label(path)
+    }
+    if sig is not None:
+        mod_index[path] = entry
+        mod_index_dirty = True
+    return entry
+
+def flush_mod_index(py_files=None):
+    """Drop entries for mods that are gone and save the index if anything changed."""
+    global mod_index_dirty
+    if py_files is not None:
+        live = set(py_files)
+        for stale in [p for p in mod_index if p not in live]:
+            del mod_index[stale]
+            mod_index_dirty = True
+    if mod_index_dirty:
+        save_mod_index(mod_index)
+        mod_index_dirty = False
+
 # ----------------- Openers/Editors -----------------
 def open_with_system_default(path):
     """Open a file with the system default app (cross-platform)."""
@@ -570,9 +1447,13 @@ def open_guest_html(file_path, js_path=None):
 def edit_file_menu_with_path(filepath):
     """Inline editor for .txt and .json, or open external editor for others."""
     mods_path = find_mods_folder()
-    allowed = (
-        mods_path and os.path.abspath(filepath).startswith(os.path.abspath(mods_path))
-    ) or os.path.basename(filepath) in [CONFIG_FILE, LOG_FILE]
+    allowed = mods_path and os.path.abspath(filepath).startswith(os.path.abspath(mods_path))
+    if os.path.abspath(filepath) == os.path.abspath(CONFIG_FILE):
+        # The config lives in the state database now; config.json isn't read any more
+        print(f"Settings are stored in {STATE_DB_FILE}. Use 'config export' to write them to a JSON file,")
+        print("edit that file, then 'config import' to load it back.")
+        input("Press Enter to continue...")
+        return
     if not allowed or not os.path.isfile(filepath):
         print("File not found or not allowed.")
         input("Press Enter to continue...")
@@ -684,19 +1565,79 @@ def edit_file_menu_with_path(filepath):
         return
 
 # ----------------- Version check -----------------
-def fetch_latest_version():
+# The GitHub check runs once per session in a background thread and is cached on
+# disk (with the response ETag) so the menu never waits on the network.
+VERSION_CHECK_URL = "https://api.github.com/repos/DatLittlaDucky/DLDSPT/releases/latest"
+VERSION_CHECK_TTL = 6 * 60 * 60  # seconds
+
+version_check_started = False
+
+def load_version_cache():
+    try:
+        if os.path.isfile(VERSION_CACHE_FILE):
+            with open(VERSION_CACHE_FILE, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+            if isinstance(cache, dict):
+                return cache
+    except Exception:
+        pass
+    return {}
+
+def save_version_cache(cache):
+    try:
+        with open(VERSION_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+    except Exception:
+        pass
+
+version_cache = load_version_cache()
+
+def fetch_latest_version(cache=None):
+    """Ask GitHub for the latest release tag, revalidating with If-None-Match when possible."""
     if not HAVE_REQUESTS:
         return None
+    if cache is None:
+        cache = {}
+    headers = {}
+    if cache.get("etag"):
+        headers["If-None-Match"] = cache["etag"]
     try:
-        resp = requests.get("https://api.github.com/repos/DatLittlaDucky/DLDSPT/releases/latest", timeout=5)
+        resp = requests.get(VERSION_CHECK_URL, headers=headers, timeout=5)
+        if resp.status_code == 304:
+            return cache.get("latest")
         if resp.status_code == 200:
             data = resp.json()
             tag = data.get("tag_name", "")
+            cache["etag"] = resp.headers.get("ETag")
             return tag.lstrip("v")
     except Exception:
         pass
     return None
 
+def refresh_version_cache():
+    global version_cache
+    cache = dict(version_cache)
+    try:
+        ttl = float(config.get("version_check_ttl", VERSION_CHECK_TTL))
+    except (TypeError, ValueError):
+        ttl = VERSION_CHECK_TTL
+    if time.time() - cache.get("checked_at", 0) < ttl:
+        return
+    latest = fetch_latest_version(cache)
+    if latest is None:
+        return
+    cache["latest"] = latest
+    cache["checked_at"] = time.time()
+    version_cache = cache
+    save_version_cache(cache)
+
+def start_version_check():
+    global version_check_started
+    if version_check_started:
+        return
+    version_check_started = True
+    threading.Thread(target=refresh_version_cache, daemon=True).start()
+
 def version_tuple(v):
     try:
         return tuple(map(int, (v.split("."))))
@@ -704,22 +1645,36 @@ def version_tuple(v):
         return (0,)
 
 def check_version():
-    latest = fetch_latest_version()
+    """Return the newer release version from the cache, or None. Never touches the network."""
+    latest = version_cache.get("latest")
     if latest:
         try:
             if version_tuple(DLDSPT_VERSION) < version_tuple(latest):
-                # Removed warning sentence about running older version
-                resp = input("Hey, want to update your version? (y/n): ").strip().lower()
-                if resp == "y":
-                    print("Visit https://github.com/DatLittlaDucky/DLDSPT to download the latest release.")
-                input("Press Enter to continue...")
+                return latest
         except Exception:
             pass
+    return None
 
 # ----------------- Display Menu -----------------
-def display_menu(py_files, filter_text=None, sort_by="name"):
+def get_page_size():
+    # 0 (the default) shows every mod on one page
+    try:
+        return max(0, int(config.get("page_size", 0)))
+    except (TypeError, ValueError):
+        return 0
+
+def get_page_bounds(total, page, page_size):
+    """Return (page, page_count, start, end) with page clamped to the valid range."""
+    if page_size <= 0 or total <= page_size:
+        return 0, 1, 0, total
+    page_count = (total + page_size - 1) // page_size
+    page = max(0, min(page, page_count - 1))
+    start = page * page_size
+    return page, page_count, start, min(start + page_size, total)
+
+def display_menu(py_files, filter_text=None, sort_by="name", page=0):
     clear_console()
-    check_version()
+    latest_version = check_version()
     # Set default theme to dark if not already set
     if "theme" not in config:
         config["theme"] = "dark"
@@ -741,58 +1696,71 @@ def display_menu(py_files, filter_text=None, sort_by="name"):
         else:
             console.print(Panel(Text(partnership_text, style="bold magenta"), style=theme_cfg["panel"]))
         # ...existing code...
-    else:
-        print(ASCII_LOGO)
-        print(f"== {APP_NAME} v{DLDSPT_VERSION} ==")
-        print(f"{APP_FULL_NAME}")
-        print("-" * (len(APP_FULL_NAME) + 2))
-        print(partnership_text)
-        # ...existing code...
 
-    console.print(f"[{theme_cfg['table_info']}]Available Mods:[/{theme_cfg['table_info']}] {len(py_files)}")
-    console.print(f"[{theme_cfg['table_info']}]Total Mods Size:[/{theme_cfg['table_info']}] {get_total_mods_size(py_files)}KB")
-    console.print(f"[{theme_cfg['table_info']}]Sort By:[/{theme_cfg['table_info']}] {sort_by.capitalize()}")
-    if last_ran_mod:
-        console.print(f"[{theme_cfg['table_info']}]Last Ran Mod:[/{theme_cfg['table_info']}] {last_ran_mod}")
-    console.print()
-
-    filtered_files = py_files
-    if filter_text:
-        filtered_files = [f for f in py_files if filter_text.lower() in format_name(f).lower()]
-        console.print(f"[{theme_cfg['table_desc']}]Filter: '{filter_text}' ({len(filtered_files)} mods shown)[/{theme_cfg['table_desc']}]")
-
-    from rich.table import Table
-    table = Table(show_header=True, header_style=theme_cfg["table_header"])
-    table.add_column("#", style="dim", width=4)
-    table.add_column("Name", style=theme_cfg["table_name"])
-    table.add_column("Info", style=theme_cfg["table_info"])
-    table.add_column("Description", style=theme_cfg["table_desc"])
-    table.add_column("Hash", style="dim", width=14)
-    table.add_column("Last Run", style="dim", width=20)
-
-    for i, f in enumerate(filtered_files, 1):
-        info = get_file_info(f)
-        desc = get_mod_description(f)
-        hash_val = get_file_hash(f)
-        last_run = get_last_run_time(f)
-        table.add_row(str(i), format_name(f), info, desc or "-", hash_val, last_run)
-
-    console.print(table)
-
-    console.print("\n[cyan]r[/cyan] Reload mod list")
-    console.print("[cyan]d[/cyan] Open Discord server link")
-    console.print("[cyan]q[/cyan] Quit")
-    console.print("\n[cyan]s[/cyan] Search/filter mods")
-    console.print("[cyan]sort[/cyan] Change sort order (name/date/size/favourites)")
-    console.print("[cyan]ducky [/cyan] Run a DuckyLang mod")
-    console.print("[cyan]edit[/cyan] Edit a file (text or JSON) or open others in editor")
-    console.print("[cyan]ducks[/cyan] 🦆 Surprise")
-    console.print("[cyan]updates[/cyan] View update log")
-    # console.print("[cyan]rs[/cyan] Restart DLDSPT")  # Removed restart option
-    console.print("[cyan]fav[/cyan] favourite/unfavourite a mod")
-    console.print("[cyan]pin[/cyan] pin/unpin a mod")
-    console.print("[cyan]network[/cyan] Connect to a server or host one")
-    console.print("[cyan]theme[/cyan] change the look of dldspt")
+    if USE_RICH:
+        console.print(f"[{theme_cfg['table_info']}]Available Mods:[/{theme_cfg['table_info']}] {len(py_files)}")
+        console.print(f"[{theme_cfg['table_info']}]Total Mods Size:[/{theme_cfg['table_info']}] {get_total_mods_size(py_files)}KB")
+        console.print(f"[{theme_cfg['table_info']}]Sort By:[/{theme_cfg['table_info']}] {sort_by.capitalize()}")
+        if last_ran_mod:
+            console.print(f"[{theme_cfg['table_info']}]Last Ran Mod:[/{theme_cfg['table_info']}] {last_ran_mod}")
+        if latest_version:
+            console.print(f"[{theme_cfg['table_info']}]Update available:[/{theme_cfg['table_info']}] v{latest_version} - visit {APP_GITHUB} to download the latest release.")
+        if dependency_status:
+            console.print(f"[{theme_cfg['table_info']}]Dependencies:[/{theme_cfg['table_info']}] {dependency_status}")
+        jobs_status = get_jobs_status()
+        if jobs_status:
+            console.print(f"[{theme_cfg['table_info']}]Jobs:[/{theme_cfg['table_info']}] {jobs_status}")
+        console.print()
+
+        filtered_files = py_files
+        if filter_text:
+            filtered_files = [f for f in py_files if filter_text.lower() in format_name(f).lower()]
+            console.print(f"[{theme_cfg['table_desc']}]Filter: '{filter_text}' ({len(filtered_files)} mods shown)[/{theme_cfg['table_desc']}]")
+
+        from rich.table import Table
+        table = Table(show_header=True, header_style=theme_cfg["table_header"])
+        table.add_column("#", style="dim", width=4)
+        table.add_column("Name", style=theme_cfg["table_name"])
+        table.add_column("Info", style=theme_cfg["table_info"])
+        table.add_column("Description", style=theme_cfg["table_desc"])
+        table.add_column("Hash", style="dim", width=14)
+        table.add_column("Last Run", style="dim", width=20)
+
+        # Only the visible page gets metadata lookups and table rows; numbering stays global
+        page, page_count, start, end = get_page_bounds(len(filtered_files), page, get_page_size())
+        for i in range(start, end):
+            f = filtered_files[i]
+            info = get_file_info(f)
+            meta = get_mod_metadata(f)
+            last_run = get_last_run_time(f)
+            table.add_row(str(i + 1), format_name(f, meta["type"]), info, meta["description"] or "-", meta["hash"], last_run)
+        flush_mod_index(py_files)
+
+        console.print(table)
+        if page_count > 1:
+            console.print(f"[{theme_cfg['table_info']}]Page {page + 1}/{page_count}[/{theme_cfg['table_info']}] (mods {start + 1}-{end} of {len(filtered_files)})")
+
+        console.print("\n[cyan]r[/cyan] Reload mod list")
+        console.print("[cyan]d[/cyan] Open Discord server link")
+        console.print("[cyan]q[/cyan] Quit")
+        console.print("\n[cyan]s[/cyan] Search/filter mods")
+        console.print("[cyan]sort[/cyan] Change sort order (name/date/size/favourites)")
+        console.print("[cyan]ducky [/cyan] Run a DuckyLang mod (several names run them concurrently)")
+        console.print("[cyan]edit[/cyan] Edit a file (text or JSON) or open others in editor")
+        console.print("[cyan]ducks[/cyan] 🦆 Surprise")
+        console.print("[cyan]updates[/cyan] View update log")
+        # console.print("[cyan]rs[/cyan] Restart DLDSPT")  # Removed restart option
+        console.print("[cyan]fav[/cyan] favourite/unfavourite a mod")
+        console.print("[cyan]pin[/cyan] pin/unpin a mod")
+        console.print("[cyan]network[/cyan] Connect to a server or host one")
+        console.print("[cyan]theme[/cyan] change the look of dldspt")
+        console.print("[cyan]scan[/cyan] Recursive scan settings (category folders)")
+        console.print("[cyan]bg <num> [num ...][/cyan] Run mods in the background, [cyan]jobs[/cyan] view background jobs")
+        console.print("[cyan]stats [num][/cyan] CPU, memory and run time stats (all mods, or one mod)")
+        console.print("[cyan]history[/cyan] Past runs: latest per mod, slowest, error rates")
+        console.print("[cyan]config export[/cyan] / [cyan]config import[/cyan] Save settings to a JSON file or load them back")
+        console.print(f"[cyan]profile[/cyan] Toggle DuckyLang profiling (currently {'on' if config.get('profile_duckylang') else 'off'})")
+        console.print("[cyan]n[/cyan]/[cyan]p[/cyan] Next/previous page, [cyan]page <num>[/cyan] jump to page, [cyan]pagesize[/cyan] set rows per page")
     # End of Rich UI block
 
     if not USE_RICH:
@@ -806,28 +1774,45 @@ def display_menu(py_files, filter_text=None, sort_by="name"):
         print(f"Sort By: {sort_by.capitalize()}")
         if last_ran_mod:
             print(f"Last Ran Mod: {last_ran_mod}")
+        if latest_version:
+            print(f"Update available: v{latest_version} - visit {APP_GITHUB} to download the latest release.")
+        if dependency_status:
+            print(f"Dependencies: {dependency_status}")
+        jobs_status = get_jobs_status()
+        if jobs_status:
+            print(f"Jobs: {jobs_status}")
         print()
         filtered_files = py_files
         if filter_text:
             filtered_files = [f for f in py_files if filter_text.lower() in format_name(f).lower()]
             print(f"Filter: '{filter_text}' ({len(filtered_files)} mods shown)")
-        for i, f in enumerate(filtered_files, 1):
+        page, page_count, start, end = get_page_bounds(len(filtered_files), page, get_page_size())
+        for i in range(start, end):
+            f = filtered_files[i]
             info = get_file_info(f)
-            desc = get_mod_description(f)
-            hash_val = get_file_hash(f)
+            meta = get_mod_metadata(f)
             last_run = get_last_run_time(f)
-            print(f"{i}. {format_name(f)} ({info}) [Hash: {hash_val}] [Last Run: {last_run}]")
-            if desc:
-                print(f"    ↳ {desc}")
+            print(f"{i + 1}. {format_name(f, meta['type'])} ({info}) [Hash: {meta['hash']}] [Last Run: {last_run}]")
+            if meta["description"]:
+                print(f"    ↳ {meta['description']}")
+        flush_mod_index(py_files)
+        if page_count > 1:
+            print(f"Page {page + 1}/{page_count} (mods {start + 1}-{end} of {len(filtered_files)})")
         print("\nr. Reload mod list")
         print("d. Open Discord server link")
         print("q. Quit")
         print("\ns. Search/filter mods")
         print("sort. Change sort order (name/date/size/favourites)")
-        print("ducky [modname]. Run a DuckyLang mod from Mods folder (e.g. ducky test)")
+        print("ducky [modname ...]. Run DuckyLang mods from Mods folder (e.g. ducky test, or ducky a b to run both at once)")
         print("edit. Edit a file (text or JSON) or open others in editor")
         print("Type 'ducks' for a surprise 🦆")
         print("Type 'updates' to view the update log")
+        print("n/p. Next/previous page, 'page <num>' to jump, 'pagesize' to set rows per page")
+        print("bg <num> [num ...]. Run mods in the background, 'jobs' to view background jobs")
+        print("stats [num]. CPU, memory and run time stats (all mods, or one mod)")
+        print("history. Past runs: latest per mod, slowest, error rates")
+        print("config export / config import. Save settings to a JSON file or load them back")
+        print(f"profile. Toggle DuckyLang profiling (currently {'on' if config.get('profile_duckylang') else 'off'})")
         # print("Type 'rs' to restart DLDSPT")  # Removed restart option
 
         # Pinned / favourites display
@@ -861,23 +1846,116 @@ def show_update_log():
 
 def save_config(cfg):
     try:
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            json.dump(cfg, f, indent=2)
+        state.save_config(cfg)
     except Exception:
         pass
 
-config = load_config()
-
 # ----------------- Dependency installer -----------------
-def install_dependencies():
+# pip only runs when dependencies.txt changed for this interpreter or a listed
+# package is missing; otherwise the check is a hash plus a metadata lookup.
+DEPS_CACHE_FILE = "deps_cache.json"
+dependency_status = None
+
+def get_dependencies_key(dep_file):
+    h = hashlib.sha256()
+    with open(dep_file, "rb") as f:
+        h.update(f.read())
+    h.update(sys.executable.encode("utf-8"))
+    return h.hexdigest()
+
+def parse_requirement_names(dep_file):
+    names = []
+    with open(dep_file, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.split("#", 1)[0].strip()
+            if not line or line.startswith("-"):
+                continue
+            match = re.match(r"[A-Za-z0-9][A-Za-z0-9._-]*", line)
+            if match:
+                names.append(match.group(0))
+    return names
+
+def missing_distributions(names):
+    from importlib import metadata
+    missing = []
+    for name in names:
+        try:
+            metadata.version(name)
+        except metadata.PackageNotFoundError:
+            missing.append(name)
+    return missing
+
+def load_deps_cache():
+    try:
+        if os.path.isfile(DEPS_CACHE_FILE):
+            with open(DEPS_CACHE_FILE, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+            if isinstance(cache, dict):
+                return cache
+    except Exception:
+        pass
+    return {}
+
+def save_deps_cache(cache):
+    try:
+        with open(DEPS_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+    except Exception:
+        pass
+
+def install_dependencies(quiet=False, extra_packages=None):
+    """Install dependencies.txt (and extra_packages) only if needed. quiet=True reports via dependency_status."""
+    global dependency_status
     dep_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dependencies.txt")
-    if os.path.isfile(dep_file):
+    cmd = []
+    key = None
+    try:
+        if os.path.isfile(dep_file):
+            key = get_dependencies_key(dep_file)
+            cache = load_deps_cache()
+            if cache.get(sys.executable) != key or missing_distributions(parse_requirement_names(dep_file)):
+                cmd = [sys.executable, "-m", "pip", "install", "-r", dep_file]
+        if extra_packages:
+            cmd = cmd or [sys.executable, "-m", "pip", "install"]
+            cmd += list(extra_packages)
+    except Exception as e:
+        dependency_status = f"Dependency check failed: {e}"
+        return False
+    if not cmd:
+        return True
+
+    if quiet:
+        dependency_status = "Installing dependencies in the background..."
+    else:
         print("Checking and installing dependencies from dependencies.txt...")
-        try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", dep_file])
-            print("Dependencies installed.")
-        except Exception as e:
-            print(f"Dependency installation failed: {e}")
+    try:
+        if quiet:
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+            if result.returncode != 0:
+                lines = (result.stderr or "").strip().splitlines()
+                raise RuntimeError(lines[-1] if lines else f"pip exited with {result.returncode}")
+        else:
+            subprocess.check_call(cmd)
+    except Exception as e:
+        dependency_status = f"Dependency installation failed: {e}"
+        if not quiet:
+            print(dependency_status)
+        return False
+    if key is not None:
+        cache = load_deps_cache()
+        cache[sys.executable] = key
+        save_deps_cache(cache)
+    dependency_status = "Dependencies installed."
+    if not quiet:
+        print(dependency_status)
+    return True
+
+def start_dependency_check():
+    # Runs alongside menu startup; a missing Rich is installed here for the next launch
+    extra = [] if has_module("rich") else ["rich"]
+    thread = threading.Thread(target=install_dependencies, kwargs={"quiet": True, "extra_packages": extra}, daemon=True)
+    thread.start()
+    return thread
 
 # ----------------- Mod helpers -----------------
 def show_mod_info(mod_path):
@@ -885,7 +1963,7 @@ def show_mod_info(mod_path):
     print(f"Name: {format_name(mod_path)}")
     print(f"Path: {mod_path}")
     print(f"Info: {get_file_info(mod_path)}")
-    print(f"Description: {get_mod_description(mod_path)}")
+    print(f"Description: {get_mod_metadata(mod_path)['description']}")
     print("Favourited:", "Yes" if mod_path in config.get("favourites", []) else "No")
     print("Pinned:", "Yes" if mod_path in config.get("pinned", []) else "No")
     input("Press Enter to continue...")
@@ -897,34 +1975,18 @@ def check_mod_updates(mod_path):
     input("Press Enter to continue...")
 
 def add_mod_comment(mod_path):
-    comments_file = "mod_comments.json"
     try:
-        if os.path.isfile(comments_file):
-            with open(comments_file, "r", encoding="utf-8") as f:
-                comments = json.load(f)
-        else:
-            comments = {}
         comment = input("Enter your comment for this mod: ").strip()
-        comments.setdefault(mod_path, []).append(comment)
-        with open(comments_file, "w", encoding="utf-8") as f:
-            json.dump(comments, f, indent=2)
+        state.add_comment(mod_path, comment)
         print("Comment added.")
     except Exception:
         print("Failed to add comment.")
     input("Press Enter to continue...")
 
 def add_mod_tag(mod_path):
-    tags_file = "mod_tags.json"
     try:
-        if os.path.isfile(tags_file):
-            with open(tags_file, "r", encoding="utf-8") as f:
-                tags = json.load(f)
-        else:
-            tags = {}
         tag = input("Enter a tag for this mod: ").strip()
-        tags.setdefault(mod_path, []).append(tag)
-        with open(tags_file, "w", encoding="utf-8") as f:
-            json.dump(tags, f, indent=2)
+        state.add_tag(mod_path, tag)
         print("Tag added.")
     except Exception:
         print("Failed to add tag.")
@@ -957,7 +2019,8 @@ def set_theme():
     theme = input("Choose theme (light/dark/highcontrast/lunar): ").strip().lower()
     if theme not in THEMES:
         print("Invalid theme. Using light.")
-        theme = "light"    if theme == "lunar":
+        theme = "light"
+    if theme == "lunar":
         config["theme"] = "lunar"
     elif theme == "purplepink": # Keep purplepink for backwards compatibility
         config["theme"] = "lunar"
@@ -967,6 +2030,26 @@ def set_theme():
     print("Theme set.")
     input("Press Enter to continue...")
 
+def set_scan_options():
+    print("Recursive scanning finds mods inside category subfolders of Mods.")
+    recursive = input(f"Enable recursive scanning? (y/n) [currently {'y' if config.get('recursive_scan') else 'n'}]: ").strip().lower()
+    if recursive in ("y", "n"):
+        config["recursive_scan"] = recursive == "y"
+    if config.get("recursive_scan"):
+        depth = input(f"Max folder depth [{config.get('scan_depth', DEFAULT_SCAN_DEPTH)}]: ").strip()
+        if depth:
+            try:
+                config["scan_depth"] = max(1, int(depth))
+            except ValueError:
+                print("Invalid depth, keeping previous value.")
+        current = ", ".join(config.get("scan_ignore", DEFAULT_SCAN_IGNORE))
+        ignore = input(f"Ignore patterns, comma separated [{current}]: ").strip()
+        if ignore:
+            config["scan_ignore"] = [p.strip() for p in ignore.split(",") if p.strip()]
+    save_config(config)
+    print("Scan options saved.")
+    input("Press Enter to continue...")
+
 def backup_mods(mods_path):
     import zipfile
     out = input("Enter backup filename (e.g. mods_backup.zip): ").strip()
@@ -982,7 +2065,7 @@ def backup_mods(mods_path):
     input("Press Enter to continue...")
 
 def search_mods_by_description(py_files, text):
-    return [f for f in py_files if text.lower() in get_mod_description(f).lower()]
+    return [f for f in py_files if text.lower() in get_mod_metadata(f)["description"].lower()]
 
 def handle_shortcuts(choice):
     if choice == 'ctrl+r':
@@ -1063,6 +2146,22 @@ def create_file_menu():
         input("Press Enter to continue...")
 
 # ----------------- Running / Opening logic -----------------
+def get_duckylang_profile_file(script_path):
+    """Where to write a DuckyLang hot-spot report, or None when profiling is off."""
+    if not config.get("profile_duckylang", False):
+        return None
+    ensure_mod_logs_dir()
+    return os.path.join(MOD_LOGS_DIR, f"{os.path.basename(script_path)}.profile.json")
+
+def toggle_duckylang_profiling():
+    config["profile_duckylang"] = not config.get("profile_duckylang", False)
+    save_config(config)
+    if config["profile_duckylang"]:
+        print(f"DuckyLang profiling enabled. A hot-spot report is shown after each .dkl run and saved in {MOD_LOGS_DIR}/.")
+    else:
+        print("DuckyLang profiling disabled.")
+    input("Press Enter to continue...")
+
 def run_duckylang_script(mods_path, modname=None, script_path=None):
     # Resources path is already in sys.path from above
     if script_path:
@@ -1076,7 +2175,8 @@ def run_duckylang_script(mods_path, modname=None, script_path=None):
                     sys.path.insert(0, resources_path)
                 try:
                     import duckylang # pyright: ignore[reportMissingImports]
-                    duckylang.run_duckylang(script_path)
+                    duckylang.run_duckylang(script_path, profile_file=get_duckylang_profile_file(script_path),
+                                            transpile=config.get("duckylang_transpile", True))
                 except ImportError:
                     print("Error: duckylang module not found in Resources folder.")
                     input("Press Enter to return to DLDSPT Menu...")
@@ -1097,7 +2197,28 @@ def run_duckylang_script(mods_path, modname=None, script_path=None):
         return
     try:
         import duckylang # pyright: ignore[reportMissingImports]
-        duckylang.run_duckylang(script_path)
+        duckylang.run_duckylang(script_path, profile_file=get_duckylang_profile_file(script_path),
+                                transpile=config.get("duckylang_transpile", True))
+    except Exception as e:
+        print("Error running DuckyLang:", e)
+        input("Press Enter to return to DLDSPT Menu...")
+
+def run_duckylang_scripts(mods_path, modnames):
+    """Run several DuckyLang mods at once on the async runtime (Ctrl+C cancels them)."""
+    script_paths = []
+    for modname in modnames:
+        script_path = os.path.join(mods_path, f"{modname}.dkl")
+        if not os.path.isfile(script_path):
+            print(f"❌ DuckyLang mod '{modname}' not found at {script_path}.")
+            input("Press Enter to return to DLDSPT Menu...")
+            return
+        script_paths.append(script_path)
+    # Optional per-script instruction limit, so a runaway loop can't hold the others up forever
+    budget = config.get("duckylang_budget") or None
+    print(f"\n--- Running {len(script_paths)} DuckyLang mods (Ctrl+C to cancel) ---\n")
+    try:
+        import duckylang # pyright: ignore[reportMissingImports]
+        duckylang.run_concurrently(script_paths, budget=budget)
     except Exception as e:
         print("Error running DuckyLang:", e)
         input("Press Enter to return to DLDSPT Menu...")
@@ -1118,25 +2239,18 @@ def get_file_hash(path):
 
 def load_last_run_times():
     try:
-        if os.path.isfile(MOD_LAST_RUN_FILE):
-            with open(MOD_LAST_RUN_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-    except Exception:
-        pass
-    return {}
-
-def save_last_run_times(times):
-    try:
-        with open(MOD_LAST_RUN_FILE, "w", encoding="utf-8") as f:
-            json.dump(times, f, indent=2)
+        return state.last_runs()
     except Exception:
-        pass
+        return {}
 
 mod_last_run_times = load_last_run_times()
 
 def update_last_run_time(mod_path):
     mod_last_run_times[mod_path] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    save_last_run_times(mod_last_run_times)
+    try:
+        state.set_last_run(mod_path, mod_last_run_times[mod_path])
+    except Exception:
+        pass
 
 def get_last_run_time(mod_path):
     return mod_last_run_times.get(mod_path, "-")
@@ -1145,12 +2259,483 @@ def log_mod_error(mod_path, error_info):
     ensure_mod_logs_dir()
     mod_name = os.path.basename(mod_path)
     log_file = os.path.join(MOD_LOGS_DIR, f"{mod_name}.log")
+    try:
+        # Keep one previous file around instead of growing forever
+        if os.path.getsize(log_file) > MOD_LOG_MAX_SIZE:
+            os.replace(log_file, log_file + ".1")
+    except OSError:
+        pass
     try:
         with open(log_file, "a", encoding="utf-8") as f:
             f.write(f"{datetime.now()} ERROR:\n{error_info}\n\n")
     except Exception:
         pass
 
+def print_history_records(title, records):
+    if USE_RICH:
+        from rich.table import Table
+        table = Table(title=title, show_header=True, header_style="bold cyan")
+        for col in ("Time", "Mod", "Action", "Duration", "Result"):
+            table.add_column(col)
+        for r in records:
+            duration = "-" if r.get("duration") is None else f"{r['duration']:.2f}s"
+            result = "error: " + r["error"].strip().splitlines()[-1] if r.get("error") else "ok"
+            table.add_row(r.get("time", "-"), r["mod"], r.get("action", "run"), duration, result)
+        console.print(table)
+    else:
+        print(f"--- {title} ---")
+        for r in records:
+            duration = "-" if r.get("duration") is None else f"{r['duration']:.2f}s"
+            result = "error: " + r["error"].strip().splitlines()[-1] if r.get("error") else "ok"
+            print(f"{r.get('time', '-')} | {r['mod']} | {r.get('action', 'run')} | {duration} | {result}")
+    if not records:
+        print("No runs recorded yet.")
+
+def history_menu():
+    while True:
+        clear_console()
+        print("--- Run history ---")
+        print("l <mod name> [N]  Last N runs of a mod (default 10)")
+        print("s [N]             Slowest runs (default 10)")
+        print("e                 Error rate per mod")
+        print("b                 Back")
+        choice = input("History: ").strip()
+        parts = choice.split()
+        if choice.lower() == 'b':
+            return
+        if not parts:
+            continue
+        command = parts[0].lower()
+        count = 10
+        if len(parts) > 1 and parts[-1].isdigit() and (command == 's' or len(parts) > 2):
+            count = int(parts.pop())
+        clear_console()
+        if run_history is None:
+            print("❌ Run history is unavailable (the state database could not be opened).")
+        elif command == 'l' and len(parts) > 1:
+            wanted = " ".join(parts[1:]).lower()
+            paths = run_history.mods()
+            # Match the mod's name or its path; mods in different categories can share a name
+            matches = ([p for p in paths if format_name(p).lower() == wanted or p.lower() == wanted]
+                       or [p for p in paths if wanted in format_name(p).lower() or wanted in p.lower()])
+            if not matches:
+                print("❌ No runs recorded for that mod.")
+            elif len(matches) > 1:
+                print("Several mods match, be more specific (a path works too):")
+                for path in matches:
+                    print(f"  {format_name(path)}  ({path})")
+            else:
+                print_history_records(f"Last runs of {format_name(matches[0])}", run_history.recent(matches[0], count))
+        elif command == 's':
+            print_history_records("Slowest runs", run_history.slowest(count))
+        elif command == 'e':
+            rates = sorted(run_history.error_rates().items(), key=lambda item: item[1][1] / item[1][0], reverse=True)
+            if USE_RICH:
+                from rich.table import Table
+                table = Table(title="Error rate per mod", show_header=True, header_style="bold cyan")
+                for col in ("Mod", "Runs", "Errors", "Rate"):
+                    table.add_column(col)
+                for path, (runs, errors) in rates:
+                    table.add_row(path, str(runs), str(errors), f"{errors / runs:.0%}")
+                console.print(table)
+            else:
+                print("--- Error rate per mod ---")
+                for path, (runs, errors) in rates:
+                    print(f"{path} | {runs} runs | {errors} errors | {errors / runs:.0%}")
+            if not rates:
+                print("No runs recorded yet.")
+        else:
+            print("❌ Invalid input.")
+        input("\nPress Enter to continue...")
+
+# ----------------- Resource accounting -----------------
+# getrusage counters are taken around each mod run: CPU time and context
+# switches as deltas, peak RSS as the process high-water mark. "children"
+# covers processes the mod started and waited for. Totals per mod are kept in
+# the state store for the 'stats' view.
+def usage_snapshot():
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF), resource.getrusage(resource.RUSAGE_CHILDREN)
+
+def usage_since(before):
+    """Resource usage since a usage_snapshot() as a JSON-friendly dict, or None."""
+    if before is None:
+        return None
+    after = usage_snapshot()
+    # ru_maxrss is in kilobytes on Linux but bytes on macOS
+    rss_scale = 1024 if sys.platform == "darwin" else 1
+
+    def delta(old, new):
+        return {
+            "user": round(new.ru_utime - old.ru_utime, 3),
+            "system": round(new.ru_stime - old.ru_stime, 3),
+            "max_rss_kb": new.ru_maxrss // rss_scale,
+            "ctx_voluntary": new.ru_nvcsw - old.ru_nvcsw,
+            "ctx_involuntary": new.ru_nivcsw - old.ru_nivcsw,
+        }
+    usage = delta(before[0], after[0])
+    usage["children"] = delta(before[1], after[1])
+    if after[1].ru_maxrss <= before[1].ru_maxrss:
+        # The children's peak covers every child ever waited for; it only tells
+        # us about this run if one of its children set a new high
+        usage["children"]["max_rss_kb"] = 0
+    return usage
+
+def format_usage(usage):
+    children = usage.get("children") or {}
+    text = (f"CPU {usage['user']:.2f}s user / {usage['system']:.2f}s sys, "
+            f"peak RSS {usage['max_rss_kb'] / 1024:.1f}MB, "
+            f"context switches {usage['ctx_voluntary']} voluntary / {usage['ctx_involuntary']} involuntary")
+    if children.get("user") or children.get("system"):
+        text += (f"; children CPU {children['user']:.2f}s user / {children['system']:.2f}s sys, "
+                 f"peak RSS {children['max_rss_kb'] / 1024:.1f}MB")
+    return text
+
+def load_mod_stats():
+    try:
+        return state.all_mod_stats()
+    except Exception:
+        return {}
+
+def record_mod_stats(mod_path, duration, usage, failed=False):
+    try:
+        state.update_mod_stats(mod_path, lambda entry: update_mod_stats_entry(entry, duration, usage, failed))
+    except Exception:
+        pass
+
+def update_mod_stats_entry(entry, duration, usage, failed):
+    entry = entry or {
+        "runs": 0, "failures": 0, "wall_total": 0.0, "wall_max": 0.0,
+        "cpu_total": 0.0, "children_cpu_total": 0.0, "peak_rss_kb": 0, "last": None
+    }
+    entry["runs"] += 1
+    entry["failures"] += 1 if failed else 0
+    entry["wall_total"] = round(entry["wall_total"] + duration, 3)
+    entry["wall_max"] = round(max(entry["wall_max"], duration), 3)
+    if usage:
+        children = usage.get("children") or {}
+        entry["cpu_total"] = round(entry["cpu_total"] + usage["user"] + usage["system"], 3)
+        entry["children_cpu_total"] = round(entry["children_cpu_total"] + children.get("user", 0) + children.get("system", 0), 3)
+        entry["peak_rss_kb"] = max(entry["peak_rss_kb"], usage["max_rss_kb"], children.get("max_rss_kb", 0))
+    entry["last"] = {"time": datetime.now().strftime('%Y-%m-%d %H:%M:%S'), "duration": round(duration, 3), "usage": usage}
+    return entry
+
+def show_mod_stats(mod_path=None):
+    """Table of run statistics for every mod, or the details of one mod's last run."""
+    clear_console()
+    stats = load_mod_stats()
+    if mod_path is not None:
+        entry = stats.get(mod_path)
+        print(f"--- Stats: {format_name(mod_path)} ---")
+        if entry is None:
+            print("No runs recorded yet.")
+        else:
+            runs = entry["runs"]
+            print(f"Runs: {runs} ({entry['failures']} failed)")
+            print(f"Wall time: {entry['wall_total'] / runs:.2f}s average, {entry['wall_max']:.2f}s longest")
+            print(f"CPU time: {entry['cpu_total'] / runs:.2f}s average, children {entry['children_cpu_total'] / runs:.2f}s average")
+            print(f"Peak RSS: {entry['peak_rss_kb'] / 1024:.1f}MB")
+            last = entry.get("last") or {}
+            print(f"Last run: {last.get('time', '-')} took {last.get('duration', 0):.2f}s")
+            if last.get("usage"):
+                print(f"  {format_usage(last['usage'])}")
+        input("\nPress Enter to continue...")
+        return
+    rows = []
+    for path, entry in sorted(stats.items(), key=lambda item: item[1]["cpu_total"], reverse=True):
+        runs = entry["runs"] or 1
+        rows.append((format_name(path), str(entry["runs"]), str(entry["failures"]),
+                     f"{entry['wall_total'] / runs:.2f}s", f"{entry['cpu_total'] / runs:.2f}s",
+                     f"{entry['children_cpu_total'] / runs:.2f}s", f"{entry['peak_rss_kb'] / 1024:.1f}MB"))
+    headers = ("Mod", "Runs", "Failed", "Avg wall", "Avg CPU", "Avg child CPU", "Peak RSS")
+    if USE_RICH:
+        from rich.table import Table
+        table = Table(title="Mod stats", show_header=True, header_style="bold cyan")
+        for col in headers:
+            table.add_column(col)
+        for row in rows:
+            table.add_row(*row)
+        console.print(table)
+    else:
+        print("--- Mod stats ---")
+        print(" | ".join(headers))
+        for row in rows:
+            print(" | ".join(row))
+    if not rows:
+        print("No runs recorded yet.")
+    elif resource is None:
+        print("CPU and memory figures need the resource module, which this platform doesn't have.")
+    input("\nPress Enter to continue...")
+
+# ----------------- Mod code cache -----------------
+# runpy.run_path recompiles a mod's source every time and never writes a .pyc.
+# Compiled code objects are cached as marshal files (one per mod path, so an
+# edited mod simply overwrites its old entry) and reused while the source matches.
+MOD_CODE_CACHE_DIR = "mod_code_cache"
+MOD_CODE_CACHE_MAX_FILES = 256
+
+def get_code_cache_file(path):
+    path_hash = hashlib.sha256(os.path.abspath(path).encode("utf-8")).hexdigest()[:16]
+    tag = sys.implementation.cache_tag or "python"
+    return os.path.join(MOD_CODE_CACHE_DIR, f"{path_hash}.{tag}.bin")
+
+def load_cached_code(path):
+    """Return a code object for path, compiling and caching it only if the source changed."""
+    import marshal
+    from importlib.util import MAGIC_NUMBER
+    cache_file = get_code_cache_file(path)
+    st = os.stat(path)
+    sig = [st.st_size, st.st_mtime_ns]
+    cached = None
+    try:
+        with open(cache_file, "rb") as f:
+            magic, cached_sig, cached_hash, code = marshal.load(f)
+        if magic == MAGIC_NUMBER:
+            cached = (cached_sig, cached_hash, code)
+    except Exception:
+        pass
+    # Fast path: same size and mtime as when cached, no need to even read the source
+    if cached and list(cached[0]) == sig:
+        return cached[2]
+    with open(path, "rb") as f:
+        source = f.read()
+    source_hash = hashlib.sha256(source).hexdigest()
+    if cached and cached[1] == source_hash:
+        code = cached[2]
+    else:
+        code = compile(source, path, "exec", dont_inherit=True)
+    try:
+        os.makedirs(MOD_CODE_CACHE_DIR, exist_ok=True)
+        tmp_file = cache_file + ".tmp"
+        with open(tmp_file, "wb") as f:
+            marshal.dump((MAGIC_NUMBER, sig, source_hash, code), f)
+        os.replace(tmp_file, cache_file)
+        evict_code_cache()
+    except Exception:
+        pass
+    return code
+
+def evict_code_cache(max_files=MOD_CODE_CACHE_MAX_FILES):
+    # Drop the least recently written entries once the cache grows past max_files
+    try:
+        entries = [e for e in os.scandir(MOD_CODE_CACHE_DIR) if e.name.endswith(".bin")]
+    except OSError:
+        return
+    if len(entries) <= max_files:
+        return
+    entries.sort(key=lambda e: e.stat().st_mtime_ns)
+    for e in entries[:len(entries) - max_files]:
+        try:
+            os.remove(e.path)
+        except OSError:
+            pass
+
+def run_mod_path(path, run_name="__main__"):
+    """Same as runpy.run_path for a .py file, but reuses cached code objects."""
+    path = os.fsdecode(path)
+    run_code = getattr(runpy, "_run_module_code", None)
+    try:
+        code = load_cached_code(path)
+    except (OSError, ValueError):
+        code = None
+    if run_code is None or code is None:
+        return runpy.run_path(path, run_name=run_name)
+    return run_code(code, None, run_name, pkg_name=run_name.rpartition(".")[0], script_name=path)
+
+# ----------------- Warm workers -----------------
+# Python mods run in a separate interpreter that was started ahead of time and
+# has already imported DLDSPT and the usual mod dependencies, so a launch only
+# costs a pipe write. Each worker runs one mod and exits (a mod can leave
+# anything behind in its interpreter); a fresh one is started in its place.
+# A worker shares the launcher's terminal, so interactive mods work as before.
+DEFAULT_WORKER_PRELOAD = ["json", "random", "rich", "rich.console", "rich.table", "requests"]
+
+class ModRunError(Exception):
+    """A mod failed inside a worker; error_info is the worker's traceback text."""
+    def __init__(self, error_info, usage=None):
+        super().__init__(error_info.strip().splitlines()[-1] if error_info.strip() else "mod failed")
+        self.error_info = error_info
+        self.usage = usage
+
+def worker_main(job_fd, result_fd):
+    """Entry point of a warm worker (DLDSPT.py --worker): preload, wait for one mod, run it."""
+    import signal
+    # Ctrl+C while idle is meant for the launcher or the running mod, not for us
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    for name in config.get("worker_preload", DEFAULT_WORKER_PRELOAD):
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass
+    with os.fdopen(job_fd, "r", encoding="utf-8") as jobs:
+        line = jobs.readline()
+    if not line:
+        # The launcher closed the pool
+        return 0
+    path = json.loads(line)["path"]
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    sys.argv = [sys.argv[0]]
+    result = {}
+    before = usage_snapshot()
+    namespace = None
+    try:
+        namespace = run_mod_path(path, run_name="__main__")
+    except SystemExit:
+        pass
+    except BaseException:
+        result["error"] = traceback.format_exc()
+    result["usage"] = usage_since(before)
+    # Finish up the way interpreter exit would: run the mod's atexit handlers,
+    # flush files it left open, then drop its globals so they get closed.
+    # Flushing first matters: when the collector frees a text file and its
+    # buffer together it can close the buffer first and lose the text
+    try:
+        atexit._run_exitfuncs()
+    except BaseException:
+        pass
+    for obj in gc.get_objects():
+        if isinstance(obj, io.IOBase):
+            try:
+                if not obj.closed:
+                    obj.flush()
+            except Exception:
+                pass
+    namespace = None
+    gc.collect()
+    try:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        with os.fdopen(result_fd, "w", encoding="utf-8") as out:
+            json.dump(result, out)
+    except Exception:
+        pass
+    # Don't wait for threads the mod left running; the run ends with its script
+    os._exit(0)
+
+class WorkerPool:
+    """
+    Warm worker interpreters waiting to run a Python mod each.
+    Usage:
+        pool = WorkerPool(size=1)
+        pool.start()
+        result = pool.run("Mods/example.py")  # {} or {"error": ...}; None if no worker was free
+        pool.stop()
+    """
+    def __init__(self, size=1):
+        self.size = size
+        self.idle = []
+        self.lock = threading.Lock()
+        self.stopped = False
+
+    def spawn(self):
+        job_r, job_w = os.pipe()
+        result_r, result_w = os.pipe()
+        try:
+            process = subprocess.Popen(
+                [sys.executable, os.path.abspath(__file__), "--worker", str(job_r), str(result_w)],
+                pass_fds=(job_r, result_w))
+        except Exception:
+            os.close(job_w)
+            os.close(result_r)
+            raise
+        finally:
+            os.close(job_r)
+            os.close(result_w)
+        return process, job_w, result_r
+
+    def discard(self, worker):
+        process, job_w, result_r = worker
+        for fd in (job_w, result_r):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        try:
+            process.wait(timeout=1)
+        except Exception:
+            process.kill()
+
+    def fill(self):
+        with self.lock:
+            while not self.stopped and len(self.idle) < self.size:
+                try:
+                    self.idle.append(self.spawn())
+                except Exception:
+                    break
+
+    def start(self):
+        threading.Thread(target=self.fill, daemon=True).start()
+
+    def take(self):
+        with self.lock:
+            while self.idle:
+                worker = self.idle.pop(0)
+                if worker[0].poll() is None:
+                    return worker
+                self.discard(worker)
+        return None
+
+    def run(self, path):
+        """Run a mod in a warm worker and wait for it. Returns the worker's result
+        dict ({"error": traceback} on failure), or None if no worker could take it."""
+        worker = self.take()
+        if worker is None:
+            return None
+        process, job_w, result_r = worker
+        try:
+            os.write(job_w, (json.dumps({"path": os.path.abspath(path)}) + "\n").encode("utf-8"))
+            os.close(job_w)
+        except OSError:
+            self.discard(worker)
+            return None
+        while True:
+            try:
+                process.wait()
+                break
+            except KeyboardInterrupt:
+                # The mod got the Ctrl+C as well; let it decide when to stop
+                continue
+        with os.fdopen(result_r, "r", encoding="utf-8") as f:
+            data = f.read()
+        self.start()
+        try:
+            return json.loads(data)
+        except ValueError:
+            return {"error": f"Mod worker exited with code {process.returncode}\n"}
+
+    def stop(self):
+        with self.lock:
+            self.stopped = True
+            idle, self.idle = self.idle, []
+        for worker in idle:
+            # Closing the job pipe makes an idle worker exit
+            self.discard(worker)
+
+worker_pool = None
+
+def start_worker_pool():
+    """Start the warm workers (not on Windows, which can't hand pipes to a child this way)."""
+    global worker_pool
+    size = int(config.get("warm_workers", 1) or 0)
+    if os.name == "nt" or size <= 0:
+        return None
+    worker_pool = WorkerPool(size)
+    worker_pool.start()
+    return worker_pool
+
+def run_mod(path):
+    """Run a Python mod file in a warm worker when the pool is up, otherwise in this
+    process. Returns the worker's resource usage, or None for an in-process run."""
+    if worker_pool is not None:
+        result = worker_pool.run(path)
+        if result is not None:
+            if result.get("error"):
+                raise ModRunError(result["error"], result.get("usage"))
+            return result.get("usage")
+    run_mod_path(path, run_name="__main__")
+    return None
+
 def run_script(path):
     """Run runnable mods or open view-only files appropriately."""
     global last_ran_mod, last_ran_path
@@ -1166,9 +2751,12 @@ def run_script(path):
         lower = path.lower()
         # DuckyLang
         if lower.endswith(".dkl"):
+            before = usage_snapshot()
             run_duckylang_script(None, None, script_path=path)
             duration = time.time() - start_time
-            log_run(mod_name, duration=duration)
+            usage = usage_since(before)
+            log_run(path, duration=duration, usage=usage)
+            record_mod_stats(path, duration, usage)
             add_recent_mod(path)
             update_last_run_time(path)
             input("Press Enter to return to DLDSPT Menu...")
@@ -1180,7 +2768,7 @@ def run_script(path):
             except Exception:
                 webbrowser.open(f"file://{os.path.abspath(path)}")
             duration = time.time() - start_time
-            log_run(mod_name, duration=duration, action="open")
+            log_run(path, duration=duration, action="open")
             add_recent_mod(path)
             update_last_run_time(path)
             input("Press Enter to return to DLDSPT Menu...")
@@ -1192,25 +2780,31 @@ def run_script(path):
             except Exception:
                 open_with_system_default(path)
             duration = time.time() - start_time
-            log_run(mod_name, duration=duration, action="open")
+            log_run(path, duration=duration, action="open")
             add_recent_mod(path)
             update_last_run_time(path)
             input("Press Enter to return to DLDSPT Menu...")
             return
         # Runnable python or other runpy
         elif lower.endswith(".py"):
+            before = usage_snapshot()
             try:
-                runpy.run_path(path, run_name="__main__")
+                usage = run_mod(path) or usage_since(before)
                 duration = time.time() - start_time
-                log_run(mod_name, duration=duration)
+                log_run(path, duration=duration, usage=usage)
+                record_mod_stats(path, duration, usage)
                 add_recent_mod(path)
                 update_last_run_time(path)
-            except Exception:
-                error_info = traceback.format_exc()
+            except Exception as e:
+                if isinstance(e, ModRunError):
+                    error_info, usage = e.error_info, e.usage
+                else:
+                    error_info, usage = traceback.format_exc(), usage_since(before)
                 duration = time.time() - start_time
                 print("\n⚠️ Error occurred while running the mod:\n")
                 print(error_info)
-                log_run(mod_name, error_info, duration)
+                log_run(path, error_info, duration, usage=usage)
+                record_mod_stats(path, duration, usage, failed=True)
                 add_recent_mod(path)
                 log_mod_error(path, error_info)
                 print("\nPlease report this issue in the Discord server or contact the mod author.")
@@ -1224,7 +2818,7 @@ def run_script(path):
             if lower.endswith((".txt", ".json")):
                 edit_file_menu_with_path(path)
                 duration = time.time() - start_time
-                log_run(mod_name, duration=duration, action="edit")
+                log_run(path, duration=duration, action="edit")
                 add_recent_mod(path)
                 update_last_run_time(path)
                 return
@@ -1234,7 +2828,7 @@ def run_script(path):
                 if not opened:
                     print("Could not open the file with system default.")
                 duration = time.time() - start_time
-                log_run(mod_name, duration=duration, action="open")
+                log_run(path, duration=duration, action="open")
                 add_recent_mod(path)
                 update_last_run_time(path)
                 input("Press Enter to return to DLDSPT Menu...")
@@ -1242,18 +2836,24 @@ def run_script(path):
 
     # If path is a directory, try to run its __main__.py
     if os.path.isdir(path):
+        before = usage_snapshot()
         try:
-            runpy.run_path(os.path.join(path, "__main__.py"), run_name="__main__")
+            usage = run_mod(os.path.join(path, "__main__.py")) or usage_since(before)
             duration = time.time() - start_time
-            log_run(mod_name, duration=duration)
+            log_run(path, duration=duration, usage=usage)
+            record_mod_stats(path, duration, usage)
             add_recent_mod(path)
             update_last_run_time(path)
-        except Exception:
-            error_info = traceback.format_exc()
+        except Exception as e:
+            if isinstance(e, ModRunError):
+                error_info, usage = e.error_info, e.usage
+            else:
+                error_info, usage = traceback.format_exc(), usage_since(before)
             duration = time.time() - start_time
             print("\n⚠️ Error occurred while running the mod:\n")
             print(error_info)
-            log_run(mod_name, error_info, duration)
+            log_run(path, error_info, duration, usage=usage)
+            record_mod_stats(path, duration, usage, failed=True)
             add_recent_mod(path)
             log_mod_error(path, error_info)
             print("\nPlease report this issue in the Discord server or contact the mod author.")
@@ -1263,6 +2863,342 @@ def run_script(path):
     print("\n--- Script finished ---")
     input("Press Enter to return to DLDSPT Menu...")
 
+# ----------------- Background jobs -----------------
+# Jobs run a mod in its own Python process (this file with --job), so a mod
+# that crashes or hangs can't take the launcher down. A fixed number of worker
+# threads, one per CPU, take jobs off a queue and wait on their process;
+# stdout/stderr go to files under mod_logs/jobs. Jobs get no stdin, so a mod
+# that asks for input fails instead of waiting forever.
+JOBS_DIR = os.path.join(MOD_LOGS_DIR, "jobs")
+JOB_OUTPUT_TAIL = 40
+
+def is_job_runnable(path):
+    return os.path.isdir(path) or path.lower().endswith((".py", ".dkl"))
+
+def run_job_target(path):
+    """Run one mod with no prompts or menu bookkeeping; returns the process exit code.
+    If DLDSPT_USAGE_FILE is set, the run's resource usage is written there as JSON."""
+    before = usage_snapshot()
+    try:
+        return run_job_mod(path)
+    finally:
+        usage_file = os.environ.get("DLDSPT_USAGE_FILE")
+        if usage_file:
+            try:
+                with open(usage_file, "w", encoding="utf-8") as f:
+                    json.dump(usage_since(before), f)
+            except Exception:
+                pass
+
+def run_job_mod(path):
+    try:
+        if path.lower().endswith(".dkl"):
+            import duckylang # pyright: ignore[reportMissingImports]
+            duckylang.run_duckylang(path, transpile=config.get("duckylang_transpile", True), pause=False)
+        elif os.path.isdir(path):
+            run_mod_path(os.path.join(path, "__main__.py"), run_name="__main__")
+        elif path.lower().endswith(".py"):
+            run_mod_path(path, run_name="__main__")
+        else:
+            print(f"Not a runnable mod: {path}", file=sys.stderr)
+            return 2
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except BaseException:
+        traceback.print_exc()
+        log_mod_error(path, traceback.format_exc())
+        return 1
+    return 0
+
+class JobRunner:
+    """
+    Queue of mods to run in worker processes, with per-job status and captured output.
+    Usage:
+        runner = JobRunner()
+        job_id = runner.submit(path)
+        for job in runner.list_jobs():
+            print(job["id"], job["name"], job["status"])
+        runner.cancel(job_id)
+    on_finish, if given, is called with a copy of each job once it has ended.
+    """
+    def __init__(self, workers=None, on_finish=None):
+        self.workers = workers or os.cpu_count() or 2
+        self.on_finish = on_finish
+        self.queue = queue.Queue()
+        self.jobs = {}
+        self.lock = threading.Lock()
+        self.next_id = 1
+        self.threads = []
+
+    def submit(self, path):
+        with self.lock:
+            job_id = self.next_id
+            self.next_id += 1
+            stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+            base = os.path.join(JOBS_DIR, f"{stamp}-{job_id}-{os.path.basename(path.rstrip(os.sep))}")
+            self.jobs[job_id] = {
+                "id": job_id, "path": path, "name": format_name(path), "status": "queued",
+                "started": None, "ended": None, "returncode": None,
+                "stdout": base + ".out", "stderr": base + ".err", "usage_file": base + ".usage.json",
+                "usage": None, "process": None
+            }
+            # Workers are started on first use and then stay around for later jobs
+            if len(self.threads) < self.workers:
+                t = threading.Thread(target=self.worker_loop, daemon=True)
+                t.start()
+                self.threads.append(t)
+        self.queue.put(job_id)
+        return job_id
+
+    def worker_loop(self):
+        while True:
+            job_id = self.queue.get()
+            with self.lock:
+                # A cancelled job may already have been cleared from the list
+                job = self.jobs.get(job_id)
+                if job is None or job["status"] != "queued":
+                    continue
+                job["status"] = "running"
+                job["started"] = time.time()
+            try:
+                os.makedirs(JOBS_DIR, exist_ok=True)
+                env = dict(os.environ, PYTHONUNBUFFERED="1", DLDSPT_USAGE_FILE=job["usage_file"])
+                with open(job["stdout"], "w", encoding="utf-8") as out, open(job["stderr"], "w", encoding="utf-8") as err:
+                    job["process"] = subprocess.Popen(
+                        [sys.executable, os.path.abspath(__file__), "--job", job["path"]],
+                        stdin=subprocess.DEVNULL, stdout=out, stderr=err, env=env)
+                    returncode = job["process"].wait()
+            except Exception as e:
+                returncode = None
+                job["error"] = str(e)
+            self.finish(job, returncode)
+
+    def finish(self, job, returncode):
+        with self.lock:
+            job["ended"] = time.time()
+            job["returncode"] = returncode
+            job["process"] = None
+            if job["status"] == "cancelling":
+                job["status"] = "cancelled"
+            elif returncode == 0:
+                job["status"] = "finished"
+            else:
+                job["status"] = "failed"
+            duration = job["ended"] - job["started"]
+            error = None
+            if job["status"] == "failed":
+                error = job.get("error") or "".join(self.read_output(job, "stderr")[-JOB_OUTPUT_TAIL:]) or f"exit code {returncode}"
+            job["error"] = error
+            try:
+                with open(job["usage_file"], "r", encoding="utf-8") as f:
+                    job["usage"] = json.load(f)
+                os.remove(job["usage_file"])
+            except Exception:
+                pass
+            # Same bookkeeping as a foreground run; under the lock so workers take turns on the state store connection
+            log_run(job["path"], error, duration, action="job", usage=job["usage"])
+            if job["status"] != "cancelled":
+                record_mod_stats(job["path"], duration, job["usage"], failed=job["status"] == "failed")
+            add_recent_mod(job["path"])
+            update_last_run_time(job["path"])
+            ended = dict(job)
+        if self.on_finish is not None:
+            self.on_finish(ended)
+
+    def cancel(self, job_id):
+        """Drop a queued job or kill a running one. Returns False if it already ended."""
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return False
+            if job["status"] == "queued":
+                job["status"] = "cancelled"
+                return True
+            if job["status"] != "running":
+                return False
+            job["status"] = "cancelling"
+            process = job["process"]
+        if process is not None:
+            try:
+                process.kill()
+            except Exception:
+                pass
+        return True
+
+    def cancel_all(self):
+        for job in self.list_jobs():
+            if job["status"] in ("queued", "running"):
+                self.cancel(job["id"])
+
+    def clear_finished(self):
+        with self.lock:
+            for job_id in [j for j, job in self.jobs.items() if job["status"] in ("finished", "failed", "cancelled")]:
+                del self.jobs[job_id]
+
+    def list_jobs(self):
+        with self.lock:
+            return [dict(job) for job in self.jobs.values()]
+
+    def counts(self):
+        totals = {}
+        for job in self.list_jobs():
+            totals[job["status"]] = totals.get(job["status"], 0) + 1
+        return totals
+
+    def read_output(self, job, stream):
+        try:
+            with open(job[stream], "r", encoding="utf-8", errors="replace") as f:
+                return f.readlines()
+        except Exception:
+            return []
+
+job_runner = None
+
+def get_job_runner():
+    global job_runner
+    if job_runner is None:
+        job_runner = JobRunner(config.get("job_workers"))
+    return job_runner
+
+def get_jobs_status():
+    """Short summary for the menu header, or None when there are no jobs."""
+    if job_runner is None:
+        return None
+    counts = job_runner.counts()
+    if not counts:
+        return None
+    return ", ".join(f"{n} {status}" for status, n in sorted(counts.items()))
+
+def format_job_time(job):
+    if job["started"] is None:
+        return "-"
+    return f"{(job['ended'] or time.time()) - job['started']:.1f}s"
+
+def queue_mod_jobs(paths):
+    runner = get_job_runner()
+    for path in paths:
+        if not is_job_runnable(path):
+            print(f"❌ {format_name(path)} can't run as a job (only Python and DuckyLang mods).")
+            continue
+        job_id = runner.submit(path)
+        print(f"Queued job {job_id}: {format_name(path)}")
+    input("Press Enter to continue...")
+
+def show_job_output(job):
+    print(f"\n--- Job {job['id']}: {job['name']} ({job['status']}) ---")
+    for stream in ("stdout", "stderr"):
+        lines = get_job_runner().read_output(job, stream)
+        print(f"\n[{stream}] {job[stream]}" + (f" (last {JOB_OUTPUT_TAIL} of {len(lines)} lines)" if len(lines) > JOB_OUTPUT_TAIL else ""))
+        print("".join(lines[-JOB_OUTPUT_TAIL:]).rstrip() or "(empty)")
+    input("\nPress Enter to continue...")
+
+def jobs_menu():
+    runner = get_job_runner()
+    while True:
+        clear_console()
+        jobs = runner.list_jobs()
+        if USE_RICH:
+            from rich.table import Table
+            table = Table(title=f"Jobs ({runner.workers} workers)", show_header=True, header_style="bold cyan")
+            for col in ("ID", "Mod", "Status", "Time", "Exit"):
+                table.add_column(col)
+            for job in jobs:
+                exit_code = "-" if job["returncode"] is None else str(job["returncode"])
+                table.add_row(str(job["id"]), job["name"], job["status"], format_job_time(job), exit_code)
+            console.print(table)
+        else:
+            print(f"--- Jobs ({runner.workers} workers) ---")
+            for job in jobs:
+                exit_code = "-" if job["returncode"] is None else job["returncode"]
+                print(f"{job['id']}. {job['name']} [{job['status']}] {format_job_time(job)} exit: {exit_code}")
+        if not jobs:
+            print("No jobs yet. Use 'bg <num>' in the main menu to run mods in the background.")
+        print("\no <id> View output | k <id> Cancel/kill | c Clear finished | Enter Refresh | b Back")
+        choice = input("Jobs: ").strip().lower()
+        parts = choice.split()
+        if choice == 'b':
+            return
+        if not parts:
+            continue
+        if parts[0] == 'c':
+            runner.clear_finished()
+        elif parts[0] in ('o', 'k') and len(parts) == 2 and parts[1].isdigit():
+            job = next((j for j in jobs if j["id"] == int(parts[1])), None)
+            if job is None:
+                print("❌ No such job.")
+                input("Press Enter to continue...")
+            elif parts[0] == 'o':
+                show_job_output(job)
+            elif not runner.cancel(job["id"]):
+                print("Job already ended.")
+                input("Press Enter to continue...")
+        else:
+            print("❌ Invalid input.")
+            input("Press Enter to continue...")
+
+# ----------------- Headless runs -----------------
+# `DLDSPT.py run [-j N] mod ...` runs mods without the menu or any prompts,
+# for scripts and CI. Each mod is a background job (its own process, output
+# under mod_logs/jobs), and every result is printed as one JSON line.
+def resolve_run_targets(patterns):
+    """Expand mod paths and glob patterns (tried as given, then inside the Mods folder)."""
+    import glob
+    mods_path = find_mods_folder()
+    targets = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern))
+        if not matches and mods_path and not os.path.isabs(pattern):
+            matches = sorted(glob.glob(os.path.join(mods_path, pattern)))
+        if glob.has_magic(pattern):
+            # A pattern may also match docs, images and so on; only keep mods
+            matches = [m for m in matches if is_job_runnable(m)]
+        targets.extend(matches or [pattern])
+    # Run each mod once even if several patterns match it
+    return list(dict.fromkeys(targets))
+
+def run_cli(argv):
+    """Entry point of the `run` subcommand; returns the process exit code."""
+    import argparse
+    parser = argparse.ArgumentParser(prog="DLDSPT.py run", description="Run mods without the menu and print JSON-lines results.")
+    parser.add_argument("mods", nargs="+", help="mod files, folders or glob patterns")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="mods to run at once (default 1)")
+    args = parser.parse_args(argv)
+
+    def emit(record):
+        print(json.dumps(record), flush=True)
+
+    results = queue.Queue()
+    runner = JobRunner(max(1, args.jobs), on_finish=results.put)
+    targets = resolve_run_targets(args.mods)
+    start_time = time.time()
+    failed = 0
+    pending = 0
+    for path in targets:
+        if not os.path.exists(path) or not is_job_runnable(path):
+            failed += 1
+            emit({"event": "result", "mod": format_name(path), "path": path, "status": "error",
+                  "returncode": None, "duration": 0.0,
+                  "error": "not found" if not os.path.exists(path) else "not a runnable mod"})
+            continue
+        runner.submit(path)
+        pending += 1
+    try:
+        while pending:
+            job = results.get()
+            pending -= 1
+            if job["status"] != "finished":
+                failed += 1
+            emit({"event": "result", "mod": job["name"], "path": job["path"], "status": job["status"],
+                  "returncode": job["returncode"], "duration": round(job["ended"] - job["started"], 3),
+                  "usage": job["usage"], "stdout": job["stdout"], "stderr": job["stderr"], "error": job.get("error")})
+    except KeyboardInterrupt:
+        runner.cancel_all()
+        emit({"event": "interrupted"})
+        return 130
+    emit({"event": "summary", "total": len(targets), "passed": len(targets) - failed,
+          "failed": failed, "duration": round(time.time() - start_time, 3)})
+    return 1 if failed else 0
+
 # ----------------- Main loop -----------------
 def main():
     mods_path = find_mods_folder()
@@ -1270,24 +3206,72 @@ def main():
         print("Mods folder not found.")
         return
 
+    run_first_run_checks()
+    load_rich()
+    start_version_check()
     sort_by = "name"
     py_files = list_mods(mods_path, sort_by)
     filter_text = None
+    page = 0
+    watcher = ModsWatcher(mods_path)
+    watcher.start(initial=py_files)
+    seen_version = watcher.version
+    start_worker_pool()
+    report_startup_time("menu")
 
     while True:
-        display_menu(py_files, filter_text, sort_by)
+        if watcher.version != seen_version:
+            seen_version = watcher.version
+            py_files = sort_mods(watcher.snapshot(), sort_by)
+        display_menu(py_files, filter_text, sort_by, page)
         choice = input("\nEnter choice: ").strip().lower()
 
         if choice == 'q':
             confirm = input("Are you sure you want to quit? (y/n): ").strip().lower()
             if confirm == 'y':
+                watcher.stop()
+                if job_runner is not None:
+                    # Don't leave job processes running behind the launcher
+                    job_runner.cancel_all()
+                if worker_pool is not None:
+                    worker_pool.stop()
                 print("Bye!")
                 break
             else:
                 continue
         elif choice == 'r':
-            py_files = list_mods(mods_path, sort_by)
+            py_files = sort_mods(watcher.sync(), sort_by)
+            seen_version = watcher.version
             filter_text = None
+            page = 0
+            continue
+        elif choice in ('n', 'p') or choice.startswith('page '):
+            filtered_files = py_files
+            if filter_text:
+                filtered_files = [f for f in py_files if filter_text.lower() in format_name(f).lower()]
+            if choice == 'n':
+                target = page + 1
+            elif choice == 'p':
+                target = page - 1
+            else:
+                try:
+                    target = int(choice.split()[1]) - 1
+                except ValueError:
+                    print("❌ Invalid page number.")
+                    input("Press Enter to continue...")
+                    continue
+            page = get_page_bounds(len(filtered_files), target, get_page_size())[0]
+            continue
+        elif choice == 'pagesize':
+            size = input("Rows per page (0 to show all): ").strip()
+            try:
+                config["page_size"] = max(0, int(size))
+                save_config(config)
+                page = 0
+                print("Page size updated.")
+            except ValueError:
+                print("❌ Invalid page size.")
+            input("Press Enter to continue...")
             continue
         elif choice == 'd':
             print(f"Opening Discord: {DISCORD_LINK}")
@@ -1323,19 +3307,23 @@ def main():
         #         sys.exit(1)
         elif choice == 's':
             filter_text = input("Enter search/filter text: ").strip()
+            page = 0
             continue
         elif choice == 'sort':
             sort_input = input("Sort by (name/date/size/favourites): ").strip().lower()
             if sort_input in ("name", "date", "size", "favourites"):
                 sort_by = sort_input
-                py_files = list_mods(mods_path, sort_by)
+                py_files = sort_mods(watcher.snapshot(), sort_by)
+                page = 0
             else:
                 print("❌ Invalid sort option.")
                 input("Press Enter to continue...")
             continue
         elif choice.startswith('ducky'):
             parts = choice.split()
-            if len(parts) == 2:
+            if len(parts) > 2:
+                run_duckylang_scripts(mods_path, parts[1:])
+            elif len(parts) == 2:
                 run_duckylang_script(mods_path, parts[1])
             else:
                 run_duckylang_script(mods_path)
@@ -1358,7 +3346,8 @@ def main():
             continue
         elif choice == 'create':
             create_file_menu()
-            py_files = list_mods(mods_path, sort_by)
+            py_files = sort_mods(watcher.sync(), sort_by)
+            seen_version = watcher.version
             continue
         elif choice == 'pin':
             idx = input("Enter mod number to pin/unpin: ").strip()
@@ -1388,6 +3377,54 @@ def main():
         elif choice == 'theme':
             set_theme()
             continue
+        elif choice == 'scan':
+            set_scan_options()
+            # Scan settings change which folders are walked/watched, so start fresh
+            watcher.stop()
+            py_files = list_mods(mods_path, sort_by)
+            watcher = ModsWatcher(mods_path)
+            watcher.start(initial=py_files)
+            seen_version = watcher.version
+            continue
+        elif choice == 'jobs':
+            jobs_menu()
+            continue
+        elif choice == 'bg' or choice.startswith('bg '):
+            parts = choice.split()
+            filtered_files = py_files
+            if filter_text:
+                filtered_files = [f for f in py_files if filter_text.lower() in format_name(f).lower()]
+            if len(parts) < 2 or not all(p.isdigit() and 1 <= int(p) <= len(filtered_files) for p in parts[1:]):
+                print("❌ Usage: bg <mod number> [more numbers...]")
+                input("Press Enter to continue...")
+                continue
+            queue_mod_jobs([filtered_files[int(p) - 1] for p in parts[1:]])
+            continue
+        elif choice == 'profile':
+            toggle_duckylang_profiling()
+            continue
+        elif choice == 'config export':
+            export_config()
+            continue
+        elif choice == 'config import':
+            import_config()
+            continue
+        elif choice == 'history':
+            history_menu()
+            continue
+        elif choice == 'stats' or choice.startswith('stats '):
+            parts = choice.split()
+            filtered_files = py_files
+            if filter_text:
+                filtered_files = [f for f in py_files if filter_text.lower() in format_name(f).lower()]
+            if len(parts) == 2 and parts[1].isdigit() and 1 <= int(parts[1]) <= len(filtered_files):
+                show_mod_stats(filtered_files[int(parts[1]) - 1])
+            elif len(parts) == 1:
+                show_mod_stats()
+            else:
+                print("❌ Usage: stats [mod number]")
+                input("Press Enter to continue...")
+            continue
         elif choice == 'fav':
             idx = input("Enter mod number to favourite/unfavourite: ").strip()
             filtered_files = py_files
@@ -1442,8 +3479,18 @@ def main():
             input("Press Enter to continue...")
 
 if __name__ == "__main__":
-    install_dependencies()
+    if len(sys.argv) > 2 and sys.argv[1] == "--job":
+        # Worker process for a background job
+        sys.exit(run_job_target(sys.argv[2]))
+    if len(sys.argv) > 3 and sys.argv[1] == "--worker":
+        # Warm worker waiting to run a mod for the menu
+        sys.exit(worker_main(int(sys.argv[2]), int(sys.argv[3])))
+    if len(sys.argv) > 1 and sys.argv[1] == "run":
+        # Headless batch run: no menu, no prompts, JSON lines on stdout
+        sys.exit(run_cli(sys.argv[2:]))
     if len(sys.argv) > 1:
+        # The mod may need these right away, so check (cheaply) before running it
+        install_dependencies()
         # If passed a file path as CLI argument, resolve and run/open it
         cli_target = sys.argv[1]
         if not os.path.isabs(cli_target):
@@ -1452,9 +3499,11 @@ if __name__ == "__main__":
                 candidate = os.path.join(mp, cli_target)
                 if os.path.exists(candidate):
                     cli_target = candidate
+        report_startup_time("run_script")
         try:
             run_script(cli_target)
         except Exception as e:
             print(f"Error running mod from CLI: {e}")
     else:
+        start_dependency_check()
         main()
\ No newline at end of file
@@ -10,6 +10,16 @@ Commands:
     input <var>
     if <var> <op> <value> then <command>
     while <var> <op> <value> do <command>
+    # Block forms (nothing after then/do), closed by end:
+    if <var> <op> <value> then
+        ...
+    else
+        ...
+    end
+    while <var> <op> <value> do
+        ...
+    end
+    (a while loop reads <value> once, when the loop starts)
     sleep <seconds>
     random <var> <min> <max>
     len <var> <text>
@@ -47,6 +57,10 @@ Commands:
     write <filename> <text>
     appendfile <filename> <text>
     exists <var> <filename>
+    readline <var> <filename>          (next line, 0 at end of file)
+    readchunk <var> <filename> <size>  (next <size> characters, 0 at end of file)
+    flush [filename]                   (write out buffered output now)
+    close <filename>                   (flush; readline/readchunk start over)
     # Math:
     pow <var> <base> <exp>
     sqrt <var> <value>
@@ -62,6 +76,14 @@ Commands:
     inputint <var>
     inputfloat <var>
     inputstr <var>
+    # Vector commands (a whole numeric list in one native pass):
+    vadd <var> <listvar> <value/listvar>
+    vsub <var> <listvar> <value/listvar>
+    vmul <var> <listvar> <value/listvar>
+    vdiv <var> <listvar> <value/listvar>
+    vmap <var> <listvar> <abs|neg|square|sqrt|floor|ceil|round|int|float>
+    vfilter <var> <listvar> <op> <value>
+    vcumsum <var> <listvar>
     # More can be added!
 Example:
     set x 5
@@ -76,12 +98,28 @@ Example:
     getkey v d a
     print v
     exit
+Scripts over 8 MB (or any script run with --stream) are executed while they
+are read, so a whole if/while block must fit in the look-back buffer.
+Several scripts given at once run concurrently on one asyncio event loop,
+where sleep and input wait without blocking the others.
 """
 
 import time
 import random
 import math
 import os
+import json
+import io
+import sys
+import hashlib
+import marshal
+import operator
+import asyncio
+import threading
+import concurrent.futures
+from array import array
+from itertools import accumulate, repeat
+from enum import IntEnum
 
 def parse_val(val, vars):
     try:
@@ -101,231 +139,1806 @@ def eval_cond(a, op, b):
     if op == "<=": return a <= b
     return False
 
-def run_duckylang(filename):
-    vars = {}
+# ----------------- Compiler -----------------
+# A .dkl file is compiled once into a list of pre-decoded instructions
+# (opcode, operands, line number) which a dispatch table then executes, instead
+# of re-splitting and re-matching every line each time it runs. if/while become
+# conditional jumps, so loops run in place without growing the program.
+
+class DuckyLangBudgetError(Exception):
+    """Raised when a script runs more instructions than its budget allows."""
+
+class DuckyLangSyntaxError(Exception):
+    pass
+
+class Op(IntEnum):
+    SET = 0
+    ADD = 1
+    SUB = 2
+    MUL = 3
+    DIV = 4
+    PRINT = 5
+    INPUT = 6
+    SLEEP = 7
+    RANDOM = 8
+    LEN = 9
+    CONCAT = 10
+    UPPER = 11
+    LOWER = 12
+    TITLE = 13
+    REVERSE = 14
+    SPLIT = 15
+    JOIN = 16
+    LIST = 17
+    APPEND = 18
+    POP = 19
+    GET = 20
+    SETITEM = 21
+    FIND = 22
+    REPLACE = 23
+    COUNT = 24
+    RANGE = 25
+    SUM = 26
+    MAX = 27
+    MIN = 28
+    SORT = 29
+    SHUFFLE = 30
+    DICT = 31
+    GETKEY = 32
+    SETKEY = 33
+    KEYS = 34
+    VALUES = 35
+    DELKEY = 36
+    READ = 37
+    WRITE = 38
+    APPENDFILE = 39
+    EXISTS = 40
+    POW = 41
+    SQRT = 42
+    ABS = 43
+    MOD = 44
+    SYSTEM = 45
+    NOT = 46
+    AND = 47
+    OR = 48
+    INPUTINT = 49
+    INPUTFLOAT = 50
+    INPUTSTR = 51
+    EXIT = 52
+    ERROR = 53
+    # set/add/sub/mul with a numeric literal operand
+    SET_CONST = 54
+    ADD_CONST = 55
+    SUB_CONST = 56
+    MUL_CONST = 57
+    VADD = 58
+    VSUB = 59
+    VMUL = 60
+    VDIV = 61
+    VMAP = 62
+    VFILTER = 63
+    VCUMSUM = 64
+    READLINE = 65
+    READCHUNK = 66
+    FLUSH = 67
+    CLOSE = 68
+    # Turns arrays left by v* commands back into lists (see vector_targets)
+    UNPACK = 69
+    IF = 70
+    WHILE = 71
+    LOOP = 72
+    JUMP = 73
+
+# Control-flow opcodes (IF and later) are handled by the executor itself, not HANDLERS
+CONTROL_OPS_START = Op.IF
+
+# Returned by a handler to stop the program (the exit command)
+HALT = object()
+
+COND_OPS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    "<": operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le
+}
+
+def never(a, b):
+    return False
+
+# ----------------- Variable frame -----------------
+# Variable names are resolved to numbered slots while compiling; at run time
+# values live in a flat list indexed by slot, so no operand needs a dict
+# lookup or a parse attempt. A slot that was never assigned holds UNSET.
+UNSET = object()
+
+class Frame:
+    """
+    Variables of one running script: a name -> slot table filled by the
+    compiler, plus the list of values indexed by slot.
+    Usage:
+        frame = Frame()
+        program = compile_duckylang(read_source("script.dkl"), frame)
+        run_program(program, frame)
+        print(frame.as_dict())
+    """
+    def __init__(self):
+        self.slots = {}
+        self.values = []
+        # Variables v* commands write, which may hold an array instead of a list
+        self.vectors = set()
+        self.files = FileCache()
+
+    def slot(self, name):
+        """Return the slot for name, allocating an unset one the first time."""
+        i = self.slots.get(name)
+        if i is None:
+            i = self.slots[name] = len(self.values)
+            self.values.append(UNSET)
+        return i
+
+    def get(self, name, default=None):
+        """Look a variable up by name (for values only known at run time, like input)."""
+        i = self.slots.get(name)
+        if i is None:
+            return default
+        v = unpacked(self.values, i)
+        return default if v is UNSET else v
+
+    def as_dict(self):
+        unpack_vectors(self.values, self.slots.values())
+        return {name: self.values[i] for name, i in self.slots.items() if self.values[i] is not UNSET}
+
+    def close(self):
+        """Flush and close the script's files; call once the script has stopped."""
+        self.files.close()
+
+# ----------------- File cache -----------------
+# File commands share one FileCache per script, so a logging loop doesn't
+# open and close its file on every line.
+FILE_BUFFER_SIZE = 64 * 1024
+FILE_CACHE_MAX_OPEN = 32
+
+class FileCache:
+    """
+    Open files of one script. appendfile goes through a buffered handle kept
+    open between commands; write (which replaces the whole file) only keeps
+    the latest content until the file is flushed; readline/readchunk carry on
+    from a read handle kept per file. Anything that reads a file, and system,
+    flushes pending output first, so scripts see what they wrote.
+    Usage:
+        files = FileCache()
+        files.append("log.txt", "hello\n")
+        line = files.readline("log.txt")
+        files.close()
+    """
+    def __init__(self):
+        self.pending = {}  # path -> content of the last 'write'
+        self.writers = {}  # path -> append handle
+        self.readers = {}  # path -> read handle
+
+    def key(self, path):
+        return os.path.abspath(path)
+
+    def sync(self, key):
+        """Put everything buffered for one file on disk."""
+        if key in self.pending:
+            with open(key, "w", encoding="utf-8") as f:
+                f.write(self.pending.pop(key))
+        writer = self.writers.get(key)
+        if writer is not None:
+            writer.flush()
+
+    def make_room(self, handles):
+        # Least recently opened first (dicts keep insertion order)
+        while len(handles) >= FILE_CACHE_MAX_OPEN:
+            key = next(iter(handles))
+            handles.pop(key).close()
+
+    def write(self, path, text):
+        key = self.key(path)
+        writer = self.writers.pop(key, None)
+        if writer is not None:
+            writer.close()
+        self.pending[key] = text
+
+    def append(self, path, text):
+        key = self.key(path)
+        writer = self.writers.get(key)
+        if writer is None:
+            self.sync(key)
+            self.make_room(self.writers)
+            writer = self.writers[key] = open(key, "a", encoding="utf-8", buffering=FILE_BUFFER_SIZE)
+        writer.write(text)
+
+    def read(self, path):
+        key = self.key(path)
+        self.sync(key)
+        with open(key, "r", encoding="utf-8") as f:
+            return f.read()
+
+    def exists(self, path):
+        key = self.key(path)
+        self.sync(key)
+        return os.path.exists(key)
+
+    def reader(self, path):
+        key = self.key(path)
+        self.sync(key)
+        reader = self.readers.get(key)
+        if reader is None:
+            self.make_room(self.readers)
+            reader = self.readers[key] = open(key, "r", encoding="utf-8")
+        return reader
+
+    def readline(self, path):
+        line = self.reader(path).readline()
+        return line.rstrip("\n") if line else 0
+
+    def readchunk(self, path, size):
+        chunk = self.reader(path).read(size)
+        return chunk if chunk else 0
+
+    def flush(self, path=None):
+        for key in ([self.key(path)] if path is not None else set(self.pending) | set(self.writers)):
+            try:
+                self.sync(key)
+            except Exception:
+                pass
+
+    def close(self, path=None):
+        self.flush(path)
+        for handles in (self.writers, self.readers):
+            for key in ([self.key(path)] if path is not None else list(handles)):
+                handle = handles.pop(key, None)
+                if handle is not None:
+                    try:
+                        handle.close()
+                    except Exception:
+                        pass
+
+def literal(tok):
+    """Parse a numeric literal the way parse_val does; returns (True, value) or (False, None)."""
+    try:
+        return True, int(tok)
+    except ValueError:
+        try:
+            return True, float(tok)
+        except ValueError:
+            return False, None
+
+def operand(tok, frame):
+    """Classify a token once: (True, number, None) for a constant, otherwise
+    (False, slot, name); an unset variable reads as its own name."""
+    is_const, value = literal(tok)
+    return (True, value, None) if is_const else (False, frame.slot(tok), tok)
+
+def get_val(values, opnd):
+    is_const, v, name = opnd
+    if is_const:
+        return v
+    v = values[v]
+    return name if v is UNSET else v
+
+def lookup(values, slot, default):
+    v = values[slot]
+    return default if v is UNSET else v
+
+# Fixed argument counts per command; anything else on that line is ignored (as before)
+ARITY = {
+    "set": 2, "add": 2, "sub": 2, "mul": 2, "div": 2,
+    "random": 3, "len": 2, "concat": 3,
+    "upper": 2, "lower": 2, "title": 2, "reverse": 2, "split": 3, "join": 3,
+    "append": 2, "pop": 1, "get": 3, "setitem": 3,
+    "find": 3, "replace": 4, "count": 3, "range": 3,
+    "sum": 2, "max": 2, "min": 2, "sort": 1, "shuffle": 1,
+    "getkey": 3, "setkey": 3, "keys": 2, "values": 2, "delkey": 2,
+    "read": 2, "write": 2, "appendfile": 2, "exists": 2,
+    "pow": 3, "sqrt": 2, "abs": 2, "mod": 3,
+    "not": 2, "and": 3, "or": 3,
+    "inputint": 1, "inputfloat": 1, "inputstr": 1,
+    "vadd": 3, "vsub": 3, "vmul": 3, "vdiv": 3, "vmap": 3, "vfilter": 4, "vcumsum": 2,
+    "readline": 2, "readchunk": 3, "close": 1
+}
+
+# Which arguments are values (variable or number) vs. variable names vs. plain text
+NAME_ARGS = {
+    "join": (0, 1), "get": (0, 1), "sum": (0, 1), "max": (0, 1), "min": (0, 1),
+    "getkey": (0, 1), "keys": (0, 1), "values": (0, 1),
+    "write": (), "appendfile": (), "close": (),
+    "vadd": (0, 1), "vsub": (0, 1), "vmul": (0, 1), "vdiv": (0, 1),
+    "vmap": (0, 1), "vfilter": (0, 1), "vcumsum": (0, 1)
+}
+
+VALUE_ARGS = {
+    "set": (1,), "add": (1,), "sub": (1,), "mul": (1,), "div": (1,),
+    "upper": (1,), "lower": (1,), "title": (1,), "reverse": (1,), "split": (1,),
+    "append": (1,), "get": (2,), "setitem": (1, 2),
+    "find": (1,), "replace": (1,), "count": (1,), "range": (1, 2),
+    "setkey": (2,), "write": (1,), "appendfile": (1,),
+    "pow": (1, 2), "sqrt": (1,), "abs": (1,), "mod": (1, 2),
+    "not": (1,), "and": (1, 2), "or": (1, 2),
+    "vadd": (2,), "vsub": (2,), "vmul": (2,), "vdiv": (2,), "vfilter": (3,),
+    "readchunk": (2,)
+}
+
+# Commands whose handler also gets the script's FileCache as its last operand
+FILE_COMMANDS = {"read", "write", "appendfile", "exists", "readline", "readchunk", "close"}
+
+CONST_OPS = {"set": Op.SET_CONST, "add": Op.ADD_CONST, "sub": Op.SUB_CONST, "mul": Op.MUL_CONST}
+
+def compile_into(program, line, lineno, blocks, frame, inline=False):
+    """Compile one source line, appending its instruction(s) to program.
+    inline is True for the command after a single-line 'then'/'do'."""
+    parts = line.split()
+    if not parts:
+        return
+    cmd = parts[0].lower()
+    args = parts[1:]
+    if cmd in ("if", "while"):
+        keyword = "then" if cmd == "if" else "do"
+        if keyword not in args:
+            return
+        if len(args) < 3:
+            program.append((Op.ERROR, (IndexError("list index out of range"),), lineno))
+            return
+        idx = args.index(keyword)
+        unpack = unpack_instruction(args[:idx], frame, lineno)
+        if unpack is not None:
+            program.append(unpack)
+        cond = (frame.slot(args[0]), COND_OPS.get(args[1], never), operand(args[2], frame))
+        body_text = " ".join(args[idx + 1:])
+        start = len(program)
+        # Jump target (last operand) is patched once the end of the body is known
+        program.append((Op.IF if cmd == "if" else Op.WHILE, cond + (None,), lineno))
+        if not body_text:
+            if inline:
+                # Nested empty body: crashed in the old interpreter too
+                program[start] = (Op.ERROR, (IndexError("list index out of range"),), lineno)
+                return
+            # Multi-line block, closed by 'end'
+            blocks.append((cmd, start, lineno))
+            return
+        compile_into(program, body_text, lineno, blocks, frame, inline=True)
+        close_block(program, cmd, start, lineno)
+        return
+    if cmd == "else" and not args and not inline:
+        if not blocks or blocks[-1][0] != "if":
+            raise DuckyLangSyntaxError(f"line {lineno}: 'else' without a matching 'if ... then'")
+        _kind, start, open_line = blocks.pop()
+        # End of the 'then' part jumps over the else part; the if's false branch lands here
+        program.append((Op.JUMP, (None,), lineno))
+        patch_target(program, start, len(program))
+        blocks.append(("else", len(program) - 1, open_line))
+        return
+    if cmd == "end" and not args and not inline:
+        if not blocks:
+            raise DuckyLangSyntaxError(f"line {lineno}: 'end' without an open block")
+        kind, start, _open_line = blocks.pop()
+        close_block(program, kind, start, lineno)
+        return
+    ins = compile_line(cmd, args, lineno, frame)
+    if ins is not None:
+        unpack = None if cmd in VECTOR_COMMANDS else unpack_instruction(args, frame, lineno)
+        if unpack is not None:
+            program.append(unpack)
+        program.append(ins)
+
+def patch_target(program, pc, target):
+    op, args, lineno = program[pc]
+    program[pc] = (op, args[:-1] + (target,), lineno)
+
+def close_block(program, kind, start, lineno):
+    if kind == "while":
+        # Back-edge: re-test the condition against the limit read at loop entry
+        op, (var, cmp, value, _target), open_line = program[start]
+        if start and program[start - 1][0] == Op.UNPACK:
+            # The body may have left an array in the loop variable before the re-test
+            program.append(program[start - 1])
+        program.append((Op.LOOP, (var, cmp, start, start + 1), lineno))
+        # Straight-line bodies also get a (handler, args) list so the executor can
+        # run the whole loop without going through the jump instructions
+        body = program[start + 1:-1]
+        fast_body = None
+        if all(ins[0] < CONTROL_OPS_START for ins in body):
+            fast_body = tuple((HANDLERS[ins[0]], ins[1]) for ins in body)
+        program[start] = (op, (var, cmp, value, fast_body, len(program)), open_line)
+        return
+    patch_target(program, start, len(program))
+
+def compile_line(cmd, args, lineno, frame):
+    """Compile one plain (non-block) command into an instruction, or None if it does nothing."""
+    if cmd == "print":
+        return (Op.PRINT, (frame.slot(args[0]), " ".join(args)), lineno) if args else None
+    if cmd == "input":
+        # The typed text may name any variable, so it is resolved through the frame
+        return (Op.INPUT, (frame.slot(args[0]), args[0], frame), lineno) if args else None
+    if cmd == "sleep":
+        if not args:
+            return None
+        try:
+            return (Op.SLEEP, (float(args[0]),), lineno)
+        except ValueError:
+            return None
+    if cmd == "random":
+        if len(args) != 3:
+            return None
+        try:
+            return (Op.RANDOM, (frame.slot(args[0]), int(args[1]), int(args[2])), lineno)
+        except ValueError:
+            return None
+    if cmd == "len":
+        # Operates on the literal text, so the result is known at compile time
+        return (Op.LEN, (frame.slot(args[0]), len(str(args[1]))), lineno) if len(args) == 2 else None
+    if cmd == "concat":
+        return (Op.CONCAT, (frame.slot(args[0]), str(args[1]) + str(args[2])), lineno) if len(args) == 3 else None
+    if cmd == "list":
+        if len(args) < 2:
+            return None
+        return (Op.LIST, (frame.slot(args[0]), tuple(operand(a, frame) for a in args[1:])), lineno)
+    if cmd == "dict":
+        if len(args) < 3 or len(args) % 2 != 1:
+            return None
+        items = tuple((k, operand(v, frame)) for k, v in zip(args[1::2], args[2::2]))
+        return (Op.DICT, (frame.slot(args[0]), items), lineno)
+    if cmd == "system":
+        return (Op.SYSTEM, (" ".join(args), frame.files), lineno) if args else None
+    if cmd == "flush":
+        return (Op.FLUSH, (args[0] if args else None, frame.files), lineno)
+    if cmd == "exit":
+        return (Op.EXIT, (), lineno)
+    if cmd in ("inputint", "inputfloat", "inputstr"):
+        # The prompt shows the variable name
+        return (Op[cmd.upper()], (frame.slot(args[0]), args[0]), lineno) if len(args) == 1 else None
+    if cmd in ARITY:
+        if len(args) != ARITY[cmd]:
+            return None
+        value_args = VALUE_ARGS.get(cmd, ())
+        name_args = NAME_ARGS.get(cmd, (0,))
+        decoded = tuple(operand(a, frame) if i in value_args else frame.slot(a) if i in name_args else a
+                        for i, a in enumerate(args))
+        if cmd in CONST_OPS and decoded[1][0]:
+            return (CONST_OPS[cmd], (decoded[0], decoded[1][1]), lineno)
+        if cmd in FILE_COMMANDS:
+            decoded += (frame.files,)
+        if cmd in VECTOR_COMMANDS:
+            # Whether the result may stay an array (not in streamed scripts)
+            decoded += (args[0] in frame.vectors,)
+        return (Op[cmd.upper()], decoded, lineno)
+    # Unknown commands are ignored
+    return None
+
+def compile_duckylang(lines, frame):
+    """Compile (lineno, text) pairs into a program (list of instructions),
+    allocating variable slots in frame."""
+    lines = list(lines)
+    frame.vectors |= vector_targets(lines)
+    program = []
+    blocks = []
+    for lineno, line in lines:
+        compile_into(program, line, lineno, blocks, frame)
+    if blocks:
+        raise_unclosed(blocks)
+    return finalize_program(program)
+
+def raise_unclosed(blocks):
+    kind, _start, open_line = blocks[-1]
+    raise DuckyLangSyntaxError(f"line {open_line}: '{'if' if kind == 'else' else kind}' block is missing 'end'")
+
+def finalize_program(program):
+    # Plain ints compare faster than enum members in the executor loop
+    return [(int(op), args, lineno) for op, args, lineno in program]
+
+def iter_source(f):
+    """Yield (lineno, text) for each statement line of an open script file."""
+    for n, line in enumerate(f, 1):
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield n, line
+
+def read_source(filename):
     with open(filename, "r", encoding="utf-8") as f:
-        lines = [line.strip() for line in f if line.strip() and not line.strip().startswith("#")]
-    i = 0
-    while i < len(lines):
-        line = lines[i]
+        return list(iter_source(f))
+
+# ----------------- Streaming compiler -----------------
+# Scripts larger than this are streamed instead of compiled up front
+STREAM_THRESHOLD = 8 * 1024 * 1024
+# Straight-line code is executed in chunks that double up to this size,
+# so the first statement runs as soon as it has been read
+STREAM_CHUNK_MAX = 1024
+# Jumps never leave their block, so only open blocks are buffered; this
+# bounds how many instructions a single top-level block may hold
+STREAM_MAX_BLOCK = 100000
+
+def stream_program(lines, frame, max_block=STREAM_MAX_BLOCK):
+    """Compile (lineno, text) pairs lazily, yielding runnable program chunks.
+
+    Top-level statements are yielded in small batches; an if/while block
+    is held back until its matching 'end' and yielded whole, so every jump
+    target lives in the same chunk as its jump.
+    """
+    program = []
+    blocks = []
+    chunk_size = 1
+    for lineno, line in lines:
+        compile_into(program, line, lineno, blocks, frame)
+        if blocks:
+            if len(program) > max_block:
+                _kind, _start, open_line = blocks[0]
+                raise DuckyLangSyntaxError(
+                    f"line {open_line}: block is longer than {max_block} instructions, too large to stream")
+        elif len(program) >= chunk_size:
+            yield finalize_program(program)
+            program = []
+            chunk_size = min(chunk_size * 2, STREAM_CHUNK_MAX)
+    if blocks:
+        raise_unclosed(blocks)
+    if program:
+        yield finalize_program(program)
+
+# ----------------- Vector operations -----------------
+# The v* commands work on a whole list variable at once. When NumPy is
+# installed, a big list of all ints (that fit in 64 bits) or all floats is
+# packed into an array.array ('q' or 'd') and the result stays an array in its
+# variable, so a chain of v* commands never goes back through Python lists:
+# NumPy computes on a zero-copy view of the array's buffer, as long as the
+# result is provably the same as Python's (int64 maths that could overflow, or
+# comparisons that could lose precision, take the Python path). Without NumPy
+# the maths runs on Python numbers either way, so lists stay lists rather than
+# paying for a conversion on every command.
+# The compiler knows which variables v* commands write (vector_targets); any
+# other command naming one of them is preceded by an UNPACK instruction that
+# turns an array back into a list, so the rest of the language only sees lists.
+VECTOR_COMMANDS = ("vadd", "vsub", "vmul", "vdiv", "vmap", "vfilter", "vcumsum")
+VECTOR_NUMPY_MIN = 1000
+INT64_LIMIT = 2 ** 63
+# Integers up to this size convert to float64 exactly
+FLOAT_EXACT_INT = 2 ** 53
+NUMPY_TYPES = {"q": "int64", "d": "float64"}
+numpy_module = None
+numpy_checked = False
+
+def load_numpy():
+    """Import NumPy the first time a large vector needs it; None if it is not installed."""
+    global numpy_module, numpy_checked
+    if not numpy_checked:
+        numpy_checked = True
+        try:
+            import numpy
+            numpy_module = numpy
+        except ImportError:
+            numpy_module = None
+    return numpy_module
+
+def vector_targets(lines):
+    """Names of the variables v* commands write in (lineno, text) pairs,
+    including commands run by a single-line if/while."""
+    names = set()
+    for _lineno, line in lines:
         parts = line.split()
+        while len(parts) > 1 and parts[0].lower() in ("if", "while"):
+            keyword = "then" if parts[0].lower() == "if" else "do"
+            if keyword not in parts:
+                break
+            parts = parts[parts.index(keyword) + 1:]
+        if len(parts) > 1 and parts[0].lower() in VECTOR_COMMANDS:
+            names.add(parts[1])
+    return names
+
+def unpack_instruction(tokens, frame, lineno):
+    """An UNPACK for the variables among tokens that a v* command may have
+    left as an array, or None if there are none."""
+    if not frame.vectors:
+        return None
+    slots = tuple(frame.slot(t) for t in dict.fromkeys(tokens) if t in frame.vectors)
+    return (Op.UNPACK, (slots,), lineno) if slots else None
+
+def unpack_vectors(values, slots):
+    """Turn the arrays stored in these slots back into lists."""
+    for slot in slots:
+        v = values[slot]
+        if type(v) is array:
+            values[slot] = v.tolist()
+
+def unpacked(values, slot):
+    unpack_vectors(values, (slot,))
+    return values[slot]
+
+def to_vector(v):
+    """An array for a big list of all ints (that fit in 64 bits) or all floats
+    when NumPy is installed, the list itself for any other list of numbers,
+    None if v is not one. An array left by an earlier v* command is returned
+    as it is."""
+    if type(v) is array:
+        return v
+    if not isinstance(v, list):
+        return None
+    kinds = set(map(type, v))
+    if not kinds <= {int, float}:
+        return None
+    # Mixed lists stay lists so their ints stay ints
+    if len(kinds) != 1 or len(v) < VECTOR_NUMPY_MIN or load_numpy() is None:
+        return v
+    return pack("q" if int in kinds else "d", v) or v
+
+def pack(typecode, items):
+    """array(typecode, items), or None if an int does not fit in 64 bits."""
+    try:
+        return array(typecode, items)
+    except OverflowError:
+        return None
+
+def store_vector(keep_array, result):
+    # Streamed scripts aren't scanned for vector_targets, so they get lists
+    return result if keep_array or type(result) is not array else result.tolist()
+
+def numpy_view(vec):
+    """A zero-copy NumPy view of a big array, or None to take the Python path."""
+    if type(vec) is not array or len(vec) < VECTOR_NUMPY_MIN or load_numpy() is None:
+        return None
+    return numpy_module.frombuffer(vec, dtype=NUMPY_TYPES[vec.typecode])
+
+def from_numpy(out):
+    vec = array("q" if out.dtype.kind == "i" else "d")
+    vec.frombytes(memoryview(numpy_module.ascontiguousarray(out)).cast("B"))
+    return vec
+
+def magnitude(x):
+    """Largest absolute value of an int64 view or an int, as a Python int (0 for floats)."""
+    if type(x) in (int, float):
+        return abs(x) if type(x) is int else 0
+    if x.dtype.kind != "i" or not len(x):
+        return 0
+    return max(abs(int(x.max())), abs(int(x.min())))
+
+def is_int_operand(x):
+    return type(x) is int if type(x) in (int, float) else x.dtype.kind == "i"
+
+def numpy_binary_ok(fn, src, other):
+    """True if fn(src, other) in NumPy gives exactly what Python would."""
+    if type(other) is int and magnitude(other) >= INT64_LIMIT:
+        return False
+    if not (is_int_operand(src) and is_int_operand(other)):
+        # Float results: float64 is Python's float
+        return True
+    a, b = magnitude(src), magnitude(other)
+    if fn is operator.mul:
+        return a * b < INT64_LIMIT
+    if fn is operator.floordiv:
+        # Only -2**63 // -1 leaves int64
+        return a < INT64_LIMIT
+    return a + b < INT64_LIMIT
+
+def binary_result(fn, src, other, scalar):
+    view = numpy_view(src)
+    if view is not None:
+        other_view = other if scalar else numpy_view(other)
+        if other_view is not None and numpy_binary_ok(fn, view, other_view):
+            # Python gives inf/nan without a warning too
+            with numpy_module.errstate(all="ignore"):
+                return from_numpy(fn(view, other_view))
+    result = None
+    if type(src) is array and (scalar or type(other) is array):
+        # int op int stays int; anything with a float gives floats
+        both_int = src.typecode == "q" and (type(other) is int if scalar else other.typecode == "q")
+        result = pack("q" if both_int else "d", map(fn, src, repeat(other, len(src)) if scalar else other))
+    if result is None:
+        result = list(map(fn, src, repeat(other, len(src)) if scalar else other))
+    return result
+
+def vector_binary(values, a, fn):
+    """Elementwise fn(listvar, value) where value is a number or a list of the same length."""
+    src = to_vector(lookup(values, a[1], None))
+    if src is None:
+        return
+    other = get_val(values, a[2])
+    scalar = type(other) in (int, float)
+    if not scalar:
+        other = to_vector(other)
+        if other is None or len(other) != len(src):
+            return
+    if fn is operator.floordiv and (other == 0 if scalar else 0 in other):
+        print("Division by zero!")
+        return
+    values[a[0]] = store_vector(a[3], binary_result(fn, src, other, scalar))
+
+VMAP_FUNCS = {
+    "abs": abs, "neg": operator.neg, "square": lambda x: x * x, "sqrt": math.sqrt,
+    "floor": math.floor, "ceil": math.ceil, "round": round, "int": int, "float": float
+}
+# Result typecode when the input is an array; the rest keep the input's
+VMAP_TYPES = {"sqrt": "d", "float": "d", "floor": "q", "ceil": "q", "round": "q", "int": "q"}
+
+def numpy_map(np, name, vec):
+    """NumPy version of VMAP_FUNCS; None where the result could differ from Python's
+    (overflow, or a value the Python version rejects) so the caller falls back."""
+    to_int = name in ("floor", "ceil", "round", "int")
+    if vec.dtype.kind == "i":
+        bound = magnitude(vec)
+        if to_int:
+            return vec
+        if name == "square" and bound * bound >= INT64_LIMIT:
+            return None
+        if name in ("abs", "neg") and bound >= INT64_LIMIT:
+            return None
+    elif to_int:
+        # Python gives exact (big) ints; int64 only holds floats below 2**63
+        if not np.isfinite(vec).all() or (len(vec) and np.abs(vec).max() >= INT64_LIMIT):
+            return None
+    if name == "sqrt" and (vec < 0).any():
+        return None
+    fn = {
+        "abs": np.abs, "neg": np.negative, "square": np.square, "sqrt": np.sqrt,
+        "floor": np.floor, "ceil": np.ceil, "round": np.rint, "int": np.trunc,
+        "float": lambda v: v.astype(np.float64)
+    }[name]
+    with np.errstate(all="ignore"):
+        out = fn(vec)
+    return out.astype(np.int64) if to_int else out
+
+# ----------------- Instruction handlers -----------------
+# Handlers take the frame's value list and the instruction's decoded operands;
+# variable operands are slot numbers into that list.
+def op_set(values, a):
+    is_const, v, name = a[1]
+    if not is_const:
+        v = values[v]
+        if v is UNSET:
+            v = name
+    values[a[0]] = v
+
+def op_add(values, a):
+    is_const, v, name = a[1]
+    if not is_const:
+        v = values[v]
+        if v is UNSET:
+            v = name
+    x = values[a[0]]
+    values[a[0]] = (0 if x is UNSET else x) + v
+
+def op_sub(values, a):
+    is_const, v, name = a[1]
+    if not is_const:
+        v = values[v]
+        if v is UNSET:
+            v = name
+    x = values[a[0]]
+    values[a[0]] = (0 if x is UNSET else x) - v
+
+def op_mul(values, a):
+    is_const, v, name = a[1]
+    if not is_const:
+        v = values[v]
+        if v is UNSET:
+            v = name
+    x = values[a[0]]
+    values[a[0]] = (0 if x is UNSET else x) * v
+
+def op_add_const(values, a):
+    x = values[a[0]]
+    values[a[0]] = (0 if x is UNSET else x) + a[1]
+
+def op_sub_const(values, a):
+    x = values[a[0]]
+    values[a[0]] = (0 if x is UNSET else x) - a[1]
+
+def op_mul_const(values, a):
+    x = values[a[0]]
+    values[a[0]] = (0 if x is UNSET else x) * a[1]
+
+def op_div(values, a):
+    try:
+        values[a[0]] = lookup(values, a[0], 0) // get_val(values, a[1])
+    except ZeroDivisionError:
+        print("Division by zero!")
+
+def op_print(values, a):
+    v = values[a[0]]
+    print(a[1] if v is UNSET else v)
+
+def op_input(values, a):
+    val = input(f"Enter value for {a[1]}: ")
+    values[a[0]] = parse_val(val, a[2])
+
+def op_sleep(values, a):
+    try:
+        time.sleep(a[0])
+    except Exception:
+        pass
+
+def op_random(values, a):
+    try:
+        values[a[0]] = random.randint(a[1], a[2])
+    except Exception:
+        pass
+
+def op_const(values, a):
+    values[a[0]] = a[1]
+
+def op_upper(values, a):
+    values[a[0]] = str(get_val(values, a[1])).upper()
+
+def op_lower(values, a):
+    values[a[0]] = str(get_val(values, a[1])).lower()
+
+def op_title(values, a):
+    values[a[0]] = str(get_val(values, a[1])).title()
+
+def op_reverse(values, a):
+    values[a[0]] = str(get_val(values, a[1]))[::-1]
+
+def op_split(values, a):
+    values[a[0]] = str(get_val(values, a[1])).split(a[2])
+
+def op_join(values, a):
+    v = lookup(values, a[1], [])
+    if isinstance(v, list):
+        values[a[0]] = str(a[2]).join(map(str, v))
+
+def op_list(values, a):
+    values[a[0]] = [get_val(values, o) for o in a[1]]
+
+def op_append(values, a):
+    v = lookup(values, a[0], [])
+    if isinstance(v, list):
+        v.append(get_val(values, a[1]))
+        values[a[0]] = v
+
+def op_pop(values, a):
+    v = lookup(values, a[0], [])
+    if isinstance(v, list) and v:
+        v.pop()
+        values[a[0]] = v
+
+def op_get(values, a):
+    v = lookup(values, a[1], [])
+    idx = int(get_val(values, a[2]))
+    if isinstance(v, list) and 0 <= idx < len(v):
+        values[a[0]] = v[idx]
+
+def op_setitem(values, a):
+    v = lookup(values, a[0], [])
+    idx = int(get_val(values, a[1]))
+    if isinstance(v, list) and 0 <= idx < len(v):
+        v[idx] = get_val(values, a[2])
+        values[a[0]] = v
+
+def op_find(values, a):
+    values[a[0]] = str(get_val(values, a[1])).find(a[2])
+
+def op_replace(values, a):
+    values[a[0]] = str(get_val(values, a[1])).replace(a[2], a[3])
+
+def op_count(values, a):
+    values[a[0]] = str(get_val(values, a[1])).count(a[2])
+
+def op_range(values, a):
+    start = int(get_val(values, a[1]))
+    end = int(get_val(values, a[2]))
+    values[a[0]] = list(range(start, end))
+
+def op_sum(values, a):
+    v = lookup(values, a[1], [])
+    if isinstance(v, list):
+        values[a[0]] = sum(map(float, v))
+
+def op_max(values, a):
+    v = lookup(values, a[1], [])
+    if isinstance(v, list) and v:
+        values[a[0]] = max(v)
+
+def op_min(values, a):
+    v = lookup(values, a[1], [])
+    if isinstance(v, list) and v:
+        values[a[0]] = min(v)
+
+def op_sort(values, a):
+    v = lookup(values, a[0], [])
+    if isinstance(v, list):
+        v.sort()
+        values[a[0]] = v
+
+def op_shuffle(values, a):
+    v = lookup(values, a[0], [])
+    if isinstance(v, list):
+        random.shuffle(v)
+        values[a[0]] = v
+
+def op_dict(values, a):
+    values[a[0]] = {k: get_val(values, o) for k, o in a[1]}
+
+def op_getkey(values, a):
+    d = lookup(values, a[1], {})
+    if isinstance(d, dict):
+        values[a[0]] = d.get(a[2], None)
+
+def op_setkey(values, a):
+    d = lookup(values, a[0], {})
+    if isinstance(d, dict):
+        d[a[1]] = get_val(values, a[2])
+        values[a[0]] = d
+
+def op_keys(values, a):
+    d = lookup(values, a[1], {})
+    if isinstance(d, dict):
+        values[a[0]] = list(d.keys())
+
+def op_values(values, a):
+    d = lookup(values, a[1], {})
+    if isinstance(d, dict):
+        values[a[0]] = list(d.values())
+
+def op_delkey(values, a):
+    d = lookup(values, a[0], {})
+    if isinstance(d, dict) and a[1] in d:
+        del d[a[1]]
+        values[a[0]] = d
+
+def op_read(values, a):
+    try:
+        values[a[0]] = a[2].read(a[1])
+    except Exception:
+        values[a[0]] = ""
+
+def op_write(values, a):
+    a[2].write(a[0], str(get_val(values, a[1])))
+
+def op_appendfile(values, a):
+    try:
+        a[2].append(a[0], str(get_val(values, a[1])))
+    except Exception:
+        pass
+
+def op_exists(values, a):
+    values[a[0]] = a[2].exists(a[1])
+
+def op_readline(values, a):
+    try:
+        values[a[0]] = a[2].readline(a[1])
+    except Exception:
+        values[a[0]] = 0
+
+def op_readchunk(values, a):
+    try:
+        values[a[0]] = a[3].readchunk(a[1], int(get_val(values, a[2])))
+    except Exception:
+        values[a[0]] = 0
+
+def op_flush(values, a):
+    a[1].flush(a[0])
+
+def op_close(values, a):
+    a[1].close(a[0])
+
+def op_pow(values, a):
+    try:
+        values[a[0]] = math.pow(float(get_val(values, a[1])), float(get_val(values, a[2])))
+    except Exception:
+        values[a[0]] = 0
+
+def op_sqrt(values, a):
+    try:
+        values[a[0]] = math.sqrt(float(get_val(values, a[1])))
+    except Exception:
+        values[a[0]] = 0
+
+def op_abs(values, a):
+    try:
+        values[a[0]] = abs(float(get_val(values, a[1])))
+    except Exception:
+        values[a[0]] = 0
+
+def op_mod(values, a):
+    try:
+        values[a[0]] = float(get_val(values, a[1])) % float(get_val(values, a[2]))
+    except Exception:
+        values[a[0]] = 0
+
+def op_system(values, a):
+    a[1].flush()
+    os.system(a[0])
+
+def op_not(values, a):
+    values[a[0]] = not bool(get_val(values, a[1]))
+
+def op_and(values, a):
+    values[a[0]] = bool(get_val(values, a[1])) and bool(get_val(values, a[2]))
+
+def op_or(values, a):
+    values[a[0]] = bool(get_val(values, a[1])) or bool(get_val(values, a[2]))
+
+def op_inputint(values, a):
+    try:
+        values[a[0]] = int(input(f"Enter integer for {a[1]}: "))
+    except Exception:
+        values[a[0]] = 0
+
+def op_inputfloat(values, a):
+    try:
+        values[a[0]] = float(input(f"Enter float for {a[1]}: "))
+    except Exception:
+        values[a[0]] = 0.0
+
+def op_inputstr(values, a):
+    values[a[0]] = input(f"Enter string for {a[1]}: ")
+
+def op_vadd(values, a):
+    vector_binary(values, a, operator.add)
+
+def op_vsub(values, a):
+    vector_binary(values, a, operator.sub)
+
+def op_vmul(values, a):
+    vector_binary(values, a, operator.mul)
+
+def op_vdiv(values, a):
+    # Floor division, like div
+    vector_binary(values, a, operator.floordiv)
+
+def op_vmap(values, a):
+    src = to_vector(lookup(values, a[1], None))
+    if src is None or a[2] not in VMAP_FUNCS:
+        return
+    view = numpy_view(src)
+    if view is not None:
+        out = numpy_map(numpy_module, a[2], view)
+        if out is not None:
+            values[a[0]] = store_vector(a[3], from_numpy(out))
+            return
+    fn = VMAP_FUNCS[a[2]]
+    try:
+        result = pack(VMAP_TYPES.get(a[2], src.typecode), map(fn, src)) if type(src) is array else None
+        if result is None:
+            result = list(map(fn, src))
+        values[a[0]] = store_vector(a[3], result)
+    except (ValueError, OverflowError):
+        pass
+
+def numpy_compare_ok(vec, value):
+    """True if comparing vec with value in NumPy matches Python's exact int/float comparison."""
+    if vec.dtype.kind == "i":
+        if type(value) is int:
+            return abs(value) < INT64_LIMIT
+        # The ints get converted to float64
+        return magnitude(vec) <= FLOAT_EXACT_INT
+    return type(value) is float or abs(value) <= FLOAT_EXACT_INT
+
+def op_vfilter(values, a):
+    v = lookup(values, a[1], None)
+    if type(v) is not array and not isinstance(v, list):
+        return
+    cmp = COND_OPS.get(a[2])
+    if cmp is None:
+        values[a[0]] = []
+        return
+    value = get_val(values, a[3])
+    # Lists of other things (strings, ...) are filtered as they are
+    src = to_vector(v) or v
+    try:
+        view = numpy_view(src)
+        if view is not None and type(value) in (int, float) and numpy_compare_ok(view, value):
+            result = from_numpy(view[cmp(view, value)])
+        elif type(src) is array:
+            result = array(src.typecode, (x for x in src if cmp(x, value)))
+        else:
+            result = [x for x in src if cmp(x, value)]
+        values[a[0]] = store_vector(a[4], result)
+    except TypeError:
+        pass
+
+def op_vcumsum(values, a):
+    src = to_vector(lookup(values, a[1], None))
+    if src is None:
+        return
+    view = numpy_view(src)
+    # Every running total is at most len * the largest magnitude
+    if view is not None and magnitude(view) * len(view) < INT64_LIMIT:
+        with numpy_module.errstate(all="ignore"):
+            result = from_numpy(numpy_module.cumsum(view))
+    else:
+        result = pack(src.typecode, accumulate(src)) if type(src) is array else None
+        if result is None:
+            result = list(accumulate(src))
+    values[a[0]] = store_vector(a[2], result)
+
+def op_exit(values, a):
+    return HALT
+
+def op_error(values, a):
+    raise a[0]
+
+def op_unpack(values, a):
+    unpack_vectors(values, a[0])
+
+# Dispatch table indexed by opcode
+HANDLERS = [None] * CONTROL_OPS_START
+for _op, _handler in {
+    Op.SET: op_set, Op.ADD: op_add, Op.SUB: op_sub, Op.MUL: op_mul, Op.DIV: op_div,
+    Op.PRINT: op_print, Op.INPUT: op_input,
+    Op.SLEEP: op_sleep, Op.RANDOM: op_random, Op.LEN: op_const, Op.CONCAT: op_const,
+    Op.UPPER: op_upper, Op.LOWER: op_lower, Op.TITLE: op_title, Op.REVERSE: op_reverse,
+    Op.SPLIT: op_split, Op.JOIN: op_join, Op.LIST: op_list, Op.APPEND: op_append,
+    Op.POP: op_pop, Op.GET: op_get, Op.SETITEM: op_setitem, Op.FIND: op_find,
+    Op.REPLACE: op_replace, Op.COUNT: op_count, Op.RANGE: op_range, Op.SUM: op_sum,
+    Op.MAX: op_max, Op.MIN: op_min, Op.SORT: op_sort, Op.SHUFFLE: op_shuffle,
+    Op.DICT: op_dict, Op.GETKEY: op_getkey, Op.SETKEY: op_setkey, Op.KEYS: op_keys,
+    Op.VALUES: op_values, Op.DELKEY: op_delkey, Op.READ: op_read, Op.WRITE: op_write,
+    Op.APPENDFILE: op_appendfile, Op.EXISTS: op_exists, Op.POW: op_pow, Op.SQRT: op_sqrt,
+    Op.ABS: op_abs, Op.MOD: op_mod, Op.SYSTEM: op_system, Op.NOT: op_not,
+    Op.AND: op_and, Op.OR: op_or, Op.INPUTINT: op_inputint, Op.INPUTFLOAT: op_inputfloat,
+    Op.INPUTSTR: op_inputstr, Op.EXIT: op_exit, Op.ERROR: op_error,
+    Op.SET_CONST: op_const, Op.ADD_CONST: op_add_const, Op.SUB_CONST: op_sub_const,
+    Op.MUL_CONST: op_mul_const, Op.VADD: op_vadd, Op.VSUB: op_vsub, Op.VMUL: op_vmul,
+    Op.VDIV: op_vdiv, Op.VMAP: op_vmap, Op.VFILTER: op_vfilter, Op.VCUMSUM: op_vcumsum,
+    Op.READLINE: op_readline, Op.READCHUNK: op_readchunk, Op.FLUSH: op_flush, Op.CLOSE: op_close,
+    Op.UNPACK: op_unpack
+}.items():
+    HANDLERS[_op] = _handler
+
+def run_program(program, frame, profile=None):
+    """Execute a program compiled against frame, timing every instruction
+    into profile if one is given.
+
+    Returns the frame when it finishes, or HALT if the script ran 'exit'.
+    """
+    if profile is not None:
+        return run_program_profiled(program, frame, profile)
+    handlers = HANDLERS
+    values = frame.values
+    control_start, op_loop, op_if, op_while = int(CONTROL_OPS_START), int(Op.LOOP), int(Op.IF), int(Op.WHILE)
+    # Loop limits are read once when a while loop starts, keyed by its entry pc
+    bounds = {}
+    pc = 0
+    end = len(program)
+    while pc < end:
+        op, a, _lineno = program[pc]
+        if op < control_start:
+            if handlers[op](values, a) is HALT:
+                return HALT
+            pc += 1
+        elif op == op_loop:
+            # a = (slot, cmp, entry pc, body pc); unset variables compare as 0
+            x = values[a[0]]
+            pc = a[3] if a[1](0 if x is UNSET else x, bounds[a[2]]) else pc + 1
+        elif op == op_if:
+            # a = (slot, cmp, value, target when false)
+            x = values[a[0]]
+            pc = pc + 1 if a[1](0 if x is UNSET else x, get_val(values, a[2])) else a[3]
+        elif op == op_while:
+            # a = (slot, cmp, value, straight-line body or None, target when false)
+            slot, cmp = a[0], a[1]
+            bound = bounds[pc] = get_val(values, a[2])
+            fast_body = a[3]
+            x = values[slot]
+            if not cmp(0 if x is UNSET else x, bound):
+                pc = a[4]
+            elif fast_body is None:
+                pc += 1
+            else:
+                while True:
+                    for handler, args in fast_body:
+                        if handler(values, args) is HALT:
+                            return HALT
+                    x = values[slot]
+                    if not cmp(0 if x is UNSET else x, bound):
+                        break
+                pc = a[4]
+        else:
+            pc = a[0]
+    return frame
+
+# ----------------- Profiler -----------------
+# Command names for the report; the *_CONST variants count as their command and
+# the jumps generated for while/else are charged to those keywords
+COMMAND_NAMES = {int(op): op.name.lower().replace("_const", "") for op in Op}
+COMMAND_NAMES.update({int(Op.LOOP): "while", int(Op.JUMP): "else"})
+
+class Profile:
+    """
+    Execution count and cumulative time per source line and per command.
+    Usage:
+        profile = Profile()
+        run_program(program, frame, profile)
+        profile.print_report("script.dkl")
+        profile.save("script.dkl", "mod_logs/script.dkl.profile.json")
+    """
+    def __init__(self):
+        self.lines = {}     # lineno -> [count, seconds]
+        self.commands = {}  # opcode -> [count, seconds]
+        self.wall_time = 0.0
+
+    def line_rows(self):
+        return sorted(((n, c, t) for n, (c, t) in self.lines.items()), key=lambda r: r[2], reverse=True)
+
+    def command_rows(self):
+        merged = {}
+        for op, (count, seconds) in self.commands.items():
+            row = merged.setdefault(COMMAND_NAMES.get(op, str(op)), [0, 0.0])
+            row[0] += count
+            row[1] += seconds
+        return sorted(((name, c, t) for name, (c, t) in merged.items()), key=lambda r: r[2], reverse=True)
+
+    def source_lines(self, filename, wanted):
+        """Read back the text of the given line numbers (the program keeps none)."""
+        found = {}
+        try:
+            with open(filename, "r", encoding="utf-8") as f:
+                for n, line in enumerate(f, 1):
+                    if n in wanted:
+                        found[n] = line.strip()
+        except Exception:
+            pass
+        return found
+
+    def as_dict(self, filename):
+        lines = self.line_rows()
+        source = self.source_lines(filename, {n for n, _c, _t in lines})
+        return {
+            "script": os.path.abspath(filename),
+            "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "wall_seconds": round(self.wall_time, 6),
+            "instructions": sum(c for c, _t in self.lines.values()),
+            "lines": [{"line": n, "source": source.get(n, ""), "count": c, "seconds": round(t, 6)}
+                      for n, c, t in lines],
+            "commands": [{"command": name, "count": c, "seconds": round(t, 6)}
+                         for name, c, t in self.command_rows()]
+        }
+
+    def save(self, filename, path):
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.as_dict(filename), f, indent=2)
+            return True
+        except Exception:
+            return False
+
+    def print_report(self, filename, limit=15):
+        """Print the hottest lines and commands, as Rich tables when Rich is installed."""
+        lines = self.line_rows()[:limit]
+        commands = self.command_rows()[:limit]
+        source = self.source_lines(filename, {n for n, _c, _t in lines})
+        total = sum(t for _c, t in self.lines.values()) or 1e-12
+        title = f"DuckyLang profile: {os.path.basename(filename)} ({self.wall_time:.3f}s)"
+        try:
+            from rich.console import Console
+            from rich.table import Table
+        except ImportError:
+            Console = None
+        if Console is not None:
+            console = Console()
+            table = Table(title=title + " - hot lines", header_style="bold cyan")
+            for col in ("Line", "Count", "Time (ms)", "%"):
+                table.add_column(col, justify="right")
+            table.add_column("Source")
+            for n, c, t in lines:
+                table.add_row(str(n), str(c), f"{t * 1000:.2f}", f"{t / total * 100:.1f}", source.get(n, ""))
+            console.print(table)
+            table = Table(title="Commands", header_style="bold cyan")
+            table.add_column("Command")
+            for col in ("Count", "Time (ms)", "%"):
+                table.add_column(col, justify="right")
+            for name, c, t in commands:
+                table.add_row(name, str(c), f"{t * 1000:.2f}", f"{t / total * 100:.1f}")
+            console.print(table)
+            return
+        print(f"\n--- {title} ---")
+        print(f"{'Line':>6} {'Count':>10} {'Time (ms)':>11} {'%':>6}  Source")
+        for n, c, t in lines:
+            print(f"{n:>6} {c:>10} {t * 1000:>11.2f} {t / total * 100:>6.1f}  {source.get(n, '')}")
+        print(f"\n{'Command':<12} {'Count':>10} {'Time (ms)':>11} {'%':>6}")
+        for name, c, t in commands:
+            print(f"{name:<12} {c:>10} {t * 1000:>11.2f} {t / total * 100:>6.1f}")
+
+def run_program_profiled(program, frame, profile):
+    """run_program with per-instruction timing. While loops always step through
+    their body here, so every line of it is counted."""
+    handlers = HANDLERS
+    values = frame.values
+    clock = time.perf_counter
+    lines, commands = profile.lines, profile.commands
+    control_start, op_loop, op_if, op_while = int(CONTROL_OPS_START), int(Op.LOOP), int(Op.IF), int(Op.WHILE)
+    bounds = {}
+    result = frame
+    pc = 0
+    end = len(program)
+    while pc < end:
+        op, a, lineno = program[pc]
+        started = clock()
+        if op < control_start:
+            if handlers[op](values, a) is HALT:
+                result = HALT
+                next_pc = end
+            else:
+                next_pc = pc + 1
+        elif op == op_loop:
+            x = values[a[0]]
+            next_pc = a[3] if a[1](0 if x is UNSET else x, bounds[a[2]]) else pc + 1
+        elif op == op_if:
+            x = values[a[0]]
+            next_pc = pc + 1 if a[1](0 if x is UNSET else x, get_val(values, a[2])) else a[3]
+        elif op == op_while:
+            bound = bounds[pc] = get_val(values, a[2])
+            x = values[a[0]]
+            next_pc = pc + 1 if a[1](0 if x is UNSET else x, bound) else a[4]
+        else:
+            next_pc = a[0]
+        elapsed = clock() - started
+        stat = lines.get(lineno)
+        if stat is None:
+            stat = lines[lineno] = [0, 0.0]
+        stat[0] += 1
+        stat[1] += elapsed
+        stat = commands.get(op)
+        if stat is None:
+            stat = commands[op] = [0, 0.0]
+        stat[0] += 1
+        stat[1] += elapsed
+        pc = next_pc
+    return result
+
+# ----------------- Async runtime -----------------
+# run_program_async runs on an asyncio event loop: sleep, the input commands
+# and system are awaited instead of blocking, and every ASYNC_SLICE
+# instructions the script yields so other scripts on the same loop get a turn.
+# Input is read on a worker thread, one prompt at a time; a script cancelled
+# while waiting for input stops at once, but the pending read still consumes
+# the next line typed.
+ASYNC_SLICE = 1000
+
+async def read_line(prompt, io_lock):
+    async with io_lock:
+        return await asyncio.to_thread(input, prompt)
+
+async def aop_sleep(values, a, io_lock):
+    if a[0] > 0:
+        await asyncio.sleep(a[0])
+
+async def aop_input(values, a, io_lock):
+    val = await read_line(f"Enter value for {a[1]}: ", io_lock)
+    values[a[0]] = parse_val(val, a[2])
+
+async def aop_inputint(values, a, io_lock):
+    try:
+        values[a[0]] = int(await read_line(f"Enter integer for {a[1]}: ", io_lock))
+    except Exception:
+        values[a[0]] = 0
+
+async def aop_inputfloat(values, a, io_lock):
+    try:
+        values[a[0]] = float(await read_line(f"Enter float for {a[1]}: ", io_lock))
+    except Exception:
+        values[a[0]] = 0.0
+
+async def aop_inputstr(values, a, io_lock):
+    values[a[0]] = await read_line(f"Enter string for {a[1]}: ", io_lock)
+
+async def aop_system(values, a, io_lock):
+    a[1].flush()
+    proc = await asyncio.create_subprocess_shell(a[0])
+    try:
+        await proc.wait()
+    except asyncio.CancelledError:
+        proc.kill()
+        raise
+
+ASYNC_HANDLERS = {
+    int(Op.SLEEP): aop_sleep, int(Op.INPUT): aop_input, int(Op.INPUTINT): aop_inputint,
+    int(Op.INPUTFLOAT): aop_inputfloat, int(Op.INPUTSTR): aop_inputstr, int(Op.SYSTEM): aop_system
+}
+
+async def run_program_async(program, frame, budget=None, io_lock=None):
+    """Coroutine version of run_program. Raises DuckyLangBudgetError after
+    budget instructions when a budget is given; cancel the task to stop it."""
+    handlers = HANDLERS
+    async_handlers = ASYNC_HANDLERS
+    values = frame.values
+    if io_lock is None:
+        io_lock = asyncio.Lock()
+    control_start, op_loop, op_if, op_while = int(CONTROL_OPS_START), int(Op.LOOP), int(Op.IF), int(Op.WHILE)
+    bounds = {}
+    executed = 0
+    next_yield = ASYNC_SLICE
+    pc = 0
+    end = len(program)
+    while pc < end:
+        op, a, lineno = program[pc]
+        executed += 1
+        if budget is not None and executed > budget:
+            raise DuckyLangBudgetError(f"line {lineno}: instruction budget of {budget} used up")
+        if executed >= next_yield:
+            next_yield += ASYNC_SLICE
+            await asyncio.sleep(0)
+        if op in async_handlers:
+            await async_handlers[op](values, a, io_lock)
+            pc += 1
+        elif op < control_start:
+            if handlers[op](values, a) is HALT:
+                return HALT
+            pc += 1
+        elif op == op_loop:
+            x = values[a[0]]
+            pc = a[3] if a[1](0 if x is UNSET else x, bounds[a[2]]) else pc + 1
+        elif op == op_if:
+            x = values[a[0]]
+            pc = pc + 1 if a[1](0 if x is UNSET else x, get_val(values, a[2])) else a[3]
+        elif op == op_while:
+            # Loops always step through their body here so they can yield and be budgeted
+            bound = bounds[pc] = get_val(values, a[2])
+            x = values[a[0]]
+            pc = pc + 1 if a[1](0 if x is UNSET else x, bound) else a[4]
+        else:
+            pc = a[0]
+    return frame
+
+async def run_duckylang_async(filename, budget=None, io_lock=None):
+    frame = Frame()
+    try:
+        program = compile_duckylang(read_source(filename), frame)
+        return await run_program_async(program, frame, budget, io_lock)
+    finally:
+        frame.close()
+
+class DuckyLangScheduler:
+    """
+    Runs several .dkl scripts at once on one asyncio event loop, kept in a
+    background thread so a synchronous caller (the launcher) can start,
+    cancel and wait for them.
+    Usage:
+        scheduler = DuckyLangScheduler()
+        job = scheduler.start("a.dkl", budget=1000000)
+        scheduler.start("b.dkl")
+        scheduler.cancel(job)
+        scheduler.wait()
+        for job, filename, state in scheduler.jobs():
+            print(job, filename, state)
+        scheduler.close()
+    """
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        self.io_lock = None
+        self.futures = {}
+        self.next_job = 1
+
+    async def run(self, filename, budget):
+        if self.io_lock is None:
+            self.io_lock = asyncio.Lock()
+        return await run_duckylang_async(filename, budget, self.io_lock)
+
+    def start(self, filename, budget=None):
+        """Schedule a script and return its job number."""
+        job = self.next_job
+        self.next_job += 1
+        future = asyncio.run_coroutine_threadsafe(self.run(filename, budget), self.loop)
+        self.futures[job] = (filename, future)
+        return job
+
+    def cancel(self, job=None):
+        """Cancel one job, or every unfinished job when job is None."""
+        for j, (_filename, future) in self.futures.items():
+            if job is None or j == job:
+                future.cancel()
+
+    def state(self, job):
+        future = self.futures[job][1]
+        if future.cancelled():
+            return "cancelled"
+        if not future.done():
+            return "running"
+        error = future.exception()
+        if error is not None:
+            return f"error: {error}"
+        return "exited" if future.result() is HALT else "finished"
+
+    def jobs(self):
+        return [(j, filename, self.state(j)) for j, (filename, _future) in self.futures.items()]
+
+    def wait(self, timeout=None):
+        """Block until every job is done (or timeout). Returns True if all are done."""
+        _done, pending = concurrent.futures.wait([f for _n, f in self.futures.values()], timeout=timeout)
+        return not pending
+
+    def close(self):
+        self.cancel()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=5)
+
+def run_concurrently(filenames, budget=None):
+    """Run several scripts at once, then wait for Enter. Ctrl+C cancels what is still running."""
+    scheduler = DuckyLangScheduler()
+    try:
+        for filename in filenames:
+            scheduler.start(filename, budget)
+        try:
+            # Short waits keep the main thread responsive to Ctrl+C
+            while not scheduler.wait(timeout=0.2):
+                pass
+        except KeyboardInterrupt:
+            scheduler.cancel()
+            scheduler.wait(timeout=5)
+        print()
+        for job, filename, state in scheduler.jobs():
+            print(f"[{job}] {os.path.basename(filename)}: {state}")
+    finally:
+        scheduler.close()
+    input("Press Enter to return to DLDSPT Menu...")
+
+# ----------------- Transpiler -----------------
+# A script can also be turned into the source of one Python function,
+# dkl_main(values, frame, files), compiled by CPython and cached on disk keyed
+# by the script's hash. Control flow and the hot commands (set/add/sub/mul,
+# print, conditions) become plain Python over the frame's value list; every
+# other command calls the same handler the interpreter uses, so both behave
+# the same.
+TRANSPILE_CACHE_DIR = "dkl_code_cache"
+TRANSPILE_CACHE_MAX_FILES = 256
+# The whole script becomes one Python function, and CPython's compiler needs
+# a lot of time and memory for huge functions (several GB for a few MB of
+# script), so bigger scripts are interpreted instead
+TRANSPILE_MAX_BYTES = 256 * 1024
+# Bump when the generated code changes so old cache entries are ignored
+TRANSPILE_FORMAT = 2
+
+ARITH_SYMBOLS = {Op.ADD: "+", Op.SUB: "-", Op.MUL: "*", Op.ADD_CONST: "+", Op.SUB_CONST: "-", Op.MUL_CONST: "*"}
+
+def py_literal(v):
+    """Python source for an instruction operand."""
+    if isinstance(v, tuple):
+        return "(" + "".join(py_literal(x) + ", " for x in v) + ")"
+    if isinstance(v, FileCache):
+        return "files"
+    if isinstance(v, Frame):
+        return "frame"
+    if isinstance(v, float) and not math.isfinite(v):
+        return f"float({str(v)!r})"
+    if v is None or isinstance(v, (bool, int, float, str)):
+        return repr(v)
+    raise TypeError(f"cannot transpile operand {v!r}")
+
+def py_value(opnd):
+    """Python expression for a value operand (an unset variable reads as its name)."""
+    is_const, v, name = opnd
+    if is_const:
+        return py_literal(v)
+    return f"({name!r} if (_v := values[{v}]) is UNSET else _v)"
+
+class Transpiler:
+    """
+    Turns DuckyLang source into Python source, allocating variable slots in frame.
+    Usage:
+        frame = Frame()
+        source = Transpiler(frame).transpile(read_source("script.dkl"))
+    """
+    def __init__(self, frame):
+        self.frame = frame
+        self.out = []
+        self.loops = 0
+
+    def emit(self, depth, text):
+        self.out.append("    " * depth + text)
+
+    def pad(self, depth, start):
+        # A block that produced no statements still needs a body
+        if len(self.out) == start:
+            self.emit(depth, "pass")
+
+    def transpile(self, lines):
+        lines = list(lines)
+        self.frame.vectors |= vector_targets(lines)
+        self.emit(0, "def dkl_main(values, frame, files):")
+        blocks = []
+        for lineno, line in lines:
+            self.statement(line, lineno, blocks, 1 + len(blocks))
+        if blocks:
+            raise_unclosed(blocks)
+        self.emit(1, "return frame")
+        return "\n".join(self.out) + "\n"
+
+    def condition(self, args, rhs):
+        slot = self.frame.slot(args[0])
+        if args[1] not in COND_OPS:
+            return "False"
+        # A while loop re-tests after its body, which may have left an array there
+        read = f"unpacked(values, {slot})" if args[0] in self.frame.vectors else f"values[{slot}]"
+        return f"(0 if (_c := {read}) is UNSET else _c) {args[1]} {rhs}"
+
+    def statement(self, line, lineno, blocks, depth, inline=False):
+        # Mirrors compile_into
+        parts = line.split()
+        if not parts:
+            return
         cmd = parts[0].lower()
         args = parts[1:]
-        if cmd == "set" and len(args) == 2:
-            vars[args[0]] = parse_val(args[1], vars)
-        elif cmd == "add" and len(args) == 2:
-            vars[args[0]] = vars.get(args[0], 0) + parse_val(args[1], vars)
-        elif cmd == "sub" and len(args) == 2:
-            vars[args[0]] = vars.get(args[0], 0) - parse_val(args[1], vars)
-        elif cmd == "mul" and len(args) == 2:
-            vars[args[0]] = vars.get(args[0], 0) * parse_val(args[1], vars)
-        elif cmd == "div" and len(args) == 2:
-            try:
-                vars[args[0]] = vars.get(args[0], 0) // parse_val(args[1], vars)
-            except ZeroDivisionError:
-                print("Division by zero!")
-        elif cmd == "print" and args:
-            if args[0] in vars:
-                print(vars[args[0]])
+        if cmd in ("if", "while"):
+            keyword = "then" if cmd == "if" else "do"
+            if keyword not in args:
+                return
+            idx = args.index(keyword)
+            body_text = " ".join(args[idx + 1:])
+            if len(args) < 3 or (inline and not body_text):
+                self.emit(depth, "raise IndexError('list index out of range')")
+                return
+            unpack = unpack_instruction(args[:idx], self.frame, lineno)
+            if unpack is not None:
+                self.instruction(unpack[0], unpack[1], depth)
+            self.frame.slot(args[0])
+            value = py_value(operand(args[2], self.frame))
+            if cmd == "while":
+                # The limit is read once, when the loop starts
+                bound = f"_b{self.loops}"
+                self.loops += 1
+                self.emit(depth, f"{bound} = {value}")
+                self.emit(depth, f"while {self.condition(args, bound)}:")
             else:
-                print(" ".join(args))
-        elif cmd == "input" and args:
-            val = input(f"Enter value for {args[0]}: ")
-            vars[args[0]] = parse_val(val, vars)
-        elif cmd == "if" and "then" in args:
-            idx_then = args.index("then")
-            var, op, value = args[0], args[1], parse_val(args[2], vars)
-            cond = eval_cond(vars.get(var, 0), op, value)
-            if cond:
-                sub_cmd = " ".join(args[idx_then+1:])
-                lines.insert(i+1, sub_cmd)
-        elif cmd == "while" and "do" in args:
-            idx_do = args.index("do")
-            var, op, value = args[0], args[1], parse_val(args[2], vars)
-            cond = eval_cond(vars.get(var, 0), op, value)
-            if cond:
-                sub_cmd = " ".join(args[idx_do+1:])
-                lines.insert(i+1, f"while {var} {op} {value} do {' '.join(args[idx_do+1:])}")
-                lines.insert(i+1, sub_cmd)
-        elif cmd == "sleep" and args:
-            try:
-                time.sleep(float(args[0]))
-            except Exception:
-                pass
-        elif cmd == "random" and len(args) == 3:
-            try:
-                vars[args[0]] = random.randint(int(args[1]), int(args[2]))
-            except Exception:
-                pass
-        elif cmd == "len" and len(args) == 2:
-            vars[args[0]] = len(str(args[1]))
-        elif cmd == "concat" and len(args) == 3:
-            vars[args[0]] = str(args[1]) + str(args[2])
-        # --- New commands ---
-        elif cmd == "upper" and len(args) == 2:
-            vars[args[0]] = str(parse_val(args[1], vars)).upper()
-        elif cmd == "lower" and len(args) == 2:
-            vars[args[0]] = str(parse_val(args[1], vars)).lower()
-        elif cmd == "title" and len(args) == 2:
-            vars[args[0]] = str(parse_val(args[1], vars)).title()
-        elif cmd == "reverse" and len(args) == 2:
-            vars[args[0]] = str(parse_val(args[1], vars))[::-1]
-        elif cmd == "split" and len(args) == 3:
-            vars[args[0]] = str(parse_val(args[1], vars)).split(args[2])
-        elif cmd == "join" and len(args) == 3:
-            v = vars.get(args[1], [])
-            if isinstance(v, list):
-                vars[args[0]] = str(args[2]).join(map(str, v))
-        elif cmd == "list" and len(args) >= 2:
-            vars[args[0]] = [parse_val(a, vars) for a in args[1:]]
-        elif cmd == "append" and len(args) == 2:
-            v = vars.get(args[0], [])
-            if isinstance(v, list):
-                v.append(parse_val(args[1], vars))
-                vars[args[0]] = v
-        elif cmd == "pop" and len(args) == 1:
-            v = vars.get(args[0], [])
-            if isinstance(v, list) and v:
-                v.pop()
-                vars[args[0]] = v
-        elif cmd == "get" and len(args) == 3:
-            v = vars.get(args[1], [])
-            idx = int(parse_val(args[2], vars))
-            if isinstance(v, list) and 0 <= idx < len(v):
-                vars[args[0]] = v[idx]
-        elif cmd == "setitem" and len(args) == 3:
-            v = vars.get(args[0], [])
-            idx = int(parse_val(args[1], vars))
-            if isinstance(v, list) and 0 <= idx < len(v):
-                v[idx] = parse_val(args[2], vars)
-                vars[args[0]] = v
-        elif cmd == "find" and len(args) == 3:
-            vars[args[0]] = str(parse_val(args[1], vars)).find(args[2])
-        elif cmd == "replace" and len(args) == 4:
-            vars[args[0]] = str(parse_val(args[1], vars)).replace(args[2], args[3])
-        elif cmd == "count" and len(args) == 3:
-            vars[args[0]] = str(parse_val(args[1], vars)).count(args[2])
-        elif cmd == "range" and len(args) == 3:
-            start = int(parse_val(args[1], vars))
-            end = int(parse_val(args[2], vars))
-            vars[args[0]] = list(range(start, end))
-        elif cmd == "sum" and len(args) == 2:
-            v = vars.get(args[1], [])
-            if isinstance(v, list):
-                vars[args[0]] = sum(map(float, v))
-        elif cmd == "max" and len(args) == 2:
-            v = vars.get(args[1], [])
-            if isinstance(v, list) and v:
-                vars[args[0]] = max(v)
-        elif cmd == "min" and len(args) == 2:
-            v = vars.get(args[1], [])
-            if isinstance(v, list) and v:
-                vars[args[0]] = min(v)
-        elif cmd == "sort" and len(args) == 1:
-            v = vars.get(args[0], [])
-            if isinstance(v, list):
-                v.sort()
-                vars[args[0]] = v
-        elif cmd == "shuffle" and len(args) == 1:
-            v = vars.get(args[0], [])
-            if isinstance(v, list):
-                random.shuffle(v)
-                vars[args[0]] = v
-        elif cmd == "dict" and len(args) >= 3 and len(args) % 2 == 1:
-            d = {}
-            for k, v in zip(args[1::2], args[2::2]):
-                d[k] = parse_val(v, vars)
-            vars[args[0]] = d
-        elif cmd == "getkey" and len(args) == 3:
-            d = vars.get(args[1], {})
-            if isinstance(d, dict):
-                vars[args[0]] = d.get(args[2], None)
-        elif cmd == "setkey" and len(args) == 3:
-            d = vars.get(args[0], {})
-            if isinstance(d, dict):
-                d[args[1]] = parse_val(args[2], vars)
-                vars[args[0]] = d
-        elif cmd == "keys" and len(args) == 2:
-            d = vars.get(args[1], {})
-            if isinstance(d, dict):
-                vars[args[0]] = list(d.keys())
-        elif cmd == "values" and len(args) == 2:
-            d = vars.get(args[1], {})
-            if isinstance(d, dict):
-                vars[args[0]] = list(d.values())
-        elif cmd == "delkey" and len(args) == 2:
-            d = vars.get(args[0], {})
-            if isinstance(d, dict) and args[1] in d:
-                del d[args[1]]
-                vars[args[0]] = d
-        elif cmd == "read" and len(args) == 2:
-            try:
-                with open(args[1], "r", encoding="utf-8") as f:
-                    vars[args[0]] = f.read()
-            except Exception:
-                vars[args[0]] = ""
-        elif cmd == "write" and len(args) == 2:
-            try:
-                with open(args[0], "w", encoding="utf-8") as f:
-                    f.write(str(parse_val(args[1], vars)))
-            except Exception:
-                pass
-        elif cmd == "appendfile" and len(args) == 2:
-            try:
-                with open(args[0], "a", encoding="utf-8") as f:
-                    f.write(str(parse_val(args[1], vars)))
-            except Exception:
-                pass
-        elif cmd == "exists" and len(args) == 2:
-            vars[args[0]] = os.path.exists(args[1])
-        elif cmd == "pow" and len(args) == 3:
-            try:
-                vars[args[0]] = math.pow(float(parse_val(args[1], vars)), float(parse_val(args[2], vars)))
-            except Exception:
-                vars[args[0]] = 0
-        elif cmd == "sqrt" and len(args) == 2:
-            try:
-                vars[args[0]] = math.sqrt(float(parse_val(args[1], vars)))
-            except Exception:
-                vars[args[0]] = 0
-        elif cmd == "abs" and len(args) == 2:
-            try:
-                vars[args[0]] = abs(float(parse_val(args[1], vars)))
-            except Exception:
-                vars[args[0]] = 0
-        elif cmd == "mod" and len(args) == 3:
-            try:
-                vars[args[0]] = float(parse_val(args[1], vars)) % float(parse_val(args[2], vars))
-            except Exception:
-                vars[args[0]] = 0
-        elif cmd == "system" and args:
-            os.system(" ".join(args))
-        elif cmd == "not" and len(args) == 2:
-            vars[args[0]] = not bool(parse_val(args[1], vars))
-        elif cmd == "and" and len(args) == 3:
-            vars[args[0]] = bool(parse_val(args[1], vars)) and bool(parse_val(args[2], vars))
-        elif cmd == "or" and len(args) == 3:
-            vars[args[0]] = bool(parse_val(args[1], vars)) or bool(parse_val(args[2], vars))
-        elif cmd == "inputint" and len(args) == 1:
-            try:
-                vars[args[0]] = int(input(f"Enter integer for {args[0]}: "))
-            except Exception:
-                vars[args[0]] = 0
-        elif cmd == "inputfloat" and len(args) == 1:
+                self.emit(depth, f"if {self.condition(args, value)}:")
+            start = len(self.out)
+            if not body_text:
+                blocks.append((cmd, start, lineno))
+                return
+            self.statement(body_text, lineno, blocks, depth + 1, inline=True)
+            self.pad(depth + 1, start)
+            return
+        if cmd == "else" and not args and not inline:
+            if not blocks or blocks[-1][0] != "if":
+                raise DuckyLangSyntaxError(f"line {lineno}: 'else' without a matching 'if ... then'")
+            _kind, start, open_line = blocks.pop()
+            self.pad(depth, start)
+            self.emit(depth - 1, "else:")
+            blocks.append(("else", len(self.out), open_line))
+            return
+        if cmd == "end" and not args and not inline:
+            if not blocks:
+                raise DuckyLangSyntaxError(f"line {lineno}: 'end' without an open block")
+            _kind, start, _open_line = blocks.pop()
+            self.pad(depth, start)
+            return
+        ins = compile_line(cmd, args, lineno, self.frame)
+        if ins is not None:
+            unpack = None if cmd in VECTOR_COMMANDS else unpack_instruction(args, self.frame, lineno)
+            if unpack is not None:
+                self.instruction(unpack[0], unpack[1], depth)
+            self.instruction(ins[0], ins[1], depth)
+
+    def instruction(self, op, a, depth):
+        if op == Op.SET_CONST:
+            self.emit(depth, f"values[{a[0]}] = {py_literal(a[1])}")
+        elif op == Op.SET:
+            self.emit(depth, f"values[{a[0]}] = {py_value(a[1])}")
+        elif op in ARITH_SYMBOLS:
+            rhs = py_literal(a[1]) if op in (Op.ADD_CONST, Op.SUB_CONST, Op.MUL_CONST) else py_value(a[1])
+            self.emit(depth, f"values[{a[0]}] = (0 if (_t := values[{a[0]}]) is UNSET else _t) {ARITH_SYMBOLS[op]} {rhs}")
+        elif op == Op.PRINT:
+            self.emit(depth, f"print({a[1]!r} if (_t := values[{a[0]}]) is UNSET else _t)")
+        elif op == Op.EXIT:
+            self.emit(depth, "return HALT")
+        elif op == Op.ERROR:
+            self.emit(depth, f"raise {type(a[0]).__name__}({str(a[0])!r})")
+        else:
+            self.emit(depth, f"{HANDLERS[op].__name__}(values, {py_literal(a)})")
+
+def get_transpile_cache_file(data):
+    # The hash covers the script, the generated-code format and the Python
+    # version (marshalled code objects are version specific)
+    key = hashlib.sha256(data)
+    key.update(f"{TRANSPILE_FORMAT}:{sys.implementation.cache_tag}".encode())
+    return os.path.join(TRANSPILE_CACHE_DIR, key.hexdigest()[:32] + ".bin")
+
+def evict_transpile_cache():
+    try:
+        entries = [os.path.join(TRANSPILE_CACHE_DIR, n) for n in os.listdir(TRANSPILE_CACHE_DIR)]
+        if len(entries) > TRANSPILE_CACHE_MAX_FILES:
+            entries.sort(key=os.path.getmtime)
+            for path in entries[:len(entries) - TRANSPILE_CACHE_MAX_FILES]:
+                os.remove(path)
+    except Exception:
+        pass
+
+def load_transpiled(filename):
+    """Return (variable names by slot, code object) for a script, from the cache when possible."""
+    with open(filename, "rb") as f:
+        data = f.read()
+    cache_file = get_transpile_cache_file(data)
+    try:
+        with open(cache_file, "rb") as f:
+            names, code = marshal.load(f)
+        os.utime(cache_file)
+        return names, code
+    except Exception:
+        pass
+    frame = Frame()
+    # Same line splitting as reading the file in text mode
+    source = Transpiler(frame).transpile(iter_source(io.StringIO(data.decode("utf-8"), newline=None)))
+    code = compile(source, f"{filename} (transpiled)", "exec")
+    names = sorted(frame.slots, key=frame.slots.get)
+    try:
+        os.makedirs(TRANSPILE_CACHE_DIR, exist_ok=True)
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "wb") as f:
+            marshal.dump((names, code), f)
+        os.replace(tmp_file, cache_file)
+        evict_transpile_cache()
+    except Exception:
+        pass
+    return names, code
+
+def run_transpiled(names, code):
+    frame = Frame()
+    for name in names:
+        frame.slot(name)
+    namespace = dict(globals())
+    exec(code, namespace)
+    try:
+        return namespace["dkl_main"](frame.values, frame, frame.files)
+    finally:
+        frame.close()
+
+def run_streaming(filename, profile=None):
+    """Run a script while reading it, keeping memory flat for huge files."""
+    frame = Frame()
+    try:
+        with open(filename, "r", encoding="utf-8") as f:
+            for chunk in stream_program(iter_source(f), frame):
+                if run_program(chunk, frame, profile) is HALT:
+                    break
+    finally:
+        frame.close()
+    return frame
+
+def run_file(filename, profile=None):
+    """Compile and run a whole script; its files are flushed however it stops."""
+    frame = Frame()
+    try:
+        return run_program(compile_duckylang(read_source(filename), frame), frame, profile)
+    finally:
+        frame.close()
+
+def run_duckylang(filename, stream=None, profile_file=None, transpile=True, pause=True):
+    """Run a .dkl script. stream=None streams only files over STREAM_THRESHOLD.
+    With profile_file set, a hot-spot report is printed afterwards and saved there as JSON.
+    Scripts up to TRANSPILE_MAX_BYTES are transpiled to Python unless transpile is False
+    (or it fails); everything else is interpreted. pause=False skips the closing Enter prompt."""
+    try:
+        size = os.path.getsize(filename)
+    except OSError:
+        size = None
+    if stream is None:
+        stream = size is not None and size > STREAM_THRESHOLD
+    profile = Profile() if profile_file else None
+    started = time.perf_counter()
+    try:
+        transpiled = None
+        if transpile and not stream and profile is None and size is not None and size <= TRANSPILE_MAX_BYTES:
             try:
-                vars[args[0]] = float(input(f"Enter float for {args[0]}: "))
+                transpiled = load_transpiled(filename)
             except Exception:
-                vars[args[0]] = 0.0
-        elif cmd == "inputstr" and len(args) == 1:
-            vars[args[0]] = input(f"Enter string for {args[0]}: ")
-        elif cmd == "exit":
-            break
-        i += 1
-    input("Press Enter to return to DLDSPT Menu...")
+                transpiled = None
+        if transpiled is not None:
+            run_transpiled(*transpiled)
+        elif stream:
+            run_streaming(filename, profile)
+        else:
+            run_file(filename, profile)
+    finally:
+        if profile is not None:
+            profile.wall_time = time.perf_counter() - started
+            profile.print_report(filename)
+            if profile.save(filename, profile_file):
+                print(f"Profile saved to {profile_file}")
+    if pause:
+        input("Press Enter to return to DLDSPT Menu...")
 
 if __name__ == "__main__":
-    import sys
-    if len(sys.argv) > 1:
-        run_duckylang(sys.argv[1])
+    args = sys.argv[1:]
+    stream = "--stream" in args or None
+    profile = "--profile" in args
+    interpret = "--interpret" in args
+    args = [a for a in args if a not in ("--stream", "--profile", "--interpret")]
+    if len(args) > 1:
+        run_concurrently(args)
+    elif args:
+        run_duckylang(args[0], stream=stream, profile_file=args[0] + ".profile.json" if profile else None,
+                      transpile=not interpret)
     else:
-        print("Usage: python duckylang.py <script.dkl>")
+        print("Usage: python duckylang.py [--stream] [--profile] [--interpret] <script.dkl> [more.dkl ...]")
@@ -0,0 +1,34 @@
+import json
+import os
+import subprocess
+import sys
+
+DLDSPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "DLDSPT.py")
+
+
+def run_headless(cwd, *args):
+    return subprocess.run([sys.executable, DLDSPT, "run", *args], cwd=cwd, stdin=subprocess.DEVNULL,
+                          capture_output=True, text=True, timeout=60)
+
+
+def test_run_stdout_is_only_json_lines(tmp_path):
+    # A fresh working directory: no saved config, so first-run checks must not kick in
+    (tmp_path / "ok.py").write_text('print("hello from ok")\n')
+    (tmp_path / "bad.py").write_text("1 / 0\n")
+    result = run_headless(tmp_path, "-j", "2", "ok.py", "bad.py", "missing.py")
+
+    lines = result.stdout.splitlines()
+    assert lines
+    records = [json.loads(line) for line in lines]
+    assert records[-1]["event"] == "summary"
+    assert (records[-1]["total"], records[-1]["passed"], records[-1]["failed"]) == (3, 1, 2)
+    statuses = {r["path"]: r["status"] for r in records if r["event"] == "result"}
+    assert statuses == {"ok.py": "finished", "bad.py": "failed", "missing.py": "error"}
+    assert result.returncode == 1
+
+
+def test_run_exit_code_zero_when_all_pass(tmp_path):
+    (tmp_path / "ok.py").write_text("pass\n")
+    result = run_headless(tmp_path, "*.py")
+    assert [json.loads(line)["event"] for line in result.stdout.splitlines()] == ["result", "summary"]
+    assert result.returncode == 0